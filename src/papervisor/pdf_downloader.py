@@ -4,8 +4,12 @@ import json
 import logging
 import os
 import re
+import string
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import escape
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -15,6 +19,127 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 
+# Reports are written in one go; a large buffer keeps that to a single syscall.
+_REPORT_BUFFER_SIZE = 1 << 20
+# Report files are independent; write them on a few threads.
+_REPORT_WRITE_WORKERS = 4
+
+# Templates for the project-wide manual download guide, parsed once at import.
+_PROJECT_GUIDE_HEADER_TPL = string.Template(
+    """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Project Manual Download Guide - $project_id</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }
+        .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px;
+           margin-bottom: 20px; }
+
+        .summary { background-color: #e8f5e8; padding: 15px; border-radius: 5px;
+           margin-bottom: 20px; }
+
+        .paper { border: 1px solid #ddd; margin: 10px 0; padding: 15px;
+           border-radius: 5px; }
+
+        .paper.manual { background-color: #fff5f5; }
+        .paper.success { background-color: #f0f8f0; }
+        .paper.existed { background-color: #f0f0ff; }
+        .paper-id { font-weight: bold; color: #333; }
+        .query-id { font-size: 0.9em; color: #666; background-color: #f5f5f5;
+           padding: 2px 6px; border-radius: 3px; }
+
+        .title { font-size: 1.1em; font-weight: bold; color: #0066cc;
+                  margin: 5px 0; }
+        .authors { font-style: italic; margin: 5px 0; }
+        .metadata { margin: 10px 0; }
+        .metadata-item { margin: 5px 0; }
+        .status { padding: 3px 8px; border-radius: 3px; font-size: 0.9em;
+           font-weight: bold; }
+
+        .status.manual { background-color: #ffebee; color: #c62828; }
+        .status.success { background-color: #e8f5e8; color: #2e7d32; }
+        .status.existed { background-color: #e3f2fd; color: #1565c0; }
+        .instructions { background-color: #fff3cd; padding: 15px;
+           border-radius: 5px; margin-bottom: 20px;
+           border-left: 4px solid #ffc107; }
+
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>📄 Project Manual Download Guide - $project_id</h1>
+        <p>Generated: $generated</p>
+        <p><strong>Approach:</strong> Consolidated CSV with deduplicated papers</p>
+        <p><strong>Directory:</strong> pdfs/automatic/ (unified structure)</p>
+    </div>
+
+    <div class="summary">
+        <h2>📊 Download Summary</h2>
+        <ul>
+            <li><strong>Total unique papers:</strong> $total_papers</li>
+            <li><strong>✅ Successfully downloaded/existed:</strong> $successful_count</li>
+            <li><strong>❌ Require manual download:</strong> $manual_count</li>
+        </ul>
+    </div>
+
+    <div class="instructions" style="background-color: #fff3cd; padding: 15px;
+         border-radius: 5px; margin-bottom: 20px; border-left: 4px solid #ffc107;">
+        <h3>📝 Instructions for Manual Download</h3>
+        <ol>
+            <li>For each paper below marked as "Manual Required",
+                try the provided URLs in order</li>
+            <li>Look for PDF download links on the publisher's page</li>
+            <li>If you have institutional access, try accessing through your
+                library</li>
+            <li>Save the PDF with the suggested filename in:
+                <code>pdfs/automatic/</code></li>
+            <li>The "Source Queries" field shows which queries this paper
+                appeared in</li>
+        </ol>
+    </div>
+"""
+)
+
+_SUCCESS_CARD_TPL = string.Template(
+    """
+    <div class="paper $status_class">
+        <div class="paper-id">Paper ID: $paper_id <span class="query-id">
+            Query: $query_id</span></div>
+        <div class="title">$title</div>
+        <div class="authors">$authors ($year)</div>
+        <div class="metadata">
+            <span class="status $status_class">$status_icon $status_text</span>
+            <div>📁 File: $file_name</div>
+            <div>📊 Size: $size</div>
+        </div>
+    </div>
+"""
+)
+
+_MANUAL_CARD_TPL = string.Template(
+    """
+    <div class="paper manual">
+        <div class="paper-id">Paper ID: $paper_id <span class="query-id">Query: $query_id</span></div>
+        <div class="title">$title</div>
+        <div class="authors">$authors ($year)</div>
+        <div class="metadata">
+            <span class="status manual">❌ MANUAL REQUIRED</span>
+            <div class="metadata-item"><strong>📁 Suggested filename:</strong> $filename</div>
+            <div class="metadata-item"><strong>📂 Save to:</strong> pdfs/automatic/</div>
+            $doi_block
+        </div>
+    </div>
+"""
+)
+
+_DOI_BLOCK_TPL = string.Template(
+    '<div class="metadata-item"><strong>🔗 DOI:</strong> '
+    '<a href="https://doi.org/$doi" target="_blank">$doi</a></div>'
+)
+
+
 class DownloadStatus:
     """Download status constants."""
 
@@ -62,6 +187,45 @@ class PaperDownloadResult:
         }
 
 
+# ASCII punctuation and whitespace, stripped from filename parts in one pass.
+_FILENAME_DELETE = str.maketrans("", "", string.punctuation + string.whitespace)
+
+
+def _alnum_only(text: str) -> str:
+    """Keep only the alphanumeric characters of a filename part."""
+    cleaned = text.translate(_FILENAME_DELETE)
+    if not cleaned or cleaned.isalnum():
+        return cleaned
+    # Non-ASCII symbols are rare; filter them character by character
+    return "".join(c for c in cleaned if c.isalnum())
+
+
+# Statuses listed as successfully processed in the manual download guide.
+_PROCESSED_STATUSES = frozenset(
+    (DownloadStatus.SUCCESS, DownloadStatus.ALREADY_EXISTED)
+)
+
+# Per-query data for the project manual download guide: the guide's DataFrame
+# columns as positional arrays, then the successful and manual-required results.
+_QueryGuideGroup = Tuple[
+    Dict[str, Any], List[PaperDownloadResult], List[PaperDownloadResult]
+]
+
+# Columns shown in the manual download guide and their fallback values.
+_GUIDE_COLUMN_DEFAULTS = {
+    "Authors": "Unknown Authors",
+    "Year": "Unknown Year",
+    "DOI": "",
+}
+
+
+def _clean_value(value: Any, default: str = "") -> str:
+    """Return a DataFrame cell as text, using default for missing values."""
+    if value is None or pd.isna(value):
+        return default
+    return str(value)
+
+
 class PDFDownloader:
     """Handles automatic PDF downloading for research papers."""
 
@@ -143,6 +307,8 @@ class PDFDownloader:
         self.automatic_path.mkdir(parents=True, exist_ok=True)
         self.manual_path.mkdir(parents=True, exist_ok=True)
         self.reports_path.mkdir(parents=True, exist_ok=True)
+        # String form for building report file names without Path arithmetic
+        self._reports_dir_str = str(self.reports_path)
 
         # Setup logging
         self.logger = self._setup_logger()
@@ -216,6 +382,17 @@ class PDFDownloader:
         )
         print(f"🗑️  Removed {removed_count} existing report files")
 
+    @staticmethod
+    def _write_report(path: str, content: str) -> None:
+        """Write a report file as UTF-8 in a single buffered write.
+
+        Args:
+            path: Destination report file
+            content: Full report content
+        """
+        with open(path, "wb", buffering=_REPORT_BUFFER_SIZE) as f:
+            f.write(content.encode("utf-8"))
+
     def download_query_pdfs(
         self,
         query_id: str,
@@ -889,7 +1066,7 @@ class PDFDownloader:
             if author_parts:
                 last_name = author_parts[-1]
                 # Remove non-alphanumeric characters
-                last_name = "".join(c for c in last_name if c.isalnum())
+                last_name = _alnum_only(last_name)
             else:
                 last_name = "Unknown"
         else:
@@ -910,9 +1087,7 @@ class PDFDownloader:
             # Take first few words of title and clean them
             title_words = title.split()[:4]  # First 4 words
             title_part = "_".join(
-                "".join(c for c in word if c.isalnum())
-                for word in title_words
-                if len(word) > 2
+                _alnum_only(word) for word in title_words if len(word) > 2
             )[
                 :50
             ]  # Limit to 50 characters
@@ -1544,416 +1719,295 @@ INSTRUCTIONS FOR MANUAL DOWNLOAD
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Calculate totals across all queries
-        total_papers = sum(len(results) for results in all_results.values())
-        total_success = sum(
-            1
-            for results in all_results.values()
-            for r in results
-            if r.status == DownloadStatus.SUCCESS
-        )
-        total_already_existed = sum(
-            1
-            for results in all_results.values()
-            for r in results
-            if r.status == DownloadStatus.ALREADY_EXISTED
-        )
-        total_failed = sum(
-            1
-            for results in all_results.values()
-            for r in results
-            if r.status == DownloadStatus.FAILED
-        )
-        total_manual = sum(
-            1
-            for results in all_results.values()
-            for r in results
-            if r.status == DownloadStatus.MANUAL_REQUIRED
-        )
-
         self.logger.info("Generating project reports for %s", project_id)
         print("📊 Generating comprehensive project reports...")
 
-        # Generate JSON project report
-        project_report: Dict[str, Any] = {
-            "project_id": project_id,
-            "timestamp": timestamp,
-            "summary": {
-                "total_papers": total_papers,
-                "successful_downloads": total_success,
-                "already_existed": total_already_existed,
-                "failed_downloads": total_failed,
-                "manual_required": total_manual,
-                "skipped": 0,  # Deprecated, keeping for compatibility
-            },
-            "by_query": {},
-            "all_results": {},
-        }
-
-        # Add per-query details
+        # Per-query counts; the project totals and text summary reuse them
+        by_query: Dict[str, Dict[str, int]] = {}
         for query_id, results in all_results.items():
-            query_success = sum(
-                1 for r in results if r.status == DownloadStatus.SUCCESS
-            )
-            query_existed = sum(
-                1 for r in results if r.status == DownloadStatus.ALREADY_EXISTED
-            )
-            query_failed = sum(1 for r in results if r.status == DownloadStatus.FAILED)
-            query_manual = sum(
-                1 for r in results if r.status == DownloadStatus.MANUAL_REQUIRED
-            )
-
-            project_report["by_query"][query_id] = {
+            status_counts = Counter(r.status for r in results)
+            by_query[query_id] = {
                 "total_papers": len(results),
-                "successful_downloads": query_success,
-                "already_existed": query_existed,
-                "failed_downloads": query_failed,
-                "manual_required": query_manual,
+                "successful_downloads": status_counts[DownloadStatus.SUCCESS],
+                "already_existed": status_counts[DownloadStatus.ALREADY_EXISTED],
+                "failed_downloads": status_counts[DownloadStatus.FAILED],
+                "manual_required": status_counts[DownloadStatus.MANUAL_REQUIRED],
                 "skipped": 0,
             }
 
-            project_report["all_results"][query_id] = [r.to_dict() for r in results]
+        # Calculate totals across all queries
+        summary = {
+            key: sum(stats[key] for stats in by_query.values())
+            for key in (
+                "total_papers",
+                "successful_downloads",
+                "already_existed",
+                "failed_downloads",
+                "manual_required",
+            )
+        }
+        summary["skipped"] = 0  # Deprecated, keeping for compatibility
 
-        # Write project JSON report
-        json_file = (
-            self.reports_path / f"project_download_status_{project_id}_{timestamp}.json"
-        )
-        with open(json_file, "w") as f:
-            json.dump(project_report, f, indent=2)
+        # Generate JSON project report
+        project_report: Dict[str, Any] = {
+            "project_id": project_id,
+            "timestamp": timestamp,
+            "summary": summary,
+            "by_query": by_query,
+            "all_results": {
+                query_id: [r.to_dict() for r in results]
+                for query_id, results in all_results.items()
+            },
+        }
 
-        # Write latest project status
-        latest_file = (
-            self.reports_path / f"project_download_status_{project_id}_latest.json"
+        # Serialize the JSON reports once; both files share the payload
+        reports_dir = self._reports_dir_str
+        json_name = f"project_download_status_{project_id}_{timestamp}.json"
+        latest_name = f"project_download_status_{project_id}_latest.json"
+        json_file = os.path.join(reports_dir, json_name)
+        latest_file = os.path.join(reports_dir, latest_name)
+        report_json = json.dumps(project_report, indent=2)
+        payloads: List[Tuple[str, str]] = [
+            (json_file, report_json),
+            (latest_file, report_json),
+        ]
+
+        # Build comprehensive manual download guide for all queries
+        guides = self._build_project_manual_download_guide(
+            project_id, all_results, papers_data, timestamp
         )
-        with open(latest_file, "w") as f:
-            json.dump(project_report, f, indent=2)
+        payloads.extend(guides)
 
         # Generate project text summary
-        summary_file = (
-            self.reports_path / f"project_download_summary_{project_id}_{timestamp}.txt"
-        )
-        with open(summary_file, "w") as f:
-            f.write(f"PROJECT PDF DOWNLOAD SUMMARY - {project_id}\n")
-            f.write(f"Generated: {timestamp}\n")
-            f.write("=" * 70 + "\n\n")
-
-            f.write("OVERALL STATISTICS\n")
-            f.write(f"Total papers: {total_papers}\n")
-            f.write(f"Successfully downloaded: {total_success}\n")
-            f.write(f"Already existed: {total_already_existed}\n")
-            f.write(f"Failed downloads: {total_failed}\n")
-            f.write(f"Manual downloads required: {total_manual}\n\n")
-
-            f.write("PER QUERY BREAKDOWN\n")
-            f.write("-" * 40 + "\n")
-            for query_id, results in all_results.items():
-                query_success = sum(
-                    1 for r in results if r.status == DownloadStatus.SUCCESS
-                )
-                query_existed = sum(
-                    1 for r in results if r.status == DownloadStatus.ALREADY_EXISTED
-                )
-                query_failed = sum(
-                    1 for r in results if r.status == DownloadStatus.FAILED
-                )
-                query_manual = sum(
-                    1 for r in results if r.status == DownloadStatus.MANUAL_REQUIRED
+        summary_name = f"project_download_summary_{project_id}_{timestamp}.txt"
+        summary_file = os.path.join(reports_dir, summary_name)
+        summary_lines = [
+            f"PROJECT PDF DOWNLOAD SUMMARY - {project_id}\n",
+            f"Generated: {timestamp}\n",
+            "=" * 70 + "\n\n",
+            "OVERALL STATISTICS\n",
+            f"Total papers: {summary['total_papers']}\n",
+            f"Successfully downloaded: {summary['successful_downloads']}\n",
+            f"Already existed: {summary['already_existed']}\n",
+            f"Failed downloads: {summary['failed_downloads']}\n",
+            f"Manual downloads required: {summary['manual_required']}\n\n",
+            "PER QUERY BREAKDOWN\n",
+            "-" * 40 + "\n",
+        ]
+        for query_id, stats in by_query.items():
+            summary_lines.extend(
+                (
+                    f"\n{query_id} ({stats['total_papers']} papers):\n",
+                    f"  Downloaded: {stats['successful_downloads']}\n",
+                    f"  Already existed: {stats['already_existed']}\n",
+                    f"  Failed: {stats['failed_downloads']}\n",
+                    f"  Manual required: {stats['manual_required']}\n",
                 )
+            )
+        payloads.append((summary_file, "".join(summary_lines)))
 
-                f.write(f"\n{query_id} ({len(results)} papers):\n")
-                f.write(f"  Downloaded: {query_success}\n")
-                f.write(f"  Already existed: {query_existed}\n")
-                f.write(f"  Failed: {query_failed}\n")
-                f.write(f"  Manual required: {query_manual}\n")
-
-        # Generate comprehensive manual download guide for all queries
-        self._generate_project_manual_download_guide(
-            project_id, all_results, papers_data, timestamp
-        )
+        # The report files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=_REPORT_WRITE_WORKERS) as executor:
+            for write in [
+                executor.submit(self._write_report, path, content)
+                for path, content in payloads
+            ]:
+                write.result()
 
+        guide_names = [os.path.basename(path) for path, _ in guides]
         self.logger.info(
-            f"Project reports generated: {json_file.name}, {summary_file.name}"
+            f"Project manual download guides generated: {', '.join(guide_names)}"
         )
+        for guide_name in guide_names:
+            if guide_name.endswith(".html"):
+                print(f"📋 Project manual download guide generated: {guide_name}")
+
+        self.logger.info(f"Project reports generated: {json_name}, {summary_name}")
         print("📋 Project reports generated successfully!")
 
-    def _generate_project_manual_download_guide(
+    def _build_project_manual_download_guide(
         self,
         project_id: str,
         all_results: Dict[str, List[PaperDownloadResult]],
         papers_data: Dict[str, pd.DataFrame],
         timestamp: str,
-    ) -> None:
-        """Generate a comprehensive manual download guide for the entire project."""
-        # Collect all successful downloads and manual required papers across all queries
-        all_successful = []
-        all_manual_required = []
+    ) -> List[Tuple[str, str]]:
+        """Build the HTML and text manual download guides for the entire project.
 
+        Returns:
+            List of (report path, content) pairs for the caller to write
+        """
+        # Group results by query once, resolving the guide columns of each
+        # query's DataFrame to plain arrays indexed by paper position
+        groups: Dict[str, _QueryGuideGroup] = {}
         for query_id, results in all_results.items():
             if query_id not in papers_data:
                 continue
 
             papers_df = papers_data[query_id]
-            successful = [
-                (r, papers_df, query_id)
-                for r in results
-                if r.status in [DownloadStatus.SUCCESS, DownloadStatus.ALREADY_EXISTED]
-            ]
-            manual = [
-                (r, papers_df, query_id)
-                for r in results
-                if r.status == DownloadStatus.MANUAL_REQUIRED
-            ]
-
-            all_successful.extend(successful)
-            all_manual_required.extend(manual)
-
-        # Generate HTML guide
-        html_file = (
-            self.reports_path
-            / f"project_manual_download_guide_{project_id}_{timestamp}.html"
-        )
-        with open(html_file, "w", encoding="utf-8") as f:
-            f.write(
-                self._generate_project_manual_download_html(
-                    project_id, all_successful, all_manual_required
-                )
-            )
-
-        # Generate text guide
-        text_file = (
-            self.reports_path
-            / f"project_manual_download_guide_{project_id}_{timestamp}.txt"
-        )
-        with open(text_file, "w", encoding="utf-8") as f:
-            f.write(
-                self._generate_project_manual_download_text(
-                    project_id, all_successful, all_manual_required
+            columns = {
+                column: (
+                    papers_df[column].to_numpy()
+                    if column in papers_df.columns
+                    else [default] * len(papers_df)
                 )
-            )
-
-        self.logger.info(
-            f"Project manual download guides generated: {html_file.name}, "
-            f"{text_file.name}"
+                for column, default in _GUIDE_COLUMN_DEFAULTS.items()
+            }
+            successful: List[PaperDownloadResult] = []
+            manual: List[PaperDownloadResult] = []
+            for r in results:
+                if r.status in _PROCESSED_STATUSES:
+                    successful.append(r)
+                elif r.status == DownloadStatus.MANUAL_REQUIRED:
+                    manual.append(r)
+            groups[query_id] = (columns, successful, manual)
+
+        guide_stem = os.path.join(
+            self._reports_dir_str,
+            f"project_manual_download_guide_{project_id}_{timestamp}",
         )
-        print(f"📋 Project manual download guide generated: {html_file.name}")
+        html_file = f"{guide_stem}.html"
+        text_file = f"{guide_stem}.txt"
+        return [
+            (
+                html_file,
+                self._generate_project_manual_download_html(project_id, groups),
+            ),
+            (
+                text_file,
+                self._generate_project_manual_download_text(project_id, groups),
+            ),
+        ]
 
     def _generate_project_manual_download_html(
-        self,
-        project_id: str,
-        all_successful: List[Tuple[PaperDownloadResult, pd.DataFrame, str]],
-        all_manual_required: List[Tuple[PaperDownloadResult, pd.DataFrame, str]],
+        self, project_id: str, groups: Dict[str, _QueryGuideGroup]
     ) -> str:
         """Generate HTML content for project-wide manual download guide."""
-        total_papers = len(all_successful) + len(all_manual_required)
-
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Project Manual Download Guide - {project_id}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }}
-        .header {{ background-color: #f4f4f4; padding: 20px; border-radius: 5px;
-           margin-bottom: 20px; }}
-
-        .summary {{ background-color: #e8f5e8; padding: 15px; border-radius: 5px;
-           margin-bottom: 20px; }}
-
-        .paper {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px;
-           border-radius: 5px; }}
-
-        .paper.manual {{ background-color: #fff5f5; }}
-        .paper.success {{ background-color: #f0f8f0; }}
-        .paper.existed {{ background-color: #f0f0ff; }}
-        .paper-id {{ font-weight: bold; color: #333; }}
-        .query-id {{ font-size: 0.9em; color: #666; background-color: #f5f5f5;
-           padding: 2px 6px; border-radius: 3px; }}
-
-        .title {{ font-size: 1.1em; font-weight: bold; color: #0066cc;
-                  margin: 5px 0; }}
-        .authors {{ font-style: italic; margin: 5px 0; }}
-        .metadata {{ margin: 10px 0; }}
-        .metadata-item {{ margin: 5px 0; }}
-        .status {{ padding: 3px 8px; border-radius: 3px; font-size: 0.9em;
-           font-weight: bold; }}
-
-        .status.manual {{ background-color: #ffebee; color: #c62828; }}
-        .status.success {{ background-color: #e8f5e8; color: #2e7d32; }}
-        .status.existed {{ background-color: #e3f2fd; color: #1565c0; }}
-        .instructions {{ background-color: #fff3cd; padding: 15px;
-           border-radius: 5px; margin-bottom: 20px;
-           border-left: 4px solid #ffc107; }}
-
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>📄 Project Manual Download Guide - {project_id}</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p><strong>Approach:</strong> Consolidated CSV with deduplicated papers</p>
-        <p><strong>Directory:</strong> pdfs/automatic/ (unified structure)</p>
-    </div>
-
-    <div class="summary">
-        <h2>📊 Download Summary</h2>
-        <ul>
-            <li><strong>Total unique papers:</strong> {total_papers}</li>
-            <li><strong>✅ Successfully downloaded/existed:</strong> {
-                len(all_successful)
-            }</li>
-            <li><strong>❌ Require manual download:</strong> {
-                len(all_manual_required)
-            }</li>
-        </ul>
-    </div>
-
-    <div class="instructions" style="background-color: #fff3cd; padding: 15px;
-         border-radius: 5px; margin-bottom: 20px; border-left: 4px solid #ffc107;">
-        <h3>📝 Instructions for Manual Download</h3>
-        <ol>
-            <li>For each paper below marked as "Manual Required",
-                try the provided URLs in order</li>
-            <li>Look for PDF download links on the publisher's page</li>
-            <li>If you have institutional access, try accessing through your
-                library</li>
-            <li>Save the PDF with the suggested filename in:
-                <code>pdfs/automatic/</code></li>
-            <li>The "Source Queries" field shows which queries this paper
-                appeared in</li>
-        </ol>
-    </div>
-"""
+        successful_count = sum(len(succ) for _, succ, _ in groups.values())
+        manual_count = sum(len(manual) for _, _, manual in groups.values())
+        total_papers = successful_count + manual_count
+
+        parts: List[str] = [
+            _PROJECT_GUIDE_HEADER_TPL.substitute(
+                project_id=escape(project_id),
+                generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                total_papers=total_papers,
+                successful_count=successful_count,
+                manual_count=manual_count,
+            )
+        ]
 
         # Add successfully processed papers section
-        if all_successful:
-            html += f"""
-    <h2>✅ Successfully Processed Papers ({len(all_successful)})</h2>
-"""
-            for result, papers_df, query_id in all_successful:
-                paper_data = papers_df.iloc[int(result.paper_id)]
-                authors = paper_data.get("Authors", "Unknown Authors")
-                year = paper_data.get("Year", "Unknown Year")
-
-                status_class = (
-                    "success" if result.status == DownloadStatus.SUCCESS else "existed"
-                )
-                status_icon = "✅" if result.status == DownloadStatus.SUCCESS else "📁"
-                status_text = (
-                    "DOWNLOADED"
-                    if result.status == DownloadStatus.SUCCESS
-                    else "ALREADY EXISTED"
-                )
-
-                html += f"""
-    <div class="paper {status_class}">
-        <div class="paper-id">Paper ID: {result.paper_id} <span class="query-id">
-            Query: {query_id}</span></div>
-        <div class="title">{result.title}</div>
-        <div class="authors">{authors} ({year})</div>
-        <div class="metadata">
-            <span class="status {status_class}">{status_icon} {status_text}</span>
-            <div>📁 File: {result.file_path.name if result.file_path else 'N/A'}</div>"""
-
-        size_str = f"{result.file_size / 1024:.1f} KB" if result.file_size else "N/A"
-        html += f"""            <div>📊 Size: {size_str}</div>
-        </div>
-    </div>
+        if successful_count:
+            parts.append(
+                f"""
+    <h2>✅ Successfully Processed Papers ({successful_count})</h2>
 """
+            )
+            for query_id, (columns, successful, _) in groups.items():
+                for result in successful:
+                    row = int(result.paper_id)
+                    authors = columns["Authors"][row]
+                    year = columns["Year"][row]
+
+                    is_success = result.status == DownloadStatus.SUCCESS
+                    parts.append(
+                        _SUCCESS_CARD_TPL.substitute(
+                            status_class="success" if is_success else "existed",
+                            status_icon="✅" if is_success else "📁",
+                            status_text=(
+                                "DOWNLOADED" if is_success else "ALREADY EXISTED"
+                            ),
+                            paper_id=escape(result.paper_id),
+                            query_id=escape(query_id),
+                            title=escape(_clean_value(result.title)),
+                            authors=escape(_clean_value(authors, "Unknown Authors")),
+                            year=escape(_clean_value(year, "Unknown Year")),
+                            file_name=escape(
+                                result.file_path.name if result.file_path else "N/A"
+                            ),
+                            size=(
+                                f"{result.file_size / 1024:.1f} KB"
+                                if result.file_size
+                                else "N/A"
+                            ),
+                        )
+                    )
 
         # Add manual download section
-        if all_manual_required:
-            html += f"""
-    <h2>❌ Papers Requiring Manual Download ({len(all_manual_required)})</h2>
+        if manual_count:
+            parts.append(
+                f"""
+    <h2>❌ Papers Requiring Manual Download ({manual_count})</h2>
 """
-            for result, papers_df, query_id in all_manual_required:
-                paper_data = papers_df.iloc[int(result.paper_id)]
-
-                authors = paper_data.get("Authors", "Unknown Authors")
-                year = paper_data.get("Year", "Unknown Year")
-                doi = paper_data.get("DOI", "")
-                article_url = paper_data.get("ArticleURL", "")
-                fulltext_url = paper_data.get("FullTextURL", "")
-                source = paper_data.get("Source", "")
-                publisher = paper_data.get("Publisher", "")
-                abstract = paper_data.get("Abstract", "")
-                # Clean NaN values
-                if str(doi).lower() == "nan":
-                    doi = ""
-                if str(article_url).lower() == "nan":
-                    article_url = ""
-                if str(fulltext_url).lower() == "nan":
-                    fulltext_url = ""
-                if str(source).lower() == "nan":
-                    source = "Unknown"
-                if str(publisher).lower() == "nan":
-                    publisher = "Unknown"
-                if str(abstract).lower() == "nan":
-                    abstract = ""
+            )
+            for query_id, (columns, _, manual) in groups.items():
+                for result in manual:
+                    row = int(result.paper_id)
 
-                # Generate suggested filename
-                filename = self._generate_filename(
-                    result.paper_id, authors, year, result.title
-                )
+                    authors = columns["Authors"][row]
+                    year = columns["Year"][row]
+                    doi = _clean_value(columns["DOI"][row]).strip()
 
-                # Build citation
-                citation = f"{authors} ({year}). {result.title}."
-                if source and source != "Unknown":
-                    citation += f" {source}."
-                if doi:
-                    citation += f" DOI: {doi}"
+                    # Generate suggested filename
+                    filename = self._generate_filename(
+                        result.paper_id, authors, year, result.title
+                    )
 
-                html += f"""
-    <div class="paper manual">
-        <div class="paper-id">Paper ID: {result.paper_id} <span class="query-id">Query: {query_id}</span></div>
-        <div class="title">{result.title}</div>
-        <div class="authors">{authors} ({year})</div>
-        <div class="metadata">
-            <span class="status manual">❌ MANUAL REQUIRED</span>
-            <div class="metadata-item"><strong>📁 Suggested filename:</strong> {filename}</div>
-            <div class="metadata-item"><strong>📂 Save to:</strong> pdfs/automatic/</div>
-            {(f'<div class="metadata-item"><strong>🔗 DOI:</strong> '
-                    f'<a href="https://doi.org/{doi}" target="_blank">{doi}</a>'
-                    f'</div>')
-                    if doi and str(doi).lower() != 'nan' and doi.strip() else ''}
-        </div>
-    </div>
-"""
+                    doi_block = (
+                        _DOI_BLOCK_TPL.substitute(doi=escape(doi)) if doi else ""
+                    )
+                    parts.append(
+                        _MANUAL_CARD_TPL.substitute(
+                            paper_id=escape(result.paper_id),
+                            query_id=escape(query_id),
+                            title=escape(_clean_value(result.title)),
+                            authors=escape(_clean_value(authors, "Unknown Authors")),
+                            year=escape(_clean_value(year, "Unknown Year")),
+                            filename=escape(filename),
+                            doi_block=doi_block,
+                        )
+                    )
 
-        html += """
+        parts.append(
+            """
 </body>
 </html>"""
+        )
 
-        return html
+        return "".join(parts)
 
     def _generate_project_manual_download_text(
-        self,
-        project_id: str,
-        all_successful: List[Tuple[PaperDownloadResult, pd.DataFrame, str]],
-        all_manual_required: List[Tuple[PaperDownloadResult, pd.DataFrame, str]],
+        self, project_id: str, groups: Dict[str, _QueryGuideGroup]
     ) -> str:
         """Generate text content for project-level manual download guide."""
-        text = f"""PROJECT MANUAL DOWNLOAD GUIDE - {project_id}
+        successful_count = sum(len(succ) for _, succ, _ in groups.values())
+        all_manual_required = [
+            result for _, _, manual in groups.values() for result in manual
+        ]
+        parts: List[str] = [
+            f"""PROJECT MANUAL DOWNLOAD GUIDE - {project_id}
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 {'=' * 60}
 
 SUMMARY:
-- Successfully Downloaded: {len(all_successful)}
+- Successfully Downloaded: {successful_count}
 - Requiring Manual Download: {len(all_manual_required)}
 
 """
+        ]
 
         if all_manual_required:
-            text += (
+            parts.append(
                 f"\nPAPERS REQUIRING MANUAL DOWNLOAD ({len(all_manual_required)}):\n"
             )
-            text += "=" * 50 + "\n\n"
+            parts.append("=" * 50 + "\n\n")
 
-            for i, (result, _, _) in enumerate(all_manual_required, 1):
-                text += f"{i}. {result.title}\n"
-                text += f"   Paper ID: {result.paper_id}\n"
+            for i, result in enumerate(all_manual_required, 1):
+                parts.append(f"{i}. {result.title}\n")
+                parts.append(f"   Paper ID: {result.paper_id}\n")
                 if result.error_message:
-                    text += f"   Issue: {result.error_message}\n"
-                text += "\n"
+                    parts.append(f"   Issue: {result.error_message}\n")
+                parts.append("\n")
 
-        return text
+        return "".join(parts)
@@ -1,15 +1,16 @@
 """Literature review project management for papervisor."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import yaml
+from typing import Any, Dict, List, Optional, Tuple
 
-from .search_query import SearchQuery
+from .search_query import SEARCH_QUERY_FIELDS, SearchQuery
+from .yaml_io import dump_yaml, load_yaml
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiteratureReviewProject:
     """Represents a literature review project with multiple search queries."""
 
@@ -32,6 +33,28 @@ class LiteratureReviewProject:
         return datetime.strptime(self.created_date, "%Y-%m-%d")
 
 
+# Constructor arguments accepted by LiteratureReviewProject.
+PROJECT_FIELDS = frozenset(f.name for f in fields(LiteratureReviewProject))
+
+
+@lru_cache(maxsize=8)
+def _parse_projects_index(
+    path_str: str, _mtime_ns: int, _size: int
+) -> Tuple[LiteratureReviewProject, ...]:
+    """Parse a projects index file; cached on its path, mtime and size.
+
+    The cache is shared by all managers in the process, so the index is parsed
+    once per version however many managers read it.
+    """
+    data = load_yaml(Path(path_str))
+    return tuple(
+        LiteratureReviewProject(
+            **{k: v for k, v in project_data.items() if k in PROJECT_FIELDS}
+        )
+        for project_data in data.get("projects", [])
+    )
+
+
 class ProjectManager:
     """Manages multiple literature review projects."""
 
@@ -40,6 +63,10 @@ class ProjectManager:
         self.data_dir = Path(data_dir)
         self.projects_index_file = self.data_dir / "projects_index.yaml"
         self._projects: List[LiteratureReviewProject] = []
+        self._by_id: Dict[str, LiteratureReviewProject] = {}
+        self._by_status: Dict[str, List[LiteratureReviewProject]] = {}
+        self._by_researcher: Dict[str, List[LiteratureReviewProject]] = {}
+        self._index_stat: Optional[Tuple[int, int]] = None
         self._load_projects()
 
     def _load_projects(self) -> None:
@@ -47,44 +74,58 @@ class ProjectManager:
         if not self.projects_index_file.exists():
             # Create empty index if it doesn't exist
             self._save_empty_index()
-            return
 
-        with open(self.projects_index_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        stat = self.projects_index_file.stat()
+        self._index_stat = (stat.st_mtime_ns, stat.st_size)
+        self._projects = list(
+            _parse_projects_index(str(self.projects_index_file), *self._index_stat)
+        )
+        self._by_id = {p.project_id: p for p in self._projects}
 
-        self._projects = [
-            LiteratureReviewProject(**project_data)
-            for project_data in data.get("projects", [])
-        ]
+        # Case-insensitive lookup tables, lower-cased once per load
+        self._by_status = {}
+        self._by_researcher = {}
+        for project in self._projects:
+            status_key = project.status.lower()
+            researcher_key = project.lead_researcher.lower()
+            self._by_status.setdefault(status_key, []).append(project)
+            self._by_researcher.setdefault(researcher_key, []).append(project)
+
+    def _refresh_projects(self) -> None:
+        """Reload the lookup tables if the index file changed since the last load."""
+        try:
+            stat = self.projects_index_file.stat()
+        except FileNotFoundError:
+            return
+        if (stat.st_mtime_ns, stat.st_size) != self._index_stat:
+            self._load_projects()
 
     def _save_empty_index(self) -> None:
         """Create an empty projects index file."""
         data: Dict[str, List[Any]] = {"projects": []}
-        with open(self.projects_index_file, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
+        dump_yaml(data, self.projects_index_file)
 
     def get_all_projects(self) -> List[LiteratureReviewProject]:
         """Get all literature review projects."""
+        self._refresh_projects()
         return self._projects.copy()
 
     def get_project_by_id(self, project_id: str) -> Optional[LiteratureReviewProject]:
         """Get a specific project by ID."""
-        for project in self._projects:
-            if project.project_id == project_id:
-                return project
-        return None
+        self._refresh_projects()
+        return self._by_id.get(project_id)
 
     def get_projects_by_status(self, status: str) -> List[LiteratureReviewProject]:
         """Get all projects with a specific status."""
-        return [p for p in self._projects if p.status.lower() == status.lower()]
+        self._refresh_projects()
+        return list(self._by_status.get(status.lower(), []))
 
     def get_projects_by_researcher(
         self, researcher: str
     ) -> List[LiteratureReviewProject]:
         """Get all projects by a specific researcher."""
-        return [
-            p for p in self._projects if p.lead_researcher.lower() == researcher.lower()
-        ]
+        self._refresh_projects()
+        return list(self._by_researcher.get(researcher.lower(), []))
 
     def load_project_queries(self, project_id: str) -> List[SearchQuery]:
         """Load search queries for a specific project."""
@@ -96,8 +137,7 @@ class ProjectManager:
         if not queries_file.exists():
             raise FileNotFoundError(f"Search queries file not found: {queries_file}")
 
-        with open(queries_file, "r", encoding="utf-8") as f:
-            data: Dict[str, Any] = yaml.safe_load(f)
+        data: Dict[str, Any] = load_yaml(queries_file)
 
         queries = []
         for query_data in data.get("search_queries", []):
@@ -117,7 +157,10 @@ class ProjectManager:
                     if field not in query_data:
                         query_data[field] = default_value
 
-                queries.append(SearchQuery(**query_data))
+                known = {
+                    k: v for k, v in query_data.items() if k in SEARCH_QUERY_FIELDS
+                }
+                queries.append(SearchQuery(**known))
             except Exception as e:
                 print(f"Error loading query {query_data.get('id', 'unknown')}: {e}")
                 # Skip this query and continue with others
@@ -1,12 +1,13 @@
 """Search query management for papervisor."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Dict, List, Optional
-import yaml
 
+from .yaml_io import load_yaml
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SearchQuery:
     """Represents a search query executed in Publish or Perish."""
 
@@ -23,6 +24,10 @@ class SearchQuery:
     project_id: Optional[str] = None  # Added for project context
 
 
+# Constructor arguments accepted by SearchQuery; unknown YAML keys are dropped.
+SEARCH_QUERY_FIELDS = frozenset(f.name for f in fields(SearchQuery))
+
+
 class SearchQueryManager:
     """Manages search queries for literature reviews."""
 
@@ -39,9 +44,11 @@ class SearchQueryManager:
                 f"Search queries file not found: {self.queries_file}"
             )
 
-        with open(self.queries_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(self.queries_file)
 
         self._queries = [
-            SearchQuery(**query_data) for query_data in data.get("search_queries", [])
+            SearchQuery(
+                **{k: v for k, v in query_data.items() if k in SEARCH_QUERY_FIELDS}
+            )
+            for query_data in data.get("search_queries", [])
         ]
@@ -1,13 +1,41 @@
 """Web server for Papervisor PDF download management."""
 
+import copy
+import csv
+import datetime
+import difflib
+import hashlib
+import importlib.util
 import json
+import logging
+import multiprocessing
 import os
 import re
 import threading
 import time
-from dataclasses import dataclass, asdict
+import warnings
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 from flask import (
@@ -16,18 +44,43 @@ from flask import (
     request,
     jsonify,
     redirect,
+    session,
     url_for,
     flash,
+    get_flashed_messages,
     send_from_directory,
+    stream_template,
     Response as FlaskResponse,
     make_response,  # <-- add this import
 )
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.security import safe_join
 from werkzeug.wrappers import Response as WerkzeugResponse
 
+try:
+    import orjson
+except ImportError:  # orjson not available, use the stdlib json module
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pypdfium2 not available, read PDFs with PyPDF2
+    pdfium = None
+
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import Indel
+except ImportError:  # rapidfuzz not available, compare papers with difflib only
+    rapidfuzz_process = None  # type: ignore[assignment, unused-ignore]
+    Indel = None  # type: ignore[assignment, unused-ignore]
+
 from .core import Papervisor
 from .pdf_downloader import PDFDownloader, DownloadStatus, PaperDownloadResult
 import openai
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class DownloadProgress:
@@ -44,513 +97,2323 @@ class DownloadProgress:
     start_time: float = 0.0
 
 
-class PapervisorWebServer:
-    """Web server for managing PDF downloads and viewing status."""
+@dataclass
+class _DownloadJob:
+    """A background download run and the condition its progress is published on.
+
+    Only the worker thread publishes progress. Each update stores a new
+    DownloadProgress snapshot, so readers never see a half-updated one, and
+    bumps ``version`` so every listener waiting on ``changed`` wakes up.
+    """
+
+    progress: DownloadProgress
+    version: int = 0
+    changed: threading.Condition = field(default_factory=threading.Condition)
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    # JSON body of a progress snapshot, reused by polls until the next publish
+    serialized: Optional[Tuple[DownloadProgress, str]] = None
+
+    def publish(self, **changes: Any) -> None:
+        """Store a new progress snapshot and wake up all listeners."""
+        with self.changed:
+            self.progress = replace(self.progress, **changes)
+            self.version += 1
+            self.changed.notify_all()
+
+
+# Download jobs by project ID, shared by all server instances
+_download_jobs: Dict[str, _DownloadJob] = {}
+_download_jobs_lock = threading.Lock()
+
+
+def _get_download_job(project_id: str) -> Optional[_DownloadJob]:
+    """Get the current or last download job of a project."""
+    with _download_jobs_lock:
+        return _download_jobs.get(project_id)
+
+
+# Seconds browsers may reuse a served PDF before revalidating it
+_PDF_MAX_AGE = 3600
+
+# Uploaded PDFs are copied to disk in 1 MiB chunks; requests larger than
+# PAPERVISOR_MAX_UPLOAD_MB are refused
+_UPLOAD_BUFFER_SIZE = 1 << 20
+_DEFAULT_MAX_UPLOAD_MB = 100
+
+
+def _max_upload_size() -> int:
+    """Read the upload size limit in bytes from PAPERVISOR_MAX_UPLOAD_MB.
+
+    Invalid values fall back to the default with a warning, so a bad setting
+    does not keep the server from starting.
+    """
+    value = os.environ.get("PAPERVISOR_MAX_UPLOAD_MB")
+    if value is None:
+        return _DEFAULT_MAX_UPLOAD_MB << 20
+    try:
+        max_upload_mb = int(value)
+    except ValueError:
+        max_upload_mb = 0
+    if max_upload_mb <= 0:
+        warnings.warn(
+            f"Invalid PAPERVISOR_MAX_UPLOAD_MB={value!r}; "
+            f"using {_DEFAULT_MAX_UPLOAD_MB} MB.",
+            UserWarning,
+        )
+        max_upload_mb = _DEFAULT_MAX_UPLOAD_MB
+    return max_upload_mb << 20
 
-    # Class variable to track download progress across instances
-    _download_progress: Dict[str, DownloadProgress] = {}
-    _download_locks: Dict[str, threading.Lock] = {}
 
-    def __init__(self, project_id: Optional[str] = None, data_dir: str = "data"):
-        """Initialize the web server.
+# Text extraction jobs by project ID. Each project runs at most one job; the
+# shared pool bounds how many projects extract at the same time
+_EXTRACTION_WORKERS = os.cpu_count() or 1
+_extraction_jobs: Dict[str, Future] = {}
+_extraction_jobs_lock = threading.Lock()
+_extraction_pool: Optional[ThreadPoolExecutor] = None
 
-        Args:
-            project_id: Literature review project ID (None for multi-project mode)
-            data_dir: Data directory path
-        """
-        self.project_id = project_id
-        self.data_dir = Path(data_dir)
 
-        # Initialize Papervisor
-        self.papervisor = Papervisor(data_dir)
+def _submit_extraction(project_id: str, fn: Callable[..., None], *args: Any) -> bool:
+    """Run a project's text extraction on the shared pool.
 
-        # If project_id is provided, validate it exists
-        self.project = None
-        if project_id:
-            self.project = self.papervisor.get_project(project_id)
-            if not self.project:
-                raise ValueError(f"Project '{project_id}' not found")
+    Returns:
+        False if an extraction of the project is still queued or running
+    """
+    global _extraction_pool
+    with _extraction_jobs_lock:
+        job = _extraction_jobs.get(project_id)
+        if job is not None and not job.done():
+            return False
+        if _extraction_pool is None:
+            _extraction_pool = ThreadPoolExecutor(
+                max_workers=_EXTRACTION_WORKERS, thread_name_prefix="extraction"
+            )
+        _extraction_jobs[project_id] = _extraction_pool.submit(fn, *args)
+        return True
 
-        # Initialize Flask app
-        template_dir = Path(__file__).parent / "templates"
-        self.app = Flask(__name__, template_folder=str(template_dir))
-        # Use environment variable for secret key, fallback to warning
-        self.app.secret_key = os.environ.get(
-            "PAPERVISOR_SECRET_KEY",
-            "papervisor_secret_key_change_in_production",  # nosec B105
-        )
-        if (
-            self.app.secret_key
-            == "papervisor_secret_key_change_in_production"  # nosec B105
-        ):
-            import warnings
 
-            warnings.warn(
-                "WARNING: Using default secret key! Set PAPERVISOR_SECRET_KEY in production.",
-                UserWarning,
+# Worker processes extracting PDF text for all projects. PyPDF2 is pure Python
+# and holds the GIL, so the work only scales across processes. Workers are
+# spawned rather than forked, as the server process runs many threads
+_EXTRACTION_PROCESSES = os.cpu_count() or 1
+_extraction_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Papers whose extraction status is written to the status file at once
+_EXTRACTION_STATUS_BATCH = 16
+
+
+def _get_extraction_process_pool() -> ProcessPoolExecutor:
+    """Get the shared PDF extraction process pool, starting it if needed."""
+    global _extraction_process_pool
+    with _extraction_jobs_lock:
+        if _extraction_process_pool is None:
+            _extraction_process_pool = ProcessPoolExecutor(
+                max_workers=_EXTRACTION_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
             )
+        return _extraction_process_pool
 
-        # Initialize progress tracking for downloads
-        self.progress: Dict[str, DownloadProgress] = {}
-        self._download_locks: Dict[str, threading.Lock] = {}
 
-        # Setup routes
-        self._setup_routes()
+def _discard_extraction_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so the next extraction starts a new one."""
+    global _extraction_process_pool
+    with _extraction_jobs_lock:
+        if _extraction_process_pool is pool:
+            _extraction_process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
 
-    @property
-    def project_path(self) -> Path:
-        """Get project path as Path object."""
-        if self.project is None:
-            raise ValueError("Project is not initialized")
-        return self.data_dir / self.project.project_path
 
-    def _setup_routes(self) -> None:
-        """Setup Flask routes."""
+# PDFium is not thread-safe; request threads extracting single papers must not
+# call into it at the same time. Worker processes each have their own copy.
+_pdfium_lock = threading.Lock()
 
-        @self.app.route("/")
-        def index() -> WerkzeugResponse:
-            """Main landing page - show projects list or redirect to single project."""
-            if self.project_id:
-                # Single project mode - redirect to review page
-                return redirect(url_for("review_papers", project_id=self.project_id))
-            else:
-                # Multi-project mode - show landing page
-                return redirect(url_for("landing_page"))
 
-        @self.app.route("/projects")
-        def landing_page() -> Union[str, WerkzeugResponse]:
-            """Landing page showing all literature review projects."""
+def _pdfium_page_texts(pdf_path: Path) -> List[str]:
+    """Extract the text of each page of a PDF with PDFium.
+
+    PDFium ends lines with CRLF and marks soft hyphens at line ends with
+    U+FFFE; these become newlines and hyphens, as PyPDF2 returns them. Pages
+    whose text cannot be extracted are reported and left empty. Every PDFium
+    object is closed while ``_pdfium_lock`` is held.
+    """
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            page_texts = []
+            for page_num in range(len(pdf)):
+                page_text = ""
+                try:
+                    page = pdf[page_num]
+                    try:
+                        textpage = page.get_textpage()
+                        try:
+                            page_text = (
+                                textpage.get_text_range()
+                                .replace("\r\n", "\n")
+                                .replace("\ufffe", "-")
+                            )
+                        finally:
+                            textpage.close()
+                    finally:
+                        page.close()
+                except Exception as e:
+                    print(
+                        f"Error extracting text from page {page_num + 1} "
+                        f"of {pdf_path}: {e}"
+                    )
+                page_texts.append(page_text)
+            return page_texts
+        finally:
+            pdf.close()
+
+
+def _pypdf2_page_texts(pdf_path: Path) -> List[str]:
+    """Extract the text of each page of a PDF with PyPDF2.
+
+    Pages whose text cannot be extracted are reported and left empty.
+    """
+    import PyPDF2
+
+    with open(pdf_path, "rb") as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        page_texts = []
+        for page_num, page in enumerate(pdf_reader.pages):
+            page_text = ""
             try:
-                # Get all projects
-                projects = self.papervisor.list_projects()
+                page_text = page.extract_text() or ""
+            except Exception as e:
+                print(
+                    f"Error extracting text from page {page_num + 1} of {pdf_path}: {e}"
+                )
+            page_texts.append(page_text)
+        return page_texts
 
-                # Prepare project data with statistics
-                project_queries: Dict[str, List[Any]] = {}
-                project_stats: Dict[str, Dict[str, Any]] = {}
-                query_stats: Dict[str, Dict[str, Any]] = {}
 
-                for project in projects:
-                    try:
-                        # Get queries for this project
-                        queries = self.papervisor.list_project_queries(
-                            project.project_id
-                        )
-                        project_queries[project.project_id] = queries
-                    except Exception as e:
-                        print(
-                            f"Error loading queries for project "
-                            f"{project.project_id}: {e}"
-                        )
-                        project_queries[project.project_id] = []
-                        # Continue with empty queries list
+def _failed_extraction_status(error: str) -> Dict[str, Any]:
+    """Build the extraction status entry of a paper that could not be read."""
+    return {"status": "failed", "sections": [], "json_file": "", "error": error}
 
-                    # Calculate statistics
-                    total_papers = 0
-                    downloaded_papers = 0
-                    has_consolidated = False
-                    consolidated_date = None
 
-                    # Check if consolidated file exists
-                    project_path = self.data_dir / project.project_path
-                    consolidated_path = (
-                        project_path / "pdfs" / "consolidated_papers.csv"
-                    )
+def _extract_pdf_text_in_worker(
+    pdf_path_str: str, paper: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Extract the text of a paper's PDF in a worker process."""
+    return _extract_pdf_text(Path(pdf_path_str), paper)
 
-                    if consolidated_path.exists():
-                        has_consolidated = True
-                        consolidated_date_timestamp = consolidated_path.stat().st_mtime
-                        import datetime
 
-                        consolidated_date = datetime.datetime.fromtimestamp(
-                            consolidated_date_timestamp
-                        ).strftime("%Y-%m-%d")
+# Maximum number of projects whose landing page statistics load concurrently
+_LANDING_PAGE_WORKERS = 8
 
-                        # Count papers from consolidated file
-                        try:
-                            consolidated_df = pd.read_csv(consolidated_path)
-                            total_papers = len(consolidated_df)
+# Threads reading extracted text files on the text extraction page
+_TEXT_METRICS_WORKERS = 8
 
-                            # Count downloaded papers
-                            pdf_automatic_dir = project_path / "pdfs" / "automatic"
-                            pdf_manual_dir = project_path / "pdfs" / "manual"
+# Papers screened at the same time; screening waits on the OpenAI API
+_SCREENING_WORKERS = 8
 
-                            downloaded_files = []
-                            if pdf_automatic_dir.exists():
-                                downloaded_files.extend(
-                                    list(pdf_automatic_dir.glob("*.pdf"))
-                                )
-                            if pdf_manual_dir.exists():
-                                downloaded_files.extend(
-                                    list(pdf_manual_dir.glob("*.pdf"))
-                                )
+# Serializes updates of extraction status files by requests and background jobs
+_extraction_status_lock = threading.RLock()
 
-                            downloaded_papers = len(downloaded_files)
-                        except Exception:
-                            total_papers = 0
-                            downloaded_papers = 0
+# Number of consolidated file versions whose review groups are kept
+_REVIEW_GROUPS_CACHE_SIZE = 16
 
-                    project_stats[project.project_id] = {
-                        "total_papers": total_papers,
-                        "downloaded_papers": downloaded_papers,
-                        "has_consolidated": has_consolidated,
-                        "consolidated_date": consolidated_date,
-                    }
+# Parquet sidecars and multithreaded CSV parsing are only used when pyarrow is
+# installed (``server`` extra)
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
-                    # Get query statistics
-                    query_stats[project.project_id] = {}
-                    queries = project_queries.get(project.project_id, [])
-                    for query in queries:
-                        try:
-                            pm = self.papervisor.project_manager
-                            results_dir = pm.get_project_results_directory(
-                                project.project_id
-                            )
-                            query_file = results_dir / Path(query.results_file).name
-                            if query_file.exists():
-                                query_df = pd.read_csv(query_file)
-                                query_stats[project.project_id][query.id] = {
-                                    "paper_count": len(query_df)
-                                }
-                            else:
-                                query_stats[project.project_id][query.id] = None
-                        except Exception as e:
-                            print(f"Error loading query stats for {query.id}: {e}")
-                            query_stats[project.project_id][query.id] = None
-
-                return render_template(
-                    "landing.html",
-                    projects=projects,
-                    project_queries=project_queries,
-                    project_stats=project_stats,
-                    query_stats=query_stats,
-                )
 
-            except Exception as e:
-                return render_template("error.html", error=str(e))
+# Known column dtypes of consolidated_papers.csv. Text columns are read as
+# strings so pandas skips type inference and numeric-looking titles or DOIs are
+# not turned into numbers; duplicate_of holds reference IDs as entered on the
+# review page
+_CONSOLIDATED_DTYPES: Tuple[Tuple[str, str], ...] = tuple(
+    (column, "str")
+    for column in (
+        "title",
+        "Title",
+        "authors",
+        "Authors",
+        "DOI",
+        "Abstract",
+        "source_queries",
+        "duplicate_of",
+        "ArticleURL",
+        "article_url",
+        "FullTextURL",
+        "URL",
+    )
+) + (
+    # Nullable booleans: one byte per paper, where missing flags made pandas
+    # fall back to an object column
+    ("is_duplicate", "boolean"),
+)
 
-        @self.app.route("/consolidate", methods=["POST"])
-        def consolidate_project() -> WerkzeugResponse:
-            """Consolidate queries for a project."""
-            try:
-                project_id = request.form.get("project_id")
-                if not project_id:
-                    flash("Project ID is required", "error")
-                    return redirect(url_for("landing_page"))
 
-                # Consolidate the project
-                self.papervisor.consolidate_project_csvs(project_id)
-                flash(f"Project '{project_id}' consolidated successfully!", "success")
+@lru_cache(maxsize=32)
+def _load_csv_cached(
+    path_str: str, _mtime_ns: int, _size: int, dtypes: Tuple[Tuple[str, str], ...]
+) -> pd.DataFrame:
+    """Parse a CSV file; cached on its path, mtime, size and column dtypes.
 
-                return redirect(url_for("landing_page"))
+    The multithreaded pyarrow parser is used when it is installed. It rejects
+    some files the C parser accepts (e.g. line breaks inside quoted fields),
+    so those are parsed again with the default engine.
+    """
+    dtype = dict(dtypes) or None
+    if _PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(path_str, dtype=dtype, engine="pyarrow")
+        except ValueError:
+            logger.debug("pyarrow could not parse %s; using the C parser", path_str)
+    return pd.read_csv(path_str, dtype=dtype)
+
+
+def _read_csv_cached(
+    path: Path, dtypes: Tuple[Tuple[str, str], ...] = ()
+) -> pd.DataFrame:
+    """Read a CSV file, reusing the parsed frame while the file is unchanged.
+
+    Args:
+        path: Path to the CSV file
+        dtypes: (column, dtype) pairs for columns whose type is known; columns
+            missing from the file are ignored
+
+    Returns:
+        A shallow copy of the cached DataFrame. Callers may add or replace
+        columns; in-place writes such as ``.loc`` assignments need a
+        ``.copy()`` first, as without pandas Copy-on-Write (pandas < 3) they
+        would change the cached frame
+    """
+    stat = path.stat()
+    return _load_csv_cached(str(path), stat.st_mtime_ns, stat.st_size, dtypes).copy(
+        deep=False
+    )
 
-            except Exception as e:
-                flash(f"Error consolidating project: {str(e)}", "error")
-                return redirect(url_for("landing_page"))
 
-        @self.app.route("/project/<project_id>")
-        def project_dashboard(project_id: str) -> WerkzeugResponse:
-            """Redirect to review papers page for a specific project."""
-            return redirect(url_for("review_papers", project_id=project_id))
+def _load_json_file(path_str: str) -> Any:
+    """Parse a JSON file, with orjson when it is installed.
 
-        # Legacy single-project routes (for backward compatibility)
-        @self.app.route("/review")
-        def review_papers_legacy() -> WerkzeugResponse:
-            """Legacy route for review papers - redirect to project-specific route."""
-            if not self.project_id:
-                return redirect(url_for("landing_page"))
-            return redirect(url_for("review_papers", project_id=self.project_id))
+    Files written by ``json.dump`` may contain NaN, which orjson rejects, so
+    those are parsed with the stdlib json module.
+    """
+    with open(path_str, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
-        @self.app.route("/downloads")
-        def download_management_legacy() -> WerkzeugResponse:
-            """Legacy route - redirect to project-specific download management."""
-            if not self.project_id:
-                return redirect(url_for("landing_page"))
-            return redirect(url_for("download_management", project_id=self.project_id))
 
-        @self.app.route("/project/<project_id>/review")
-        def review_papers(
-            project_id: Optional[str] = None,
-        ) -> Union[str, WerkzeugResponse]:
-            """Page 1: Review and clean consolidated papers."""
-            try:
-                # Use provided project_id or fallback to instance project_id
-                current_project_id = project_id or self.project_id
-                if not current_project_id:
-                    return make_response(
-                        render_template("error.html", error="No project specified")
-                    )
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as indented JSON, with orjson when it is installed.
 
-                # Get the project
-                current_project = self.papervisor.get_project(current_project_id)
-                if not current_project:
-                    return make_response(
-                        render_template(
-                            "error.html",
-                            error=f"Project '{current_project_id}' not found",
-                        )
-                    )
+    Data orjson cannot serialize, such as non-string keys, falls back to the
+    stdlib json module. Both write non-ASCII text as UTF-8.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
 
-                # Get project path
-                project_path = self.data_dir / current_project.project_path
 
-                # Load consolidated papers data
-                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                if not consolidated_path.exists():
-                    return make_response(
-                        render_template(
-                            "error.html",
-                            error=(
-                                "No consolidated papers file found. "
-                                "Please run the consolidation process first."
-                            ),
-                        )
-                    )
+@lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, _mtime_ns: int, _size: int) -> Any:
+    """Parse a JSON file; cached on its path, mtime and size."""
+    return _load_json_file(path_str)
 
-                papers_df = pd.read_csv(consolidated_path)
 
-                # Prepare papers data for review
-                papers_data = []
-                for idx, paper in papers_df.iterrows():
-                    paper_id = str(idx)
-                    title = paper.get("title", paper.get("Title", "Unknown Title"))
-                    authors = paper.get(
-                        "authors", paper.get("Authors", "Unknown Authors")
-                    )
-                    year = paper.get("year", paper.get("Year", "Unknown"))
-                    source_queries = paper.get("source_queries", "")
+def _read_json_cached(path: Path) -> Any:
+    """Read a JSON file, reusing the parsed data while the file is unchanged.
 
-                    # Safely handle potentially NaN values
-                    doi = paper.get("DOI", "")
-                    if pd.isna(doi):
-                        doi = ""
+    Args:
+        path: Path to the JSON file
 
-                    abstract = paper.get("Abstract", "")
-                    if pd.isna(abstract):
-                        abstract = ""
-                    elif isinstance(abstract, str) and len(abstract) > 200:
-                        abstract = abstract[:200] + "..."
+    Returns:
+        A fresh copy of the parsed data, safe for the caller to modify
+    """
+    stat = path.stat()
+    return copy.deepcopy(_load_json_cached(str(path), stat.st_mtime_ns, stat.st_size))
 
-                    # Get available URLs for preview
-                    urls = self._get_paper_urls(paper)
 
-                    papers_data.append(
-                        {
-                            "paper_id": paper_id,
-                            "title": title,
-                            "authors": authors,
-                            "year": year,
-                            "source_queries": source_queries,
-                            "urls": urls,
-                            "doi": str(doi) if not pd.isna(doi) else "",
-                            "abstract": abstract,
-                            "is_duplicate": paper.get("is_duplicate", False),
-                            "duplicate_of": paper.get(
-                                "duplicate_of", ""
-                            ),  # Reference to original paper
-                        }
-                    )
+# Sections of an extracted text JSON file counted towards its word count, next
+# to its additional_sections
+_WORD_COUNT_SECTIONS = (
+    "abstract",
+    "introduction",
+    "methods",
+    "results",
+    "discussion",
+    "conclusion",
+)
 
-                # Group papers by similarity
-                grouped_papers = self._group_similar_papers(papers_data)
 
-                return render_template(
-                    "review_papers.html",
-                    project_id=current_project_id,
-                    paper_groups=grouped_papers,
-                    total_papers=len(papers_data),
-                )
+@lru_cache(maxsize=1024)
+def _load_text_metrics(path_str: str, _mtime_ns: int, _size: int) -> Dict[str, int]:
+    """Compute the quality metrics of an extracted text JSON file; cached on its
+    path, mtime and size."""
+    data = _load_json_file(path_str)
+    metadata = data.get("extraction_metadata", {})
 
-            except Exception as e:
-                return render_template("error.html", error=str(e))
+    sections = [data.get(name, "") for name in _WORD_COUNT_SECTIONS]
+    sections.extend(data.get("additional_sections", {}).values())
+    word_count = sum(len(text.split()) for text in sections if text)
 
-        @self.app.route("/downloads")
-        @self.app.route("/project/<project_id>/downloads")
-        def download_management(
-            project_id: Optional[str] = None,
-        ) -> Union[str, WerkzeugResponse]:
-            """Page 2: Download management and status."""
-            try:
-                # Use provided project_id or fallback to instance project_id
-                current_project_id = project_id or self.project_id
-                if not current_project_id:
-                    return render_template("error.html", error="No project specified")
+    return {
+        "text_length": metadata.get("text_length", 0),
+        "pages_count": metadata.get("total_pages", 0),
+        "raw_text_chars": metadata.get("raw_text_chars", 0),
+        "section_text_chars": metadata.get("section_text_chars", 0),
+        "section_extraction_percentage": metadata.get(
+            "section_extraction_percentage", 0
+        ),
+        "word_count": word_count,
+        "character_count": metadata.get("text_length", 0),
+    }
 
-                # Get the project
-                current_project = self.papervisor.get_project(current_project_id)
-                if not current_project:
-                    return render_template(
-                        "error.html", error=f"Project '{current_project_id}' not found"
-                    )
 
-                # Get project path
-                project_path = self.data_dir / current_project.project_path
+def _text_metrics(json_path: Path) -> Dict[str, int]:
+    """Get the quality metrics of an extracted text, re-read only when it changes.
 
-                # Load consolidated papers data
-                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                if not consolidated_path.exists():
-                    return render_template(
-                        "error.html",
-                        error=(
-                            "No consolidated papers file found. "
-                            "Please run the download process first."
-                        ),
-                    )
+    Args:
+        json_path: Extracted text JSON file of a paper
 
-                papers_df = pd.read_csv(consolidated_path)
+    Returns:
+        Text length, page and character counts and word count of the sections
+    """
+    stat = json_path.stat()
+    return dict(_load_text_metrics(str(json_path), stat.st_mtime_ns, stat.st_size))
 
-                # Filter out duplicates - only show papers that are NOT marked
-                # as duplicates
-                if "is_duplicate" in papers_df.columns:
-                    non_duplicate_papers = papers_df[
-                        ~papers_df["is_duplicate"].fillna(False)
-                    ].copy()
-                    total_papers_before_filter = len(papers_df)
-                    total_duplicates = len(
-                        papers_df[papers_df["is_duplicate"].fillna(False)]
-                    )
-                    print(
-                        f"DEBUG: Total papers before duplicate filter: "
-                        f"{total_papers_before_filter}"
-                    )
-                    print(f"DEBUG: Total duplicates marked: {total_duplicates}")
-                    print(
-                        f"DEBUG: Total papers after duplicate filter: "
-                        f"{len(non_duplicate_papers)}"
-                    )
-                else:
-                    non_duplicate_papers = papers_df.copy()
-                    print(
-                        f"DEBUG: No duplicate columns found, using all "
-                        f"{len(papers_df)} papers"
-                    )
 
-                # Load download status from reports
-                downloader = PDFDownloader(project_path)
-                download_stats = downloader.get_download_statistics()
+@lru_cache(maxsize=128)
+def _count_csv_records(path_str: str, _mtime_ns: int, _size: int) -> int:
+    """Count the data records of a CSV file; cached on its path, mtime and size."""
+    with open(path_str, "r", encoding="utf-8", newline="") as f:
+        return max(sum(1 for row in csv.reader(f) if row) - 1, 0)
 
-                # Get list of downloaded files with their sources
-                downloaded_files_info = self._get_downloaded_files_with_source(
-                    project_path
-                )
-                downloaded_files = [info["filename"] for info in downloaded_files_info]
 
-                # Create a mapping of duplicate information for traceability
-                duplicate_info: Dict[int, List[int]] = {}
-                merged_source_queries: Dict[int, set[str]] = {}
+def _count_csv_rows(path: Path) -> int:
+    """Count the rows pandas would load from a CSV file without parsing it.
 
-                if (
-                    "is_duplicate" in papers_df.columns
-                    and "duplicate_of" in papers_df.columns
-                ):
-                    # Count how many duplicates each original paper has and merge
-                    # their source queries
-                    for idx, paper in papers_df.iterrows():
-                        idx_int = int(str(idx))  # Convert to int via string
-                        if paper.get("is_duplicate", False):
-                            original_id = paper.get("duplicate_of", "")
-                            if original_id:
-                                try:
-                                    original_idx = int(float(original_id))
-                                    if original_idx not in duplicate_info:
-                                        duplicate_info[original_idx] = []
-                                        merged_source_queries[original_idx] = set()
-
-                                    duplicate_info[original_idx].append(idx_int)
-
-                                    # Merge source queries from duplicate
-                                    duplicate_sources = paper.get("source_queries", "")
-                                    if duplicate_sources:
-                                        if "," in duplicate_sources:
-                                            merged_source_queries[original_idx].update(
-                                                duplicate_sources.split(",")
-                                            )
-                                        else:
-                                            merged_source_queries[original_idx].add(
-                                                duplicate_sources.strip()
-                                            )
-
-                                except (ValueError, TypeError):
-                                    pass
-
-                    # Add original paper's source queries to the merged set
-                    for original_idx in merged_source_queries:
-                        if original_idx < len(papers_df):
-                            original_sources = papers_df.iloc[original_idx].get(
-                                "source_queries", ""
-                            )
-                            if original_sources:
-                                if "," in original_sources:
-                                    merged_source_queries[original_idx].update(
-                                        original_sources.split(",")
-                                    )
-                                else:
-                                    merged_source_queries[original_idx].add(
-                                        original_sources.strip()
-                                    )
+    Quoted fields may span lines, so records are counted with the csv module
+    rather than by counting newlines. Blank lines are skipped like read_csv.
 
-                # Prepare papers data for template (only non-duplicates)
-                papers_data = []
-                for idx, paper in non_duplicate_papers.iterrows():
-                    idx_int = int(str(idx))  # Convert to int via string
-                    paper_id = str(idx_int)
-                    title = paper.get("title", paper.get("Title", "Unknown Title"))
-                    authors = paper.get(
-                        "authors", paper.get("Authors", "Unknown Authors")
-                    )
-                    year = paper.get("year", paper.get("Year", "Unknown"))
+    Args:
+        path: Path to the CSV file
 
-                    # Use merged source queries if this paper has duplicates,
-                    # otherwise use original
-                    if idx_int in merged_source_queries:
-                        source_queries = ",".join(
-                            sorted(merged_source_queries[idx_int])
-                        )
-                    else:
-                        source_queries = paper.get("source_queries", "")
+    Returns:
+        Number of data rows, excluding the header
+    """
+    stat = path.stat()
+    return _count_csv_records(str(path), stat.st_mtime_ns, stat.st_size)
 
-                    # Safely handle potentially NaN values
-                    doi = paper.get("DOI", "")
-                    if pd.isna(doi):
-                        doi = ""
 
-                    # Check if downloaded and determine source
-                    filename_pattern = f"{paper_id}_"
-                    is_downloaded = any(
-                        f.startswith(filename_pattern) for f in downloaded_files
-                    )
+@lru_cache(maxsize=32)
+def _load_parquet_cached(path_str: str, _mtime_ns: int, _size: int) -> pd.DataFrame:
+    """Read a Parquet file; cached on its path, mtime and size."""
+    return pd.read_parquet(path_str, engine="pyarrow")
 
-                    # Find the downloaded file and its source
-                    downloaded_file = None
-                    download_source = None
-                    for file_info in downloaded_files_info:
-                        if file_info["filename"].startswith(filename_pattern):
-                            downloaded_file = file_info["filename"]
-                            download_source = file_info["source"]
-                            break
 
-                    # Get available URLs
-                    urls = self._get_paper_urls(paper)
+def _load_consolidated(consolidated_path: Path) -> pd.DataFrame:
+    """Load consolidated papers, preferring an up-to-date Parquet sidecar.
 
-                    # Add duplicate traceability information
-                    has_duplicates = idx_int in duplicate_info
-                    duplicate_count = (
-                        len(duplicate_info.get(idx_int, [])) if has_duplicates else 0
-                    )
+    The sidecar (``consolidated_papers.parquet``) is stamped with the mtime of
+    the CSV it was built from and rebuilt whenever the CSV's mtime differs, so
+    the CSV stays the source of truth. It is written to a temporary file and
+    renamed into place, so concurrent readers never load a partial sidecar.
 
-                    papers_data.append(
-                        {
-                            "paper_id": paper_id,
-                            "title": title,
-                            "authors": authors,
-                            "year": year,
-                            "source_queries": source_queries,
-                            "is_downloaded": is_downloaded,
-                            "downloaded_file": downloaded_file,
-                            "download_source": download_source,  # 'automatic' or
-                            # 'manual'
-                            "urls": urls,
-                            "doi": str(doi) if not pd.isna(doi) else "",
-                            "has_duplicates": has_duplicates,
+    Args:
+        consolidated_path: Path to consolidated_papers.csv
+
+    Returns:
+        A shallow copy of the cached DataFrame. Callers may add or replace
+        columns; in-place writes such as ``.loc`` assignments need a
+        ``.copy()`` first, as without pandas Copy-on-Write (pandas < 3) they
+        would change the cached frame
+    """
+    if not _PYARROW_AVAILABLE:
+        return _read_csv_cached(consolidated_path, _CONSOLIDATED_DTYPES)
+
+    parquet_path = consolidated_path.with_suffix(".parquet")
+    csv_stat = consolidated_path.stat()
+    if parquet_path.exists():
+        stat = parquet_path.stat()
+        if stat.st_mtime_ns == csv_stat.st_mtime_ns:
+            try:
+                return _load_parquet_cached(
+                    str(parquet_path), stat.st_mtime_ns, stat.st_size
+                ).copy(deep=False)
+            except (OSError, ValueError) as e:
+                logger.warning("Error reading %s, using CSV: %s", parquet_path, e)
+
+    papers_df = _read_csv_cached(consolidated_path, _CONSOLIDATED_DTYPES)
+    # Unique per thread, as several requests may rebuild the sidecar at once
+    tmp_path = parquet_path.with_name(
+        f"{parquet_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        papers_df.to_parquet(tmp_path, compression="zstd", index=False)
+        # The CSV's stat was taken before it was read, so a CSV rewritten in
+        # the meantime has a newer mtime and the sidecar is rebuilt again
+        os.utime(tmp_path, ns=(csv_stat.st_atime_ns, csv_stat.st_mtime_ns))
+        os.replace(tmp_path, parquet_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("Could not write Parquet sidecar %s: %s", parquet_path, e)
+        tmp_path.unlink(missing_ok=True)
+    return papers_df
+
+
+def _load_project_papers(project_path: Path) -> Optional[pd.DataFrame]:
+    """Load a project's consolidated papers, or None if the file is missing.
+
+    Loading stats the file anyway, so there is no separate existence check.
+    """
+    try:
+        return _load_consolidated(project_path / "pdfs" / "consolidated_papers.csv")
+    except FileNotFoundError:
+        return None
+
+
+def _missing_project_papers_response(
+    project_path: Path,
+) -> Tuple[FlaskResponse, int]:
+    """Build the JSON error for a project whose papers could not be loaded."""
+    if not project_path.exists():
+        message = "Project not found"
+    else:
+        message = "No consolidated papers file found"
+    return jsonify({"status": "error", "message": message}), 404
+
+
+# Salt page ETags so browsers revalidate pages after a server restart, which may
+# come with updated templates
+_ETAG_SALT = f"{os.getpid()}-{time.time_ns()}"
+
+
+def _page_etag(paths: Iterable[Path]) -> Optional[str]:
+    """Build an ETag for a page from the files it is rendered from.
+
+    Args:
+        paths: Files and directories whose changes affect the page
+
+    Returns:
+        The ETag, or None if the page shows flashed messages and must not be
+        cached
+    """
+    if session.get("_flashes"):
+        return None
+
+    digest = hashlib.md5(_ETAG_SALT.encode(), usedforsecurity=False)
+    for path in paths:
+        try:
+            stat = path.stat()
+            digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+        except FileNotFoundError:
+            digest.update(f"{path}|-\n".encode())
+    return digest.hexdigest()
+
+
+def _not_modified_response(etag: Optional[str]) -> Optional[WerkzeugResponse]:
+    """Return a 304 response if the client already has this version of a page."""
+    if etag is None or not request.if_none_match.contains(etag):
+        return None
+    response = make_response("", 304)
+    response.set_etag(etag)
+    return response
+
+
+def _cacheable_response(body: str, etag: Optional[str]) -> WerkzeugResponse:
+    """Wrap a rendered page, letting the browser revalidate it by ETag."""
+    response = make_response(body)
+    if etag is not None:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return the modification time of a path, or 0 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=64)
+def _scan_pdfs(dir_str: str, _mtime_ns: int) -> Tuple[str, ...]:
+    """List the PDF file names in a directory; cached on its path and mtime."""
+    with os.scandir(dir_str) as entries:
+        return tuple(entry.name for entry in entries if entry.name.endswith(".pdf"))
+
+
+def _list_pdfs(directory: Path) -> Tuple[str, ...]:
+    """List the PDF file names in a directory, or nothing if it does not exist.
+
+    Adding, removing or renaming a file updates the directory mtime, so the
+    cached listing is reused only while the directory is unchanged.
+    """
+    mtime_ns = _mtime_ns(directory)
+    if not mtime_ns:
+        return ()
+    try:
+        return _scan_pdfs(str(directory), mtime_ns)
+    except FileNotFoundError:
+        return ()
+
+
+@lru_cache(maxsize=256)
+def _compute_project_stats(
+    project_path_str: str,
+    consolidated_mtime_ns: int,
+    _pdf_dirs_mtime_ns: Tuple[int, int],
+) -> Dict[str, Any]:
+    """Compute landing page statistics; cached on the project file mtimes."""
+    if not consolidated_mtime_ns:
+        return {
+            "total_papers": 0,
+            "downloaded_papers": 0,
+            "has_consolidated": False,
+            "consolidated_date": None,
+        }
+
+    pdfs_dir = Path(project_path_str) / "pdfs"
+    consolidated_date = datetime.datetime.fromtimestamp(
+        consolidated_mtime_ns / 1e9
+    ).strftime("%Y-%m-%d")
+    try:
+        total_papers = _count_csv_rows(pdfs_dir / "consolidated_papers.csv")
+        downloaded_papers = len(_list_pdfs(pdfs_dir / "automatic")) + len(
+            _list_pdfs(pdfs_dir / "manual")
+        )
+    except Exception:
+        total_papers = 0
+        downloaded_papers = 0
+
+    return {
+        "total_papers": total_papers,
+        "downloaded_papers": downloaded_papers,
+        "has_consolidated": True,
+        "consolidated_date": consolidated_date,
+    }
+
+
+def _project_stats(project_path: Path) -> Dict[str, Any]:
+    """Get landing page statistics for a project.
+
+    The statistics are recomputed only when consolidated_papers.csv or the
+    contents of the automatic/manual PDF directories change.
+
+    Args:
+        project_path: Project directory
+
+    Returns:
+        Dictionary with paper counts and consolidation status
+    """
+    pdfs_dir = project_path / "pdfs"
+    stats = _compute_project_stats(
+        str(project_path),
+        _mtime_ns(pdfs_dir / "consolidated_papers.csv"),
+        (_mtime_ns(pdfs_dir / "automatic"), _mtime_ns(pdfs_dir / "manual")),
+    )
+    return dict(stats)
+
+
+def _latest_reports(reports_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Name, mtime and size of the ``*_latest.json`` download status reports.
+
+    The latest reports are rewritten in place, which leaves the directory
+    mtime unchanged, so each file is stat'ed from a single directory scan.
+    """
+    try:
+        with os.scandir(reports_dir) as entries:
+            reports = [
+                (entry.name, stat.st_mtime_ns, stat.st_size)
+                for entry in entries
+                if entry.name.endswith("_latest.json")
+                for stat in (entry.stat(),)
+            ]
+    except FileNotFoundError:
+        return ()
+    return tuple(sorted(reports))
+
+
+@lru_cache(maxsize=64)
+def _compute_download_stats(
+    project_path_str: str, _reports: Tuple[Tuple[str, int, int], ...]
+) -> Dict[str, Any]:
+    """Read a project's download statistics; cached on its latest reports."""
+    return PDFDownloader(Path(project_path_str)).get_download_statistics()
+
+
+def _download_stats(project_path: Path) -> Dict[str, Any]:
+    """Get a project's download statistics, re-read only when reports change.
+
+    Args:
+        project_path: Project directory
+
+    Returns:
+        A fresh copy of the download statistics, safe for the caller to modify
+    """
+    reports_dir = project_path / "pdfs" / "automatic" / "reports"
+    stats = _compute_download_stats(str(project_path), _latest_reports(reports_dir))
+    return copy.deepcopy(stats)
+
+
+_URL_COLUMNS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("DOI", ("DOI",)),
+    ("Article Page", ("ArticleURL", "article_url")),
+    ("Full Text PDF", ("FullTextURL",)),
+    ("Original URL", ("URL",)),
+)
+
+# Prefixes turning identifier columns into links
+_URL_PREFIXES = {"DOI": "https://doi.org/"}
+
+# Alternative spellings of paper columns, mapped to the names the pages use
+_COLUMN_ALIASES = {"Title": "title", "Authors": "authors", "Year": "year"}
+
+# Values for paper columns missing from the consolidated file
+_PAPER_DEFAULTS: Dict[str, Any] = {
+    "title": "Unknown Title",
+    "authors": "Unknown Authors",
+    "year": "Unknown",
+    "source_queries": "",
+    "DOI": "",
+    "Abstract": "",
+    "is_duplicate": False,
+    "duplicate_of": "",
+}
+
+# Values replacing missing entries of the paper columns the pages test
+_PAPER_FILL_VALUES = {
+    name: _PAPER_DEFAULTS[name]
+    for name in ("source_queries", "DOI", "Abstract", "is_duplicate", "duplicate_of")
+}
+
+
+def _column_or_default(
+    papers_df: pd.DataFrame, names: Tuple[str, ...], default: Any
+) -> pd.Series:
+    """Return the first of ``names`` present in the frame, or a constant column."""
+    for name in names:
+        if name in papers_df.columns:
+            return papers_df[name]
+    return pd.Series(default, index=papers_df.index, dtype=object)
+
+
+def _truncate_text(text: pd.Series, limit: int) -> pd.Series:
+    """Shorten string values longer than ``limit`` characters, adding '...'."""
+    try:
+        values = text.str
+    except AttributeError:  # no string values to shorten
+        return text
+    return text.mask(values.len() > limit, values.slice(0, limit) + "...")
+
+
+def _paper_urls(papers_df: pd.DataFrame) -> List[Dict[str, str]]:
+    """Build the available URLs of every paper in a single pass per column."""
+    urls: List[Dict[str, str]] = [{} for _ in range(len(papers_df))]
+    for label, names in _URL_COLUMNS:
+        values = (
+            _column_or_default(papers_df, names, "").fillna("").astype(str).str.strip()
+        )
+        valid = (values != "") & (values.str.lower() != "nan")
+        if label in _URL_PREFIXES:
+            values = _URL_PREFIXES[label] + values
+        for pos in valid.to_numpy().nonzero()[0]:
+            urls[pos][label] = values.iat[pos]
+    return urls
+
+
+def _index_downloads_by_paper(
+    files_info: List[Dict[str, str]],
+) -> Dict[str, Dict[str, str]]:
+    """Index downloaded files by the paper ID prefix of their filename.
+
+    The first file found for a paper wins, matching the order in which the
+    automatic and manual directories are listed.
+    """
+    by_paper: Dict[str, Dict[str, str]] = {}
+    for info in files_info:
+        by_paper.setdefault(info["filename"].split("_", 1)[0], info)
+    return by_paper
+
+
+def _downloaded_files_with_source(project_path: Path) -> List[Dict[str, str]]:
+    """List the downloaded PDFs of a project, automatic directory first."""
+    files_info: List[Dict[str, str]] = []
+    for source in ("automatic", "manual"):
+        pdf_dir = project_path / "pdfs" / source
+        for filename in _list_pdfs(pdf_dir):
+            files_info.append(
+                {
+                    "filename": filename,
+                    "source": source,
+                    "path": str(pdf_dir / filename),
+                }
+            )
+    return files_info
+
+
+@lru_cache(maxsize=64)
+def _load_download_index(
+    project_path_str: str, _pdf_dirs_mtime_ns: Tuple[int, int]
+) -> Dict[str, Dict[str, str]]:
+    """Index downloaded files by paper ID; cached on the PDF directory mtimes."""
+    return _index_downloads_by_paper(
+        _downloaded_files_with_source(Path(project_path_str))
+    )
+
+
+def _download_index(project_path: Path) -> Dict[str, Dict[str, str]]:
+    """Get the downloaded files of a project by paper ID.
+
+    The index is rebuilt only when a file is added to, removed from or renamed
+    in the automatic or manual PDF directory.
+
+    Returns:
+        A copy of the cached index; the file details are shared and must not
+        be modified
+    """
+    pdfs_dir = project_path / "pdfs"
+    mtimes = (_mtime_ns(pdfs_dir / "automatic"), _mtime_ns(pdfs_dir / "manual"))
+    return dict(_load_download_index(str(project_path), mtimes))
+
+
+# Paper IDs are row numbers, possibly written as floats by pandas ("3.0")
+_PAPER_ID_RE = re.compile(r"^\d+(?:\.0*)?$")
+
+
+def _paper_index(paper_id: str) -> Optional[int]:
+    """Get the row number of a paper ID, or None if it is not one."""
+    paper_id = paper_id.strip()
+    if not _PAPER_ID_RE.match(paper_id):
+        return None
+    return int(paper_id.partition(".")[0])
+
+
+# Separator of source_queries values, with the whitespace around it
+_COMMA_RE = re.compile(r"\s*,\s*")
+
+
+def _downloaded_paper_records(
+    papers_df: pd.DataFrame, downloads_by_paper: Dict[str, Dict[str, str]]
+) -> List[Dict[str, Any]]:
+    """Convert the rows of downloaded papers to dicts, with their file details.
+
+    Args:
+        papers_df: Papers to consider, indexed by paper ID
+        downloads_by_paper: Downloaded files indexed by paper ID, as built by
+            ``_index_downloads_by_paper``
+
+    Returns:
+        One dict per downloaded paper with its columns plus ``paper_id``,
+        ``downloaded_file`` and ``download_source``
+    """
+    downloaded = papers_df[papers_df.index.astype(str).isin(list(downloads_by_paper))]
+    records: List[Dict[str, Any]] = downloaded.to_dict(orient="records")
+    for idx, record in zip(downloaded.index, records):
+        file_info = downloads_by_paper[str(idx)]
+        record["paper_id"] = idx
+        record["downloaded_file"] = file_info["filename"]
+        record["download_source"] = file_info["source"]
+    return records
+
+
+def _included_papers(
+    papers_df: pd.DataFrame, extraction_status: Dict[str, Any]
+) -> List[Tuple[Any, Any, Any]]:
+    """Get the papers marked for inclusion on the text extraction page.
+
+    Only the included rows and the title and abstract columns are read, rather
+    than materializing every row.
+
+    Returns:
+        (paper ID, title, abstract) of each included paper, in file order
+    """
+    included = [
+        key
+        for key, status in extraction_status.items()
+        if status.get("screening_action") == "include"
+    ]
+    selected = papers_df[papers_df.index.astype(str).isin(included)]
+    if "title" in selected.columns:
+        titles = selected["title"].tolist()
+    else:
+        titles = selected.get("Title", pd.Series("", index=selected.index)).tolist()
+    abstracts = selected.get("Abstract", pd.Series("", index=selected.index)).tolist()
+    return list(zip(selected.index.tolist(), titles, abstracts))
+
+
+def _split_source_queries(sources: Any) -> List[str]:
+    """Split a comma-separated source_queries value into query IDs."""
+    if not isinstance(sources, str):
+        return []
+    return [query for query in _COMMA_RE.split(sources.strip()) if query]
+
+
+def _duplicate_mask(papers_df: pd.DataFrame) -> pd.Series:
+    """Boolean mask of the papers marked as duplicates; missing flags are False."""
+    if "is_duplicate" not in papers_df.columns:
+        return pd.Series(False, index=papers_df.index)
+    return papers_df["is_duplicate"].eq(True).fillna(False)
+
+
+def _non_duplicates(papers_df: pd.DataFrame) -> pd.DataFrame:
+    """Select the papers not marked as duplicates."""
+    return papers_df[~_duplicate_mask(papers_df)]
+
+
+def _group_duplicates(
+    papers_df: pd.DataFrame,
+) -> Tuple[Dict[int, List[int]], Dict[int, set[str]]]:
+    """Group duplicate papers by the paper they duplicate.
+
+    Returns:
+        Tuple of (duplicate row indices per original paper, source queries of
+        each original merged with those of its duplicates)
+    """
+    if not {"is_duplicate", "duplicate_of"} <= set(papers_df.columns):
+        return {}, {}
+
+    is_duplicate = _duplicate_mask(papers_df)
+    duplicate_of = (
+        pd.to_numeric(papers_df.loc[is_duplicate, "duplicate_of"], errors="coerce")
+        .dropna()
+        .astype(int)
+    )
+    sources = _column_or_default(papers_df, ("source_queries",), "")
+
+    duplicate_info: Dict[int, List[int]] = {}
+    merged_source_queries: Dict[int, set[str]] = {}
+    for original_idx, duplicate_sources in sources.loc[duplicate_of.index].groupby(
+        duplicate_of
+    ):
+        original_idx = int(original_idx)
+        duplicate_info[original_idx] = [int(i) for i in duplicate_sources.index]
+        merged = {q for s in duplicate_sources for q in _split_source_queries(s)}
+        if original_idx < len(papers_df):
+            merged.update(_split_source_queries(sources.iat[original_idx]))
+        merged_source_queries[original_idx] = merged
+    return duplicate_info, merged_source_queries
+
+
+# Fields of the paper details API and the columns they are read from
+_PAPER_DETAIL_COLUMNS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("title", ("title", "Title")),
+    ("authors", ("authors", "Authors")),
+    ("year", ("year", "Year")),
+    ("doi", ("DOI",)),
+    ("abstract", ("Abstract",)),
+    ("source_queries", ("source_queries",)),
+)
+
+
+@lru_cache(maxsize=8)
+def _load_paper_details(
+    path_str: str, _mtime_ns: int, _size: int
+) -> Tuple[Dict[str, Any], ...]:
+    """Build the details of every consolidated paper; cached on the path,
+    mtime and size of consolidated_papers.csv."""
+    papers_df = _load_consolidated(Path(path_str))
+    details = pd.DataFrame(
+        {
+            field_name: _column_or_default(papers_df, names, "").fillna("").astype(str)
+            for field_name, names in _PAPER_DETAIL_COLUMNS
+        },
+        index=papers_df.index,
+    )
+    records = details.to_dict(orient="records")
+    for record, urls in zip(records, _paper_urls(papers_df)):
+        record["urls"] = urls
+    return tuple(records)
+
+
+def _paper_details(consolidated_path: Path) -> Tuple[Dict[str, Any], ...]:
+    """Get the details shown for each paper, indexed by row number.
+
+    The details are built once per version of consolidated_papers.csv, so a
+    lookup does not touch the DataFrame. The returned dicts are shared
+    between requests and must not be modified.
+
+    Args:
+        consolidated_path: Path to consolidated_papers.csv
+
+    Returns:
+        Title, authors, year, DOI, abstract, source queries and URLs of each
+        paper, with missing values as empty strings
+    """
+    stat = consolidated_path.stat()
+    return _load_paper_details(str(consolidated_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _normalize_papers(papers_df: pd.DataFrame) -> pd.DataFrame:
+    """Rename aliased paper columns and fill in missing fields, once per frame.
+
+    Aliases are only applied when the canonical column is absent, so a frame
+    with both ``title`` and ``Title`` keeps using ``title``.
+    """
+    aliases = {
+        alias: name
+        for alias, name in _COLUMN_ALIASES.items()
+        if alias in papers_df.columns and name not in papers_df.columns
+    }
+    papers_df = papers_df.rename(columns=aliases)
+    missing = {
+        name: default
+        for name, default in _PAPER_DEFAULTS.items()
+        if name not in papers_df.columns
+    }
+    return papers_df.assign(**missing).fillna(_PAPER_FILL_VALUES)
+
+
+def _paper_view(papers_df: pd.DataFrame) -> pd.DataFrame:
+    """Select the paper fields shown by the review and download pages.
+
+    Expects a frame prepared by ``_normalize_papers``.
+    """
+    return pd.DataFrame(
+        {
+            "paper_id": papers_df.index.astype(str),
+            "title": papers_df["title"],
+            "authors": papers_df["authors"],
+            "year": papers_df["year"],
+            "source_queries": papers_df["source_queries"],
+            "urls": _paper_urls(papers_df),
+            "doi": papers_df["DOI"].astype(str),
+        },
+        index=papers_df.index,
+    )
+
+
+# Readable names of the section keys stored by text extraction
+_SECTION_NAMES = {
+    "abstract": "Abstract",
+    "introduction": "Introduction",
+    "intro": "Introduction",
+    "methods": "Methods",
+    "methodology": "Methodology",
+    "results": "Results",
+    "discussion": "Discussion",
+    "conclusion": "Conclusion",
+    "conclusions": "Conclusion",
+    "references": "References",
+    "bibliography": "References",
+    "literature_review": "Literature Review",
+    "literature": "Literature Review",
+    "background": "Background",
+    "related": "Related Work",
+    "evaluation": "Evaluation",
+    "experiment": "Experiments",
+    "experiments": "Experiments",
+    "analysis": "Analysis",
+    "limitations": "Limitations",
+    "future": "Future Work",
+    "future_work": "Future Work",
+    "forecasting": "Forecasting",
+    "scheduling": "Scheduling",
+    "optimization": "Optimization",
+    "modeling": "Modeling",
+    "modelling": "Modeling",
+    "simulation": "Simulation",
+    "case_study": "Case Study",
+    "implementation": "Implementation",
+    "validation": "Validation",
+    "problem_definition": "Problem Definition",
+    "data_analysis": "Data Analysis",
+    "acknowledgments": "Acknowledgments",
+    "acknowledgements": "Acknowledgments",
+}
+
+
+@lru_cache(maxsize=256)
+def _readable_section_name(section: str) -> str:
+    """Convert an extracted section key to a readable name.
+
+    Known keys are looked up directly. Otherwise the first known key that
+    contains, or is contained in, the section key is used, falling back to
+    the title-cased key. The same few keys repeat across papers, so results
+    are cached.
+    """
+    section_lower = section.lower()
+    name = _SECTION_NAMES.get(section_lower)
+    if name is not None:
+        return name
+    for key, value in _SECTION_NAMES.items():
+        if key in section_lower or section_lower in key:
+            return value
+    return section.title()
+
+
+# Enhanced section patterns for academic papers
+_SECTION_PATTERNS = {
+    "abstract": [
+        r"\babstract\b",
+        r"\bsummary\b",
+        r"\bexecutive summary\b",
+        r"\b(?:paper\s+)?abstract\b",
+    ],
+    "introduction": [
+        r"\b(?:1\.?\s*)?introduction\b",
+        r"\b(?:1\.?\s*)?background\b",
+        r"\b(?:1\.?\s*)?motivation\b",
+        r"\b(?:I\.?\s*)?introduction\b",
+    ],
+    "methods": [
+        r"\b(?:\d+\.?\s*)?(?:methods?|methodology)\b",
+        r"\b(?:\d+\.?\s*)?(?:approach|framework)\b",
+        r"\b(?:\d+\.?\s*)?(?:materials? and methods?)\b",
+        r"\b(?:\d+\.?\s*)?(?:experimental (?:setup|design))\b",
+        r"\b(?:\d+\.?\s*)?(?:problem statement)\b",
+        r"\b(?:\d+\.?\s*)?(?:mathematical (?:model|formulation))\b",
+        r"\b(?:\d+\.?\s*)?(?:solution approaches?)\b",
+        r"\b(?:\d+\.?\s*)?(?:formulation)\b",
+    ],
+    "results": [
+        r"\b(?:\d+\.?\s*)?results?\b",
+        r"\b(?:\d+\.?\s*)?findings?\b",
+        r"\b(?:\d+\.?\s*)?(?:experimental results?)\b",
+        r"\b(?:\d+\.?\s*)?evaluation\b",
+        r"\b(?:\d+\.?\s*)?(?:results and discussion)\b",
+    ],
+    "discussion": [
+        r"\b(?:\d+\.?\s*)?discussion\b",
+        r"\b(?:\d+\.?\s*)?analysis\b",
+        r"\b(?:\d+\.?\s*)?(?:comparison|comparative analysis)\b",
+    ],
+    "conclusion": [
+        r"\b(?:\d+\.?\s*)?conclusions?\b",
+        r"\b(?:\d+\.?\s*)?(?:concluding remarks?)\b",
+        r"\b(?:\d+\.?\s*)?(?:summary and conclusions?)\b",
+        r"\b(?:\d+\.?\s*)?(?:final remarks?)\b",
+        r"\b(?:\d+\.?\s*)?(?:future (?:work|directions))\b",
+    ],
+    "literature_review": [
+        r"\b(?:\d+\.?\s*)?(?:literature review|related work)\b",
+        r"\b(?:\d+\.?\s*)?(?:state of the art|prior work)\b",
+        r"\b(?:\d+\.?\s*)?(?:previous work|background)\b",
+    ],
+    "acknowledgments": [r"\b(?:acknowledgments?|acknowledgements?)\b"],
+    "references": [r"\b(?:references?|bibliography)\b"],
+}
+
+# Additional patterns to catch more general numbered sections with
+# descriptive titles
+_GENERAL_SECTION_PATTERNS = {
+    "forecasting": [r"\b(?:\d+\.?\s*)?forecasting\b"],
+    "scheduling": [r"\b(?:\d+\.?\s*)?scheduling\b"],
+    "optimization": [r"\b(?:\d+\.?\s*)?optimization\b"],
+    "modeling": [r"\b(?:\d+\.?\s*)?(?:modeling|modelling)\b"],
+    "simulation": [r"\b(?:\d+\.?\s*)?simulation\b"],
+    "case_study": [r"\b(?:\d+\.?\s*)?(?:case study|case studies)\b"],
+    "implementation": [r"\b(?:\d+\.?\s*)?implementation\b"],
+    "experiments": [r"\b(?:\d+\.?\s*)?experiments?\b"],
+    "validation": [r"\b(?:\d+\.?\s*)?validation\b"],
+    "limitations": [r"\b(?:\d+\.?\s*)?limitations?\b"],
+    "future_work": [
+        r"\b(?:\d+\.?\s*)?(?:future work|future research|future directions)\b"
+    ],
+    "problem_definition": [r"\b(?:\d+\.?\s*)?(?:problem (?:definition|statement))\b"],
+    "data_analysis": [r"\b(?:\d+\.?\s*)?(?:data analysis|data processing)\b"],
+}
+
+# Each section's patterns as one case-insensitive regex, for header detection
+_SECTION_HEADER_RES = {
+    section_name: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for section_name, patterns in {
+        **_SECTION_PATTERNS,
+        **_GENERAL_SECTION_PATTERNS,
+    }.items()
+}
+
+# The same patterns one by one, for the paragraph-based search
+_SECTION_PATTERN_RES = {
+    section_name: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for section_name, patterns in {
+        **_SECTION_PATTERNS,
+        **_GENERAL_SECTION_PATTERNS,
+    }.items()
+}
+
+_NUMBERED_SECTION_RE = re.compile(r"^(\d+)\.?\s+([A-Z][a-zA-Z\s]+)$")
+
+# Map common section titles to our standardized names
+_SECTION_TITLE_MAPPINGS = {
+    "forecasting": "forecasting",
+    "introduction": "introduction",
+    "background": "introduction",
+    "methods": "methods",
+    "methodology": "methods",
+    "approach": "methods",
+    "results": "results",
+    "findings": "results",
+    "discussion": "discussion",
+    "analysis": "discussion",
+    "conclusion": "conclusion",
+    "conclusions": "conclusion",
+    "literature review": "literature_review",
+    "related work": "literature_review",
+    "problem statement": "methods",
+    "problem definition": "methods",
+    "solution approaches": "methods",
+    "case study": "case_study",
+    "experiments": "experiments",
+    "evaluation": "results",
+    "implementation": "implementation",
+    "simulation": "simulation",
+    "modeling": "modeling",
+    "modelling": "modeling",
+    "optimization": "optimization",
+    "validation": "validation",
+    "limitations": "limitations",
+    "future work": "future_work",
+    "future research": "future_work",
+    "future directions": "future_work",
+}
+
+# Patterns of section header lines, matched at the start of the line
+_HEADER_RES = [
+    re.compile(pattern)
+    for pattern in (
+        r"^\d+\.?\s+\w+",  # Numbered sections (1. Introduction, 2 Methods)
+        r"^\d+\.?\d*\.?\s+\w+",  # Sub-numbered sections (2.1 Methods)
+        r"^[IVX]+\.?\s+\w+",  # Roman numeral sections
+        r"^[A-Z][A-Z\s]+$",  # All caps headers
+        r"^\w+$",  # Single word headers
+        r"^\w+\s+\w+$",  # Two word headers
+        r"^\w+\s+\w+\s+\w+$",  # Three word headers
+        r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]*)*$",  # Title case headers
+        r"^\d+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]*)*$",  # Numbered title case
+    )
+]
+_NUMBER_PERIOD_END_RE = re.compile(r".*\d+\.$")
+
+# Starts and ends of lines that are likely section headers
+_HEADER_START_RES = [
+    re.compile(pattern)
+    for pattern in (
+        r"^\d+\.?\s*",  # Starts with number
+        r"^[IVX]+\.?\s*",  # Roman numerals
+        r"^[A-Z][a-z]*\s*",  # Capitalized word
+    )
+]
+_HEADER_END_RES = [
+    re.compile(pattern)
+    for pattern in (
+        r"\d+$",  # Ends with number (like "3. Methods 3")
+        r"[A-Z\s]+$",  # All caps words
+        r"\w+\s*$",  # Single word or short phrase
+    )
+]
+
+_PAGE_NUMBER_LINE_RE = re.compile(r"^\d+\s*$")
+
+# Substitutions cleaning raw PDF text, applied in order
+_PREPROCESS_SUBS = [
+    (re.compile(r"\n\s*\n\s*\n"), "\n\n"),  # Reduce multiple newlines to double
+    (re.compile(r"[ \t]+"), " "),  # Normalize spaces and tabs
+    (re.compile(r"\n\d+\s*\n"), "\n"),  # Remove isolated page numbers
+    (re.compile(r"\n[A-Z\s]{10,}\n"), "\n"),  # Remove long all-caps headers
+    (re.compile(r"([a-z])([A-Z])"), r"\1 \2"),  # Missing spaces between words
+    (re.compile(r"(\w)-\s*\n\s*(\w)"), r"\1\2"),  # Hyphenated words across lines
+]
+
+# Substitutions cleaning the content of an extracted section, applied in order
+_SECTION_CONTENT_SUBS = [
+    (re.compile(r"\n\s*\n\s*\n"), "\n\n"),
+    (re.compile(r"[ \t]+"), " "),
+    (re.compile(r"\n\d+\s*\n"), "\n"),
+    (re.compile(r"\n[A-Z\s]{20,}\n"), "\n"),  # Long all-caps lines
+]
+
+_AUTHOR_SPLIT_RE = re.compile(r"\s*(?:[;,\n]| and | & )\s*")
+_AFFILIATION_RE = re.compile(r"\([^)]*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_DOI_RE = re.compile(r"(?:doi:?\s*)?10\.\d{4,}\/[^\s]+", re.IGNORECASE)
+
+# Patterns of journal or conference names, tried in order
+_SOURCE_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:Published in|Proceedings of|Journal of|Conference on)\s+([^\n]+)",
+        r"([A-Z][a-z]+ (?:Journal|Conference|Proceedings|Review))[^\n]*",
+        r"(IEEE [^,\n]+)",
+        r"(ACM [^,\n]+)",
+    )
+]
+
+
+def _get_paper_urls(paper: Union[pd.Series, Dict[str, Any]]) -> Dict[str, str]:
+    """Extract available URLs from a single paper's data."""
+    urls = {}
+    for label, names in _URL_COLUMNS:
+        value = next((paper[name] for name in names if name in paper), "")
+        if pd.isna(value):
+            continue
+        value = str(value).strip()
+        if value and value.lower() != "nan":
+            urls[label] = _URL_PREFIXES.get(label, "") + value
+    return urls
+
+
+def _extract_pdf_text(pdf_path: Path, paper: Dict) -> Dict[str, Any]:
+    """Extract text from PDF and organize into academic paper sections.
+
+    PDFs are read with PDFium (pypdfium2) when it is installed, which is
+    much faster than the pure-Python PyPDF2 used otherwise.
+    """
+    try:
+        # Extract raw text
+        try:
+            if pdfium is not None:
+                page_texts = _pdfium_page_texts(pdf_path)
+                extraction_method = "pdfium_academic_parser"
+            else:
+                page_texts = _pypdf2_page_texts(pdf_path)
+                extraction_method = "PyPDF2_academic_parser"
+        except ImportError:
+            raise  # PyPDF2 not installed, handled below
+        except Exception as e:
+            print(f"Error opening PDF {pdf_path}: {e}")
+            # Return minimal data structure for failed extraction
+
+            return _create_fallback_extraction_data(paper, pdf_path, str(e))
+
+        total_pages = len(page_texts)
+        text_content = "".join(
+            page_text + "\n" for page_text in page_texts if page_text
+        )
+        del page_texts  # Keep at most two copies of the text alive
+        if not text_content.strip():
+            print(f"No text content extracted from {pdf_path}")
+            return _create_fallback_extraction_data(
+                paper, pdf_path, "No text content extracted"
+            )
+
+        # Clean and preprocess text
+        cleaned_text = _preprocess_text(text_content)
+        del text_content
+
+        # Extract metadata from paper info and text
+        metadata = _extract_paper_metadata(paper, cleaned_text)
+
+        # Extract academic paper sections
+        sections = _extract_academic_sections(cleaned_text)
+
+        # Calculate section extraction quality metrics
+        total_raw_chars = len(cleaned_text)
+        total_section_chars = sum(len(content) for content in sections.values())
+        section_extraction_percentage = (
+            (total_section_chars / total_raw_chars * 100) if total_raw_chars > 0 else 0
+        )
+
+        # Create structured output following the requirements
+        extracted_data = {
+            # Top-level metadata
+            "title": metadata.get("title", ""),
+            "authors": metadata.get("authors", []),
+            "year": metadata.get("year", None),
+            "doi": metadata.get("doi", ""),
+            "source": metadata.get("source", ""),
+            "url": metadata.get("url", ""),
+            # Document sections
+            "abstract": sections.get("abstract", ""),
+            "introduction": sections.get("introduction", ""),
+            "methods": sections.get("methods", ""),
+            "results": sections.get("results", ""),
+            "discussion": sections.get("discussion", ""),
+            "conclusion": sections.get("conclusion", ""),
+            # Additional sections that might be present
+            "additional_sections": {
+                k: v
+                for k, v in sections.items()
+                if k
+                not in [
+                    "abstract",
+                    "introduction",
+                    "methods",
+                    "results",
+                    "discussion",
+                    "conclusion",
+                ]
+            },
+            # Technical metadata
+            "extraction_metadata": {
+                "paper_id": int(paper["paper_id"]),
+                "pdf_file": str(pdf_path.name),
+                "extraction_date": pd.Timestamp.now().isoformat(),
+                "total_pages": total_pages,
+                "text_length": len(cleaned_text),
+                "raw_text_chars": total_raw_chars,
+                "section_text_chars": total_section_chars,
+                "section_extraction_percentage": round(
+                    section_extraction_percentage, 1
+                ),
+                "sections_found": list(sections.keys()),
+                "extraction_method": extraction_method,
+            },
+        }
+
+        return extracted_data
+
+    except ImportError:
+        print("PyPDF2 not available, using fallback")
+        return _create_fallback_extraction_data(paper, pdf_path, "PyPDF2 not installed")
+    except Exception as e:
+        print(f"Unexpected error in PDF extraction for {pdf_path}: {e}")
+        return _create_fallback_extraction_data(paper, pdf_path, str(e))
+
+
+def _preprocess_text(text: str) -> str:
+    """Clean and preprocess extracted text."""
+    # Normalize whitespace, drop page numbers and headers, and fix common
+    # PDF extraction issues, while preserving structure
+    for pattern_re, replacement in _PREPROCESS_SUBS:
+        text = pattern_re.sub(replacement, text)
+
+    # Preserve important punctuation and structure
+    text = text.strip()
+
+    return text
+
+
+def _extract_paper_metadata(paper: Dict, text: str) -> Dict[str, Any]:
+    """Extract and enhance paper metadata."""
+    metadata = {}
+
+    # Title - prefer from paper data, fallback to text extraction
+    metadata["title"] = paper.get("title", "") or _extract_title_from_text(text)
+
+    # Authors - parse from string to list
+    metadata["authors"] = _parse_authors(paper.get("authors", ""))
+
+    # Year - ensure integer
+    metadata["year"] = _parse_year(paper.get("year", ""))
+
+    # DOI - clean format
+    doi = paper.get("DOI", "") or _extract_doi_from_text(text)
+    metadata["doi"] = doi.strip() if doi and not pd.isna(doi) else ""
+
+    # Source (journal/conference) - extract from text if not available
+    metadata["source"] = _extract_source_from_text(text)
+
+    # URL - get from paper data
+    urls = _get_paper_urls(paper)
+    metadata["url"] = (
+        urls.get("DOI", "")
+        or urls.get("Article Page", "")
+        or urls.get("Full Text PDF", "")
+    )
+
+    return metadata
+
+
+def _parse_authors(authors_str: str) -> List[str]:
+    """Parse authors string into a list of individual authors."""
+    if not authors_str or pd.isna(authors_str):
+        return []
+
+    cleaned_authors = []
+    for author in _AUTHOR_SPLIT_RE.split(authors_str):
+        # Remove affiliations in parentheses and extra whitespace
+        author = _WHITESPACE_RE.sub(" ", _AFFILIATION_RE.sub("", author)).strip()
+        if len(author) > 1:  # Avoid single characters
+            cleaned_authors.append(author)
+
+    return cleaned_authors
+
+
+def _parse_year(year_value: Any) -> Optional[int]:
+    """Parse year value to integer."""
+    if not year_value or pd.isna(year_value):
+        return None
+
+    try:
+        year_str = str(year_value).strip()
+        # Extract 4-digit year
+        year_match = _YEAR_RE.search(year_str)
+        if year_match:
+            return int(year_match.group())
+        return int(float(year_str))
+    except (ValueError, TypeError):
+        return None
+
+
+def _extract_title_from_text(text: str) -> str:
+    """Extract title from paper text (first meaningful line)."""
+    lines = text.split("\n")
+    for line in lines[:10]:  # Check first 10 lines
+        line = line.strip()
+        if len(line) > 10 and not line.isupper() and not line.isdigit():
+            return line
+    return ""
+
+
+def _extract_doi_from_text(text: str) -> str:
+    """Extract DOI from paper text."""
+    match = _DOI_RE.search(text)
+    return match.group().replace("doi:", "").strip() if match else ""
+
+
+def _extract_source_from_text(text: str) -> str:
+    """Extract journal or conference name from text."""
+    # Look for common patterns
+    for pattern_re in _SOURCE_RES:
+        match = pattern_re.search(text)
+        if match:
+            return match.group(1).strip()
+
+    return ""
+
+
+def _extract_academic_sections(text: str) -> Dict[str, str]:
+    """Extract academic paper sections with improved detection."""
+    sections = {}
+
+    # Split text into chunks - look at both lines and paragraphs
+    lines = text.split("\n")
+    paragraphs = text.split("\n\n")
+
+    # Find section boundaries using a more flexible approach
+    section_starts: Dict[str, int] = {}
+
+    # First pass: Look for obvious section headers in lines
+    for i, line in enumerate(lines):
+        line_clean = line.strip().lower()
+        if len(line_clean) < 3 or len(line_clean) > 150:
+            continue
+
+        is_header = None
+        for section_name, header_re in _SECTION_HEADER_RES.items():
+            # Take the first occurrence of each section
+            if section_name not in section_starts and header_re.search(line_clean):
+                # Verify this looks like a section header
+                if is_header is None:
+                    is_header = _is_section_header(line.strip()) or _is_likely_header(
+                        line.strip()
+                    )
+                if is_header:
+                    section_starts[section_name] = i
+            if section_name in section_starts:
+                break
+
+    # Second pass: Enhanced numbered section detection
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        if len(line_clean) < 5 or len(line_clean) > 100:
+            continue
+
+        match = _NUMBERED_SECTION_RE.match(line_clean)
+        if match:
+            section_title = match.group(2).strip().lower()
+
+            # Find the best match for this section title
+            matched_section = None
+            for key, value in _SECTION_TITLE_MAPPINGS.items():
+                if key in section_title:
+                    matched_section = value
+                    break
+
+            # If we found a match and haven't recorded this section yet
+            if matched_section and matched_section not in section_starts:
+                # Verify this looks like a section header
+                if _is_section_header(line_clean) or len(line_clean.split()) <= 5:
+                    section_starts[matched_section] = i
+
+    # Third pass: Look for sections within paragraph boundaries for cases
+    # where headers aren't clearly separated
+    if len(section_starts) < 3:  # If we found few sections, try paragraph-based search
+        first_lines = [para.split("\n", 1)[0].strip().lower() for para in paragraphs]
+        for section_name, pattern_res in _SECTION_PATTERN_RES.items():
+            if section_name in section_starts:
+                continue
+
+            for pattern_re in pattern_res:
+                for para, first_line in zip(paragraphs, first_lines):
+                    if pattern_re.search(first_line):
+                        # Find line number in original text
+                        para_start = text.find(para)
+                        if para_start != -1:
+                            line_num = text[:para_start].count("\n")
+                            section_starts[section_name] = line_num
+                            break
+
+    # Extract content for each section
+    sorted_sections = sorted(section_starts.items(), key=lambda x: x[1])
+
+    for i, (section_name, start_line) in enumerate(sorted_sections):
+        # Determine end line
+        if i + 1 < len(sorted_sections):
+            end_line = sorted_sections[i + 1][1]
+        else:
+            # For the last section, use the full remaining text
+            end_line = len(lines)
+
+        # Extract section content
+        section_lines = lines[start_line + 1 : end_line]
+        content = "\n".join(section_lines).strip()
+
+        # Clean up content
+        content = _clean_section_content(content)
+
+        # More lenient content filtering - include sections with at least 10 words
+        if content and len(content.split()) >= 10:  # Reduced from 20 to 10 words
+            sections[section_name] = content
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Extracted section '%s' with %d words",
+                    section_name,
+                    len(content.split()),
+                )
+                # Log first and last 50 characters for debugging
+                if len(content) > 100:
+                    logger.debug(
+                        "Section '%s' starts: '%s...'", section_name, content[:50]
+                    )
+                    logger.debug(
+                        "Section '%s' ends: '...%s'", section_name, content[-50:]
+                    )
+                else:
+                    logger.debug("Section '%s' content: '%s'", section_name, content)
+
+    # Special handling for abstract - often appears early without clear header
+    if "abstract" not in sections:
+        abstract_content = _extract_abstract_fallback(text)
+        if abstract_content:
+            sections["abstract"] = abstract_content
+
+    # Add a summary of what was extracted
+    total_extracted = sum(len(content) for content in sections.values())
+
+    # If we didn't extract much content, add a fallback strategy
+    if total_extracted < len(text) * 0.5:  # If we extracted less than 50% of text
+        # Split text into chunks as fallback
+        text_chunks = _split_text_into_chunks(text, chunk_size=2000)
+        for i, chunk in enumerate(text_chunks):
+            if chunk.strip() and len(chunk.split()) >= 20:
+                sections[f"text_chunk_{i+1}"] = chunk.strip()
+
+        # Also try to get the end of the document which might be conclusions
+        lines = text.split("\n")
+        if len(lines) > 50:
+            last_portion = "\n".join(lines[-50:]).strip()  # Last 50 lines
+            if last_portion and len(last_portion.split()) >= 20:
+                sections["document_end"] = last_portion
+
+    return sections
+
+
+def _is_section_header(line: str) -> bool:
+    """Determine if a line is likely a section header."""
+    line = line.strip()
+
+    # Headers are typically short to medium length
+    if len(line) > 150 or len(line) < 3:
+        return False
+
+    # Headers usually have 1-8 words
+    word_count = len(line.split())
+    if not (1 <= word_count <= 8):
+        return False
+
+    # Check if it matches header patterns
+    pattern_match = any(header_re.match(line) for header_re in _HEADER_RES)
+
+    # Headers often don't end with punctuation (except periods after numbers)
+    ends_properly = not line.endswith((",", ";", "!", "?")) or bool(
+        _NUMBER_PERIOD_END_RE.match(line)
+    )
+
+    return pattern_match and ends_properly
+
+
+def _is_likely_header(line: str) -> bool:
+    """Additional checks for section headers with more lenient criteria."""
+    line = line.strip()
+
+    # Check for common header characteristics
+    if len(line) > 150:
+        return False
+
+    # Headers often start with numbers or letters, or end with specific
+    # patterns
+    return any(start_re.search(line) for start_re in _HEADER_START_RES) or any(
+        end_re.search(line) for end_re in _HEADER_END_RES
+    )
+
+
+def _extract_abstract_fallback(text: str) -> str:
+    """Fallback method to extract abstract when no clear header is found."""
+    lines = text.split("\n")
+
+    # Look for abstract-like content in the first few pages
+    for i, line in enumerate(lines[:200]):  # First 200 lines
+        line_clean = line.strip()
+
+        # Skip very short lines, headers, and metadata
+        if (
+            len(line_clean) < 30
+            or line_clean.lower().startswith(
+                (
+                    "keywords",
+                    "doi:",
+                    "published",
+                    "copyright",
+                    "author",
+                    "correspondence",
+                )
+            )
+            or _PAGE_NUMBER_LINE_RE.match(line_clean)
+        ):
+            continue
+
+        # Look for paragraph that looks like an abstract
+        if (
+            len(line_clean) > 100
+            and not line_clean.lower().startswith(
+                ("figure", "table", "section", "chapter")
+            )
+            and len(line_clean.split()) > 15
+        ):
+            # Try to get the full paragraph
+            abstract_lines = [line_clean]
+            j = i + 1
+            while j < len(lines) and j < i + 20:  # Look ahead max 20 lines
+                next_line = lines[j].strip()
+                if len(next_line) < 10:  # Empty or very short line - end of paragraph
+                    break
+                if next_line.lower().startswith(
+                    ("keywords", "introduction", "1.", "doi:")
+                ):
+                    break
+                abstract_lines.append(next_line)
+                j += 1
+
+            abstract_text = " ".join(abstract_lines).strip()
+
+            # Validate it looks like an abstract (50-500 words)
+            word_count = len(abstract_text.split())
+            if 50 <= word_count <= 500:
+                return abstract_text
+
+    return ""
+
+
+def _clean_section_content(content: str) -> str:
+    """Clean extracted section content."""
+    # Remove excessive whitespace, page numbers and artifacts
+    for pattern_re, replacement in _SECTION_CONTENT_SUBS:
+        content = pattern_re.sub(replacement, content)
+
+    return content.strip()
+
+
+def _create_fallback_extraction_data(
+    paper: Dict[str, Any], pdf_path: Path, error_msg: str
+) -> Dict[str, Any]:
+    """Create fallback extraction data when PDF processing fails.
+
+    Args:
+        paper: Paper information dictionary
+        pdf_path: Path to the PDF file
+        error_msg: Error message from failed extraction
+
+    Returns:
+        Fallback extraction data dictionary
+    """
+    return {
+        "title": paper.get("title", "Unknown Title"),
+        "authors": paper.get("authors", "Unknown Authors"),
+        "year": paper.get("year", "Unknown"),
+        "doi": paper.get("doi", ""),
+        "abstract": paper.get("abstract", ""),
+        "source": paper.get("source_queries", ""),
+        "pdf_path": str(pdf_path),
+        "extraction_status": "failed",
+        "error": error_msg,
+        "extracted_at": pd.Timestamp.now().isoformat(),
+        "word_count": 0,
+    }
+
+
+def _split_text_into_chunks(text: str, chunk_size: int = 2000) -> List[str]:
+    """Split text into overlapping chunks as fallback when section extraction fails.
+
+    Args:
+        text: The full text to split
+        chunk_size: Target size for each chunk in characters
+
+    Returns:
+        List of text chunks
+    """
+    chunks = []
+    words = text.split()
+
+    current_chunk: List[str] = []
+    current_length = 0
+
+    for word in words:
+        word_length = len(word) + 1  # +1 for space
+
+        if current_length + word_length > chunk_size and current_chunk:
+            # Save current chunk
+            chunks.append(" ".join(current_chunk))
+
+            # Start new chunk with overlap (last 20% of words)
+            overlap_size = max(1, len(current_chunk) // 5)
+            current_chunk = current_chunk[-overlap_size:]
+            current_length = sum(len(w) + 1 for w in current_chunk)
+
+        current_chunk.append(word)
+        current_length += word_length
+
+    # Add the last chunk
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+
+    return chunks
+
+
+# Papers scoring above this similarity are grouped as potential duplicates
+_DUPLICATE_SIMILARITY_THRESHOLD = 0.6
+
+
+def _normalize_match_text(text: Optional[str]) -> str:
+    """Normalize text for duplicate matching."""
+    if not text:
+        return ""
+    return text.lower().strip().replace(" ", "").replace("-", "").replace("_", "")
+
+
+@dataclass
+class _PaperMatchFields:
+    """Fields of a paper prepared once for pairwise similarity checks.
+
+    The matchers hold the paper as their second sequence, which SequenceMatcher
+    indexes once and reuses when only the first sequence changes.
+    """
+
+    title: str
+    authors: str
+    year: str
+    year_int: Optional[int]
+    doi: str
+    title_matcher: difflib.SequenceMatcher
+    authors_matcher: difflib.SequenceMatcher
+
+
+def _paper_match_fields(paper: Dict[str, Any]) -> _PaperMatchFields:
+    """Prepare the fields of a paper for similarity checks."""
+    title = _normalize_match_text(paper.get("title", ""))
+    authors = _normalize_match_text(paper.get("authors", ""))
+    year = str(paper.get("year", ""))
+    try:
+        year_int: Optional[int] = int(float(year)) if year and year != "Unknown" else 0
+    except (ValueError, TypeError):
+        year_int = None
+    return _PaperMatchFields(
+        title=title,
+        authors=authors,
+        year=year,
+        year_int=year_int,
+        doi=_normalize_match_text(paper.get("doi", "")),
+        title_matcher=difflib.SequenceMatcher(None, "", title),
+        authors_matcher=difflib.SequenceMatcher(None, "", authors),
+    )
+
+
+def _weighted_similarity(title: float, authors: float, year: float) -> float:
+    """Combine field similarities; the title matters most."""
+    return title * 0.6 + authors * 0.3 + year * 0.1
+
+
+def _lcs_ratio(first: str, second: str) -> float:
+    """Compute the longest-common-subsequence ratio of two strings with rapidfuzz.
+
+    SequenceMatcher's matching blocks form a common subsequence, so this is an
+    upper bound of ``SequenceMatcher.ratio()`` that is computed in C.
+    """
+    length = len(first) + len(second)
+    if not length:
+        return 1.0
+    distance: int = Indel.distance(first, second)
+    return (length - distance) / length
+
+
+def _paper_similarity(
+    first: _PaperMatchFields, second: _PaperMatchFields, threshold: float = -1.0
+) -> float:
+    """Calculate the similarity score of two papers.
+
+    Pairs whose score cannot exceed ``threshold`` are rejected with 0.0 using
+    cheap upper bounds, from rapidfuzz when it is installed and otherwise from
+    SequenceMatcher, before computing exact ratios.
+    """
+    if first.doi and first.doi == second.doi:
+        return 1.0  # Same DOI = definitely same paper
+
+    # Year similarity (exact match or close)
+    if first.year == second.year:
+        year_similarity = 1.0
+    elif first.year_int is None or second.year_int is None:
+        year_similarity = 0.0
+    else:
+        year_similarity = 0.8 if abs(first.year_int - second.year_int) <= 2 else 0.0
+
+    title_matcher = second.title_matcher
+    title_matcher.set_seq1(first.title)
+    authors_matcher = second.authors_matcher
+    authors_matcher.set_seq1(first.authors)
+
+    upper_bound = _weighted_similarity(
+        title_matcher.real_quick_ratio(),
+        authors_matcher.real_quick_ratio(),
+        year_similarity,
+    )
+    if upper_bound <= threshold:
+        return 0.0
+    if Indel is not None:
+        # Tighter than quick_ratio() and computed in C
+        upper_bound = _weighted_similarity(
+            _lcs_ratio(first.title, second.title),
+            _lcs_ratio(first.authors, second.authors),
+            year_similarity,
+        )
+    else:
+        upper_bound = _weighted_similarity(
+            title_matcher.quick_ratio(),
+            authors_matcher.quick_ratio(),
+            year_similarity,
+        )
+    if upper_bound <= threshold:
+        return 0.0
+    return _weighted_similarity(
+        title_matcher.ratio(), authors_matcher.ratio(), year_similarity
+    )
+
+
+# Papers compared against all others per batch when finding duplicate candidates
+_SIMILARITY_BATCH_SIZE = 512
+
+
+def _similarity_candidates(
+    match_fields: List[_PaperMatchFields], threshold: float
+) -> Optional[List[Set[int]]]:
+    """Find, for each paper, the papers whose similarity may exceed ``threshold``.
+
+    Title and author bounds of all pairs are computed with rapidfuzz's
+    multithreaded ``cdist``, a batch of rows at a time. The year is assumed
+    to match, and a small slack covers cdist's float32 scores, so no pair
+    above the threshold is missed; papers sharing a DOI are always candidates.
+
+    Returns:
+        Candidate indices per paper, or None if rapidfuzz is not installed
+    """
+    if rapidfuzz_process is None:
+        return None
+
+    titles = [fields.title for fields in match_fields]
+    authors = [fields.authors for fields in match_fields]
+    cutoff = threshold - 0.1 - 1e-6
+    candidates: List[Set[int]] = []
+    for start in range(0, len(match_fields), _SIMILARITY_BATCH_SIZE):
+        end = start + _SIMILARITY_BATCH_SIZE
+        title_bounds = rapidfuzz_process.cdist(
+            titles[start:end], titles, scorer=Indel.normalized_similarity, workers=-1
+        )
+        author_bounds = rapidfuzz_process.cdist(
+            authors[start:end], authors, scorer=Indel.normalized_similarity, workers=-1
+        )
+        for row in title_bounds * 0.6 + author_bounds * 0.3 > cutoff:
+            candidates.append(set(row.nonzero()[0].tolist()))
+
+    by_doi: Dict[str, List[int]] = {}
+    for i, fields in enumerate(match_fields):
+        if fields.doi:
+            by_doi.setdefault(fields.doi, []).append(i)
+    for indices in by_doi.values():
+        for i in indices:
+            candidates[i].update(indices)
+    return candidates
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """JSON provider serializing API responses with orjson.
+
+    Calls with extra arguments, such as the ``tojson`` template filter, keep
+    using the stdlib json module so rendered pages are unchanged. Unlike the
+    stdlib, orjson writes NaN as null, which browsers can parse.
+    """
+
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+        if orjson is not None
+        else 0
+    )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON."""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize data as JSON."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> FlaskResponse:
+        """Serialize the given arguments as JSON into a response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._OPTIONS)
+        return FlaskResponse(body + b"\n", mimetype=self.mimetype)
+
+
+class PapervisorWebServer:
+    """Web server for managing PDF downloads and viewing status."""
+
+    def __init__(self, project_id: Optional[str] = None, data_dir: str = "data"):
+        """Initialize the web server.
+
+        Args:
+            project_id: Literature review project ID (None for multi-project mode)
+            data_dir: Data directory path
+        """
+        self.project_id = project_id
+        self.data_dir = Path(data_dir)
+
+        # Initialize Papervisor
+        self.papervisor = Papervisor(data_dir)
+
+        # If project_id is provided, validate it exists
+        self.project = None
+        if project_id:
+            self.project = self.papervisor.get_project(project_id)
+            if not self.project:
+                raise ValueError(f"Project '{project_id}' not found")
+
+        # Diagnostics are logged at DEBUG level, e.g. PAPERVISOR_LOG_LEVEL=DEBUG
+        log_level = os.environ.get("PAPERVISOR_LOG_LEVEL")
+        if log_level:
+            if log_level.upper() in logging.getLevelNamesMapping():
+                logging.basicConfig()
+                logger.setLevel(log_level.upper())
+            else:
+                warnings.warn(
+                    f"Unknown PAPERVISOR_LOG_LEVEL={log_level!r}; "
+                    "keeping the default log level.",
+                    UserWarning,
+                )
+
+        # Initialize Flask app
+        template_dir = Path(__file__).parent / "templates"
+        self.app = Flask(__name__, template_folder=str(template_dir))
+        if orjson is not None:
+            self.app.json = _OrjsonProvider(self.app)
+        # Let a front-end server (e.g. Apache mod_xsendfile) transfer PDFs
+        self.app.config["USE_X_SENDFILE"] = os.environ.get(
+            "PAPERVISOR_USE_X_SENDFILE", ""
+        ).lower() in ("1", "true", "yes")
+        # nginx location (marked ``internal``) aliased to the data directory;
+        # when set, extracted texts are handed to nginx with X-Accel-Redirect
+        self.app.config["X_ACCEL_PREFIX"] = os.environ.get(
+            "PAPERVISOR_X_ACCEL_PREFIX", ""
+        ).rstrip("/")
+        self.app.config["MAX_CONTENT_LENGTH"] = _max_upload_size()
+        # Use environment variable for secret key, fallback to warning
+        self.app.secret_key = os.environ.get(
+            "PAPERVISOR_SECRET_KEY",
+            "papervisor_secret_key_change_in_production",  # nosec B105
+        )
+        if (
+            self.app.secret_key
+            == "papervisor_secret_key_change_in_production"  # nosec B105
+        ):
+            warnings.warn(
+                "WARNING: Using default secret key! Set PAPERVISOR_SECRET_KEY in production.",
+                UserWarning,
+            )
+
+        # Initialize progress tracking for downloads
+        self.progress: Dict[str, DownloadProgress] = {}
+
+        # Similarity groups for the review page, by consolidated file version
+        self._review_groups: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = {}
+        self._review_groups_lock = threading.Lock()
+
+        # Serializes updates of screening_results.json by concurrent screenings
+        self._screening_results_lock = threading.Lock()
+
+        # Setup routes
+        self._setup_routes()
+
+    @property
+    def project_path(self) -> Path:
+        """Get project path as Path object."""
+        if self.project is None:
+            raise ValueError("Project is not initialized")
+        return self.data_dir / self.project.project_path
+
+    def _setup_routes(self) -> None:
+        """Setup Flask routes."""
+
+        @self.app.route("/")
+        def index() -> WerkzeugResponse:
+            """Main landing page - show projects list or redirect to single project."""
+            if self.project_id:
+                # Single project mode - redirect to review page
+                return redirect(url_for("review_papers", project_id=self.project_id))
+            else:
+                # Multi-project mode - show landing page
+                return redirect(url_for("landing_page"))
+
+        @self.app.route("/projects")
+        def landing_page() -> Union[str, WerkzeugResponse]:
+            """Landing page showing all literature review projects."""
+            try:
+                # Get all projects
+                projects = self.papervisor.list_projects()
+
+                etag = _page_etag(self._landing_page_files(projects))
+                not_modified = _not_modified_response(etag)
+                if not_modified is not None:
+                    return not_modified
+
+                # Prepare project data with statistics; projects only touch
+                # their own files, so they are loaded concurrently
+                project_queries: Dict[str, List[Any]] = {}
+                project_stats: Dict[str, Dict[str, Any]] = {}
+                query_stats: Dict[str, Dict[str, Any]] = {}
+
+                if projects:
+                    workers = min(_LANDING_PAGE_WORKERS, len(projects))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        for project, (queries, stats, queries_stats) in zip(
+                            projects, executor.map(self._build_project_stats, projects)
+                        ):
+                            project_queries[project.project_id] = queries
+                            project_stats[project.project_id] = stats
+                            query_stats[project.project_id] = queries_stats
+
+                return _cacheable_response(
+                    render_template(
+                        "landing.html",
+                        projects=projects,
+                        project_queries=project_queries,
+                        project_stats=project_stats,
+                        query_stats=query_stats,
+                    ),
+                    etag,
+                )
+
+            except Exception as e:
+                return render_template("error.html", error=str(e))
+
+        @self.app.route("/consolidate", methods=["POST"])
+        def consolidate_project() -> WerkzeugResponse:
+            """Consolidate queries for a project."""
+            try:
+                project_id = request.form.get("project_id")
+                if not project_id:
+                    flash("Project ID is required", "error")
+                    return redirect(url_for("landing_page"))
+
+                # Consolidate the project
+                self.papervisor.consolidate_project_csvs(project_id)
+                flash(f"Project '{project_id}' consolidated successfully!", "success")
+
+                return redirect(url_for("landing_page"))
+
+            except Exception as e:
+                flash(f"Error consolidating project: {str(e)}", "error")
+                return redirect(url_for("landing_page"))
+
+        @self.app.route("/project/<project_id>")
+        def project_dashboard(project_id: str) -> WerkzeugResponse:
+            """Redirect to review papers page for a specific project."""
+            return redirect(url_for("review_papers", project_id=project_id))
+
+        # Legacy single-project routes (for backward compatibility)
+        @self.app.route("/review")
+        def review_papers_legacy() -> WerkzeugResponse:
+            """Legacy route for review papers - redirect to project-specific route."""
+            if not self.project_id:
+                return redirect(url_for("landing_page"))
+            return redirect(url_for("review_papers", project_id=self.project_id))
+
+        @self.app.route("/downloads")
+        def download_management_legacy() -> WerkzeugResponse:
+            """Legacy route - redirect to project-specific download management."""
+            if not self.project_id:
+                return redirect(url_for("landing_page"))
+            return redirect(url_for("download_management", project_id=self.project_id))
+
+        @self.app.route("/project/<project_id>/review")
+        def review_papers(
+            project_id: Optional[str] = None,
+        ) -> Union[str, WerkzeugResponse]:
+            """Page 1: Review and clean consolidated papers."""
+            try:
+                # Use provided project_id or fallback to instance project_id
+                current_project_id = project_id or self.project_id
+                if not current_project_id:
+                    return make_response(
+                        render_template("error.html", error="No project specified")
+                    )
+
+                # Get the project
+                current_project = self.papervisor.get_project(current_project_id)
+                if not current_project:
+                    return make_response(
+                        render_template(
+                            "error.html",
+                            error=f"Project '{current_project_id}' not found",
+                        )
+                    )
+
+                # Get project path
+                project_path = self.data_dir / current_project.project_path
+
+                # Load consolidated papers data
+                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
+                if not consolidated_path.exists():
+                    return make_response(
+                        render_template(
+                            "error.html",
+                            error=(
+                                "No consolidated papers file found. "
+                                "Please run the consolidation process first."
+                            ),
+                        )
+                    )
+
+                etag = _page_etag([consolidated_path])
+                not_modified = _not_modified_response(etag)
+                if not_modified is not None:
+                    return not_modified
+
+                # Group papers by similarity
+                grouped_papers = self._review_paper_groups(consolidated_path)
+
+                return _cacheable_response(
+                    render_template(
+                        "review_papers.html",
+                        project_id=current_project_id,
+                        paper_groups=grouped_papers,
+                        total_papers=sum(g["group_size"] for g in grouped_papers),
+                    ),
+                    etag,
+                )
+
+            except Exception as e:
+                return render_template("error.html", error=str(e))
+
+        @self.app.route("/downloads")
+        @self.app.route("/project/<project_id>/downloads")
+        def download_management(
+            project_id: Optional[str] = None,
+        ) -> Union[str, WerkzeugResponse]:
+            """Page 2: Download management and status."""
+            try:
+                # Use provided project_id or fallback to instance project_id
+                current_project_id = project_id or self.project_id
+                if not current_project_id:
+                    return render_template("error.html", error="No project specified")
+
+                # Get the project
+                current_project = self.papervisor.get_project(current_project_id)
+                if not current_project:
+                    return render_template(
+                        "error.html", error=f"Project '{current_project_id}' not found"
+                    )
+
+                # Get project path
+                project_path = self.data_dir / current_project.project_path
+
+                # Load consolidated papers data
+                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
+                if not consolidated_path.exists():
+                    return render_template(
+                        "error.html",
+                        error=(
+                            "No consolidated papers file found. "
+                            "Please run the download process first."
+                        ),
+                    )
+
+                pdfs_dir = project_path / "pdfs"
+                etag = _page_etag(
+                    [
+                        consolidated_path,
+                        pdfs_dir / "automatic",
+                        pdfs_dir / "automatic" / "reports",
+                        pdfs_dir / "manual",
+                    ]
+                )
+                not_modified = _not_modified_response(etag)
+                if not_modified is not None:
+                    return not_modified
+
+                papers_df = _normalize_papers(_load_consolidated(consolidated_path))
+
+                # Filter out duplicates - only show papers that are NOT marked
+                # as duplicates
+                is_duplicate = papers_df["is_duplicate"].astype(bool)
+                non_duplicate_papers = papers_df[~is_duplicate]
+                logger.debug("Total papers before duplicate filter: %d", len(papers_df))
+                logger.debug("Total duplicates marked: %d", is_duplicate.sum())
+                logger.debug(
+                    "Total papers after duplicate filter: %d",
+                    len(non_duplicate_papers),
+                )
+
+                # Load download status from reports
+                download_stats = _download_stats(project_path)
+
+                # Downloaded files with their sources, by paper ID
+                downloads_by_paper = _download_index(project_path)
+
+                # Map each original paper to its duplicates and merge their
+                # source queries for traceability
+                duplicate_info, merged_source_queries = _group_duplicates(papers_df)
+
+                # Prepare papers data for template (only non-duplicates)
+                papers_data = _paper_view(non_duplicate_papers).to_dict(
+                    orient="records"
+                )
+                for paper in papers_data:
+                    paper_id = paper["paper_id"]
+                    idx_int = int(paper_id)
+
+                    # Use merged source queries if this paper has duplicates,
+                    # otherwise use original
+                    if idx_int in merged_source_queries:
+                        paper["source_queries"] = ",".join(
+                            sorted(merged_source_queries[idx_int])
+                        )
+
+                    # Check if downloaded and determine source
+                    file_info = downloads_by_paper.get(paper_id)
+                    is_downloaded = file_info is not None
+                    downloaded_file = file_info["filename"] if file_info else None
+                    download_source = file_info["source"] if file_info else None
+
+                    # Add duplicate traceability information
+                    has_duplicates = idx_int in duplicate_info
+                    duplicate_count = (
+                        len(duplicate_info.get(idx_int, [])) if has_duplicates else 0
+                    )
+
+                    paper.update(
+                        {
+                            "is_downloaded": is_downloaded,
+                            "downloaded_file": downloaded_file,
+                            "download_source": download_source,  # 'automatic' or
+                            # 'manual'
+                            "has_duplicates": has_duplicates,
                             "duplicate_count": duplicate_count,
                             "auto_download_failed": (
                                 not is_downloaded and download_source is None
@@ -560,16 +2423,23 @@ class PapervisorWebServer:
                         }
                     )
 
-                return render_template(
-                    "dashboard.html",
-                    project_id=current_project_id,
-                    papers=papers_data,
-                    download_stats=download_stats,
-                    total_papers=len(papers_data),
-                    downloaded_count=sum(1 for p in papers_data if p["is_downloaded"]),
-                    manual_count=sum(1 for p in papers_data if not p["is_downloaded"]),
-                    total_papers_in_file=len(papers_df),
-                    total_after_duplicate_filter=len(non_duplicate_papers),
+                return _cacheable_response(
+                    render_template(
+                        "dashboard.html",
+                        project_id=current_project_id,
+                        papers=papers_data,
+                        download_stats=download_stats,
+                        total_papers=len(papers_data),
+                        downloaded_count=sum(
+                            1 for p in papers_data if p["is_downloaded"]
+                        ),
+                        manual_count=sum(
+                            1 for p in papers_data if not p["is_downloaded"]
+                        ),
+                        total_papers_in_file=len(papers_df),
+                        total_after_duplicate_filter=len(non_duplicate_papers),
+                    ),
+                    etag,
                 )
 
             except Exception as e:
@@ -609,9 +2479,10 @@ class PapervisorWebServer:
 
                 # Load the paper data
                 consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                papers_df = pd.read_csv(consolidated_path)
+                papers_df = _load_consolidated(consolidated_path)
 
-                if int(float(paper_id)) >= len(papers_df):
+                paper_idx = _paper_index(paper_id)
+                if paper_idx is None or paper_idx >= len(papers_df):
                     flash("Invalid paper ID.", "error")
                     if project_id:
                         return redirect(
@@ -620,7 +2491,7 @@ class PapervisorWebServer:
                     else:
                         return redirect(url_for("download_management"))
 
-                paper = papers_df.iloc[int(float(paper_id))]
+                paper = papers_df.iloc[paper_idx]
 
                 # Try to download from the submitted URL
                 result = self._download_from_url(
@@ -674,6 +2545,16 @@ class PapervisorWebServer:
                 # Start download in background thread
                 self._start_download_process(current_project_id, retry_failed=False)
 
+                # The dashboard follows progress over the event stream, so
+                # script requests do not need the page re-rendered
+                if (
+                    request.accept_mimetypes.best_match(
+                        ["application/json", "text/html"]
+                    )
+                    == "application/json"
+                ):
+                    return make_response(jsonify({"started": True}), 202)
+
                 flash("Download process started. Check progress below.", "info")
 
                 # Redirect to the appropriate download management page
@@ -717,33 +2598,13 @@ class PapervisorWebServer:
                 project_path = self.data_dir / current_project.project_path
 
                 consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                papers_df = pd.read_csv(consolidated_path)
+                papers_details = _paper_details(consolidated_path)
 
-                if int(float(paper_id)) >= len(papers_df):
+                paper_idx = _paper_index(paper_id)
+                if paper_idx is None or paper_idx >= len(papers_details):
                     return jsonify({"error": "Invalid paper ID"}), 404
 
-                paper = papers_df.iloc[int(float(paper_id))]
-
-                # Helper function to safely get string values
-                def safe_get(value: Any) -> str:
-                    if pd.isna(value):
-                        return ""
-                    return str(value)
-
-                return jsonify(
-                    {
-                        "paper_id": paper_id,
-                        "title": safe_get(paper.get("title", paper.get("Title", ""))),
-                        "authors": safe_get(
-                            paper.get("authors", paper.get("Authors", ""))
-                        ),
-                        "year": safe_get(paper.get("year", paper.get("Year", ""))),
-                        "doi": safe_get(paper.get("DOI", "")),
-                        "abstract": safe_get(paper.get("Abstract", "")),
-                        "source_queries": safe_get(paper.get("source_queries", "")),
-                        "urls": self._get_paper_urls(paper),
-                    }
-                )
+                return jsonify({"paper_id": paper_id, **papers_details[paper_idx]})
 
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
@@ -784,7 +2645,9 @@ class PapervisorWebServer:
                     consolidated_path = (
                         project_path / "pdfs" / "consolidated_papers.csv"
                     )
-                    papers_df = pd.read_csv(consolidated_path)
+                    # A real copy, as the marks below are written in place
+                    # and must not reach the cached frame if saving fails
+                    papers_df = _load_consolidated(consolidated_path).copy()
 
                     # Add columns if they don't exist
                     if "is_duplicate" not in papers_df.columns:
@@ -792,27 +2655,35 @@ class PapervisorWebServer:
                     if "duplicate_of" not in papers_df.columns:
                         papers_df["duplicate_of"] = ""
 
-                    # Mark papers as duplicates and set reference IDs
+                    # Work out the new (is_duplicate, duplicate_of) of each
+                    # affected paper; later mappings override earlier ones
+                    updates: Dict[int, Tuple[bool, str]] = {}
                     for paper_id, reference_id in duplicate_mappings.items():
-                        try:
-                            idx = int(float(paper_id))  # Handle float values from CSV
-                            ref_idx = int(float(reference_id))  # Handle float values
-                            # from CSV
-                        except (ValueError, TypeError) as e:
+                        # IDs may be written as floats in the CSV ("3.0")
+                        idx = _paper_index(paper_id)
+                        ref_idx = _paper_index(reference_id)
+                        if idx is None or ref_idx is None:
                             print(
                                 f"Error converting IDs: paper_id='{paper_id}', "
-                                f"reference_id='{reference_id}': {e}"
+                                f"reference_id='{reference_id}'"
                             )
                             continue
 
                         # Validate indices
                         if idx < len(papers_df) and ref_idx < len(papers_df):
-                            papers_df.loc[idx, "is_duplicate"] = True
-                            papers_df.loc[idx, "duplicate_of"] = reference_id
-
+                            updates[idx] = (True, reference_id)
                             # Ensure the reference paper is not marked as duplicate
-                            papers_df.loc[ref_idx, "is_duplicate"] = False
-                            papers_df.loc[ref_idx, "duplicate_of"] = ""
+                            updates[ref_idx] = (False, "")
+
+                    # Mark papers as duplicates and set reference IDs at once
+                    if updates:
+                        rows = list(updates)
+                        papers_df.loc[rows, "is_duplicate"] = [
+                            is_duplicate for is_duplicate, _ in updates.values()
+                        ]
+                        papers_df.loc[rows, "duplicate_of"] = [
+                            duplicate_of for _, duplicate_of in updates.values()
+                        ]
 
                     # Save the updated CSV
                     papers_df.to_csv(consolidated_path, index=False)
@@ -872,41 +2743,47 @@ class PapervisorWebServer:
 
                 # Use relative path from the project directory
                 pdf_dir = project_path / "pdfs" / source
-                print(f"Looking for PDF in directory: {pdf_dir}")
-                print(f"Requested filename: {filename}")
-
-                if not pdf_dir.exists():
-                    print(f"Directory does not exist: {pdf_dir}")
-                    return f"Directory not found: {pdf_dir}", 404
+                logger.debug("Looking for PDF in directory: %s", pdf_dir)
+                logger.debug("Requested filename: %s", filename)
 
                 pdf_file = pdf_dir / filename
-                print(f"Full PDF path: {pdf_file}")
+                logger.debug("Full PDF path: %s", pdf_file)
 
-                if not pdf_file.exists():
-                    print(f"File does not exist: {pdf_file}")
+                # A single stat on the happy path; the directory is only
+                # checked to report what is missing
+                try:
+                    pdf_file.stat()
+                except (FileNotFoundError, NotADirectoryError):
+                    if not pdf_dir.exists():
+                        logger.debug("Directory does not exist: %s", pdf_dir)
+                        return f"Directory not found: {pdf_dir}", 404
+                    logger.debug("File does not exist: %s", pdf_file)
                     # List all files in the directory for debugging
-                    try:
-                        files_in_dir = list(pdf_dir.glob("*.pdf"))
-                        print(
-                            f"Available PDF files in {pdf_dir}: "
-                            f"{[f.name for f in files_in_dir]}"
-                        )
-                    except Exception as e:
-                        print(f"Error listing files: {e}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        try:
+                            logger.debug(
+                                "Available PDF files in %s: %s",
+                                pdf_dir,
+                                list(_list_pdfs(pdf_dir)),
+                            )
+                        except OSError as e:
+                            logger.debug("Error listing files: %s", e)
                     return f"File not found: {filename}", 404
 
-                print(f"Serving PDF file: {pdf_file}")
+                logger.debug("Serving PDF file: %s", pdf_file)
                 # Use the parent directory and filename separately for
                 # send_from_directory
                 # This ensures Flask can serve the file regardless of the
                 # installation path
-                return send_from_directory(str(pdf_dir.absolute()), filename)
+                return send_from_directory(
+                    str(pdf_dir.absolute()),
+                    filename,
+                    conditional=True,
+                    max_age=_PDF_MAX_AGE,
+                )
 
             except Exception as e:
-                print(f"Error in serve_pdf: {e}")
-                import traceback
-
-                traceback.print_exc()
+                logger.exception("Error in serve_pdf")
                 return f"Error serving file: {str(e)}", 500
 
         @self.app.route("/text_extraction")
@@ -929,11 +2806,8 @@ class PapervisorWebServer:
                 project_data_dir = self.data_dir / project.project_path
 
                 # Get papers data - use the correct path for this project
-                consolidated_path = (
-                    project_data_dir / "pdfs" / "consolidated_papers.csv"
-                )
-
-                if not consolidated_path.exists():
+                papers_df = _load_project_papers(project_data_dir)
+                if papers_df is None:
                     flash(
                         "No papers data found. Please complete the review process "
                         "first.",
@@ -943,62 +2817,24 @@ class PapervisorWebServer:
                         url_for("download_management", project_id=project_id)
                     )
 
-                papers_df = pd.read_csv(consolidated_path)
-
                 # Filter out duplicates - only show non-duplicate papers
-                if "is_duplicate" in papers_df.columns:
-                    non_duplicate_papers = papers_df[
-                        ~papers_df["is_duplicate"].fillna(False)
-                    ].copy()
-                else:
-                    non_duplicate_papers = papers_df.copy()
+                non_duplicate_papers = _non_duplicates(papers_df)
 
                 # Create a data structure that matches what the downloads page creates
-                downloaded_files_info = self._get_downloaded_files_with_source(
-                    project_data_dir
-                )
-                downloaded_files = [info["filename"] for info in downloaded_files_info]
-
-                papers_data: List[Dict[str, Any]] = []
-                for idx, paper in non_duplicate_papers.iterrows():
-                    paper_id = str(idx)
+                downloads_by_paper = _download_index(project_data_dir)
 
-                    # Check if downloaded and determine source
-                    filename_pattern = f"{paper_id}_"
-                    is_downloaded = any(
-                        f.startswith(filename_pattern) for f in downloaded_files
-                    )
-
-                    # Find the downloaded file and its source
-                    downloaded_file = None
-                    download_source = None
-                    for file_info in downloaded_files_info:
-                        if file_info["filename"].startswith(filename_pattern):
-                            downloaded_file = file_info["filename"]
-                            download_source = file_info["source"]
-                            break
-
-                    if is_downloaded:
-                        papers_data.append(
-                            {
-                                "paper_id": idx,
-                                "title": paper.get(
-                                    "title", paper.get("Title", "Unknown Title")
-                                ),
-                                "authors": paper.get(
-                                    "authors", paper.get("Authors", "Unknown Authors")
-                                ),
-                                "year": paper.get("year", paper.get("Year", "Unknown")),
-                                "is_downloaded": is_downloaded,
-                                "downloaded_file": downloaded_file,
-                                "download_source": download_source,
-                            }
-                        )
+                papers_view = _normalize_papers(non_duplicate_papers)
+                papers_data = _downloaded_paper_records(
+                    papers_view[["title", "authors", "year"]], downloads_by_paper
+                )
+                for paper_dict in papers_data:
+                    paper_dict["is_downloaded"] = True
 
                 # Load extraction status
                 extraction_status = self._load_extraction_status(project_data_dir)
 
                 # Add extraction status to papers
+                missing_metrics: List[Tuple[Dict[str, Any], Path]] = []
                 for paper_dict in papers_data:
                     paper_id = str(paper_dict["paper_id"])
                     if paper_id in extraction_status:
@@ -1007,66 +2843,14 @@ class PapervisorWebServer:
                             "status", "pending"
                         )
 
-                        # Convert section abbreviations to full names
-                        raw_sections = status.get("sections", [])
-                        section_names_map = {
-                            "abstract": "Abstract",
-                            "introduction": "Introduction",
-                            "intro": "Introduction",
-                            "methods": "Methods",
-                            "methodology": "Methodology",
-                            "results": "Results",
-                            "discussion": "Discussion",
-                            "conclusion": "Conclusion",
-                            "conclusions": "Conclusion",
-                            "references": "References",
-                            "bibliography": "References",
-                            "literature_review": "Literature Review",
-                            "literature": "Literature Review",
-                            "background": "Background",
-                            "related": "Related Work",
-                            "evaluation": "Evaluation",
-                            "experiment": "Experiments",
-                            "experiments": "Experiments",
-                            "analysis": "Analysis",
-                            "limitations": "Limitations",
-                            "future": "Future Work",
-                            "future_work": "Future Work",
-                            "forecasting": "Forecasting",
-                            "scheduling": "Scheduling",
-                            "optimization": "Optimization",
-                            "modeling": "Modeling",
-                            "modelling": "Modeling",
-                            "simulation": "Simulation",
-                            "case_study": "Case Study",
-                            "implementation": "Implementation",
-                            "validation": "Validation",
-                            "problem_definition": "Problem Definition",
-                            "data_analysis": "Data Analysis",
-                            "acknowledgments": "Acknowledgments",
-                            "acknowledgements": "Acknowledgments",
-                        }
-
-                        readable_sections = []
-                        for section in raw_sections:
-                            section_lower = section.lower()
-                            # Try exact match first
-                            if section_lower in section_names_map:
-                                readable_sections.append(
-                                    section_names_map[section_lower]
-                                )
-                            # Try partial match
-                            else:
-                                found = False
-                                for key, value in section_names_map.items():
-                                    if key in section_lower or section_lower in key:
-                                        readable_sections.append(value)
-                                        found = True
-                                        break
-                                if not found:
-                                    # Capitalize the original section name
-                                    readable_sections.append(section.title())
-
+                        # Full section names are stored at extraction time;
+                        # entries written before that are converted here
+                        readable_sections = status.get("readable_sections")
+                        if readable_sections is None:
+                            readable_sections = [
+                                _readable_section_name(section)
+                                for section in status.get("sections", [])
+                            ]
                         paper_dict["extracted_sections"] = readable_sections
                         paper_dict["json_file"] = status.get("json_file", "")
                         paper_dict["screening_action"] = status.get(
@@ -1099,71 +2883,13 @@ class PapervisorWebServer:
 
                         # If we don't have quality metrics, try to load from JSON file
                         if paper_dict["text_length"] == 0 and paper_dict["json_file"]:
-                            try:
-                                json_path = (
-                                    project_data_dir
-                                    / "pdfs"
-                                    / "extracted_texts"
-                                    / paper_dict["json_file"]
-                                )
-                                if json_path.exists():
-                                    with open(json_path, "r", encoding="utf-8") as f:
-                                        data = json.load(f)
-                                        metadata = data.get("extraction_metadata", {})
-                                        paper_dict["text_length"] = metadata.get(
-                                            "text_length", 0
-                                        )
-                                        paper_dict["pages_count"] = metadata.get(
-                                            "total_pages", 0
-                                        )
-                                        paper_dict["raw_text_chars"] = metadata.get(
-                                            "raw_text_chars", 0
-                                        )
-                                        paper_dict["section_text_chars"] = metadata.get(
-                                            "section_text_chars", 0
-                                        )
-                                        paper_dict["section_extraction_percentage"] = (
-                                            metadata.get(
-                                                "section_extraction_percentage", 0
-                                            )
-                                        )
-
-                                        # Calculate word count from sections
-                                        total_words = 0
-                                        for section_name in [
-                                            "abstract",
-                                            "introduction",
-                                            "methods",
-                                            "results",
-                                            "discussion",
-                                            "conclusion",
-                                        ]:
-                                            section_text = data.get(section_name, "")
-                                            if section_text:
-                                                total_words += len(section_text.split())
-
-                                        # Add words from additional sections
-                                        additional_sections = data.get(
-                                            "additional_sections", {}
-                                        )
-                                        for (
-                                            section_text
-                                        ) in additional_sections.values():
-                                            if section_text:
-                                                total_words += len(section_text.split())
-
-                                        paper_dict["word_count"] = total_words
-                                        paper_dict["character_count"] = paper_dict[
-                                            "text_length"
-                                        ]
-                            except Exception as e:
-                                print(
-                                    f"Error loading quality metrics for paper "
-                                    f"{paper_id}: {e}"
-                                )
-                                paper_dict["word_count"] = 0
-                                paper_dict["character_count"] = 0
-                                paper_dict["pages_count"] = 0
+                            json_path = (
+                                project_data_dir
+                                / "pdfs"
+                                / "extracted_texts"
+                                / paper_dict["json_file"]
+                            )
+                            missing_metrics.append((paper_dict, json_path))
                     else:
                         paper_dict["extraction_status"] = "pending"
                         paper_dict["extracted_sections"] = []
@@ -1177,6 +2903,29 @@ class PapervisorWebServer:
                         paper_dict["section_text_chars"] = 0
                         paper_dict["section_extraction_percentage"] = 0
 
+                # Read the missing quality metrics concurrently; the reads are
+                # I/O bound
+                if missing_metrics:
+                    workers = min(_TEXT_METRICS_WORKERS, len(missing_metrics))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(_text_metrics, json_path)
+                            for _, json_path in missing_metrics
+                        ]
+                        for (paper_dict, _), future in zip(missing_metrics, futures):
+                            try:
+                                paper_dict.update(future.result())
+                            except FileNotFoundError:
+                                continue
+                            except Exception as e:
+                                print(
+                                    f"Error loading quality metrics for paper "
+                                    f"{paper_dict['paper_id']}: {e}"
+                                )
+                                paper_dict["word_count"] = 0
+                                paper_dict["character_count"] = 0
+                                paper_dict["pages_count"] = 0
+
                 # Calculate KPIs
                 total_papers = len(papers_data)
                 processed_success = len(
@@ -1201,14 +2950,25 @@ class PapervisorWebServer:
                     ]
                 )
 
-                return render_template(
-                    "text_extraction.html",
-                    project_id=project_id,
-                    papers=papers_data,
-                    total_papers=total_papers,
-                    processed_success=processed_success,
-                    processed_partial=processed_partial,
-                    processed_failed=processed_failed,
+                # Stream the page, which has one row per paper. Flashed
+                # messages are taken from the session now, as the session is
+                # saved before the streamed body is rendered. Everything that
+                # can fail is loaded above, inside this try block; once the
+                # body streams, the status line has been sent, so a template
+                # error can only end the page early and is logged by the
+                # WSGI server instead of redirecting
+                flashed_messages = get_flashed_messages(with_categories=True)
+                return FlaskResponse(
+                    stream_template(
+                        "text_extraction.html",
+                        flashed_messages=flashed_messages,
+                        project_id=project_id,
+                        papers=papers_data,
+                        total_papers=total_papers,
+                        processed_success=processed_success,
+                        processed_partial=processed_partial,
+                        processed_failed=processed_failed,
+                    )
                 )
 
             except Exception as e:
@@ -1243,57 +3003,27 @@ class PapervisorWebServer:
                     )
 
                 project_path = self.data_dir / "literature_reviews" / project_id
-                if not project_path.exists():
-                    return (
-                        jsonify({"status": "error", "message": "Project not found"}),
-                        404,
-                    )
-
-                # Get papers data
-                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                papers_df = pd.read_csv(consolidated_path)
+                papers_df = _load_project_papers(project_path)
+                if papers_df is None:
+                    return _missing_project_papers_response(project_path)
 
                 # Filter out duplicates and get downloaded papers
-                if "is_duplicate" in papers_df.columns:
-                    non_duplicate_papers = papers_df[
-                        ~papers_df["is_duplicate"].fillna(False)
-                    ].copy()
-                else:
-                    non_duplicate_papers = papers_df.copy()
+                non_duplicate_papers = _non_duplicates(papers_df)
 
-                downloaded_files_info = self._get_downloaded_files_with_source(
-                    project_path
-                )
-                downloaded_files = [info["filename"] for info in downloaded_files_info]
-
-                papers_to_extract = []
-                for idx, paper in non_duplicate_papers.iterrows():
-                    paper_id = str(idx)
-                    filename_pattern = f"{paper_id}_"
-                    is_downloaded = any(
-                        f.startswith(filename_pattern) for f in downloaded_files
-                    )
+                downloads_by_paper = _download_index(project_path)
 
-                    if is_downloaded:
-                        # Find the downloaded file and its source
-                        for file_info in downloaded_files_info:
-                            if file_info["filename"].startswith(filename_pattern):
-                                paper_dict = paper.to_dict()
-                                paper_dict["paper_id"] = idx
-                                paper_dict["downloaded_file"] = file_info["filename"]
-                                paper_dict["download_source"] = file_info["source"]
-                                papers_to_extract.append(paper_dict)
-                                break
+                papers_to_extract = _downloaded_paper_records(
+                    non_duplicate_papers, downloads_by_paper
+                )
 
                 # Start extraction process in background
-                import threading
-
-                extraction_thread = threading.Thread(
-                    target=self._extract_texts_background,
-                    args=(papers_to_extract, project_path),
-                )
-                extraction_thread.daemon = True
-                extraction_thread.start()
+                if not _submit_extraction(
+                    project_id,
+                    self._extract_texts_background,
+                    papers_to_extract,
+                    project_path,
+                ):
+                    return jsonify({"status": "already_running"})
 
                 flash("Text extraction started successfully!", "success")
                 return jsonify({"status": "started"})
@@ -1322,18 +3052,12 @@ class PapervisorWebServer:
                     )
 
                 project_path = self.data_dir / "literature_reviews" / project_id
-                if not project_path.exists():
-                    return (
-                        jsonify({"status": "error", "message": "Project not found"}),
-                        404,
-                    )
-
-                # Get paper data
-                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                papers_df = pd.read_csv(consolidated_path)
+                papers_df = _load_project_papers(project_path)
+                if papers_df is None:
+                    return _missing_project_papers_response(project_path)
 
-                paper_idx = int(paper_id)
-                if paper_idx >= len(papers_df):
+                paper_idx = _paper_index(paper_id)
+                if paper_idx is None or paper_idx >= len(papers_df):
                     return (
                         jsonify({"status": "error", "message": "Paper not found"}),
                         404,
@@ -1342,19 +3066,15 @@ class PapervisorWebServer:
                 paper = papers_df.iloc[paper_idx]
 
                 # Find downloaded file info
-                downloaded_files_info = self._get_downloaded_files_with_source(
-                    project_path
-                )
-                filename_pattern = f"{paper_id}_"
+                downloads_by_paper = _download_index(project_path)
 
                 paper_dict = paper.to_dict()
                 paper_dict["paper_id"] = paper_idx
 
-                for file_info in downloaded_files_info:
-                    if file_info["filename"].startswith(filename_pattern):
-                        paper_dict["downloaded_file"] = file_info["filename"]
-                        paper_dict["download_source"] = file_info["source"]
-                        break
+                file_info = downloads_by_paper.get(str(paper_idx))
+                if file_info is not None:
+                    paper_dict["downloaded_file"] = file_info["filename"]
+                    paper_dict["download_source"] = file_info["source"]
 
                 # Extract text for this paper
                 result = self._extract_text_from_paper(paper_dict, project_path)
@@ -1381,60 +3101,27 @@ class PapervisorWebServer:
                     )
 
                 project_path = self.data_dir / "literature_reviews" / project_id
-                if not project_path.exists():
-                    return (
-                        jsonify({"status": "error", "message": "Project not found"}),
-                        404,
-                    )
-
-                # Get papers data
-                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                papers_df = pd.read_csv(consolidated_path)
+                papers_df = _load_project_papers(project_path)
+                if papers_df is None:
+                    return _missing_project_papers_response(project_path)
 
                 # Filter out duplicates and get downloaded papers
-                if "is_duplicate" in papers_df.columns:
-                    non_duplicate_papers = papers_df[
-                        ~papers_df["is_duplicate"].fillna(False)
-                    ].copy()
-                else:
-                    non_duplicate_papers = papers_df.copy()
-
-                downloaded_files_info = self._get_downloaded_files_with_source(
-                    project_path
-                )
-                downloaded_files = [info["filename"] for info in downloaded_files_info]
-
-                papers_to_extract = []
-                for idx, paper in non_duplicate_papers.iterrows():
-                    paper_id = str(idx)
-                    filename_pattern = f"{paper_id}_"
-                    is_downloaded = any(
-                        f.startswith(filename_pattern) for f in downloaded_files
-                    )
+                non_duplicate_papers = _non_duplicates(papers_df)
 
-                    if is_downloaded:
-                        # Find the downloaded file and its source
-                        for file_info in downloaded_files_info:
-                            if file_info["filename"].startswith(filename_pattern):
-                                paper_dict = paper.to_dict()
-                                paper_dict["paper_id"] = idx
-                                paper_dict["downloaded_file"] = file_info["filename"]
-                                paper_dict["download_source"] = file_info["source"]
-                                papers_to_extract.append(paper_dict)
-                                break
+                downloads_by_paper = _download_index(project_path)
 
-                # Clear previous extraction status for all papers to force re-processing
-                self._clear_extraction_status(project_path)
+                papers_to_extract = _downloaded_paper_records(
+                    non_duplicate_papers, downloads_by_paper
+                )
 
-                # Start extraction process in background
-                import threading
+                # Clear previous extraction status for all papers to force
+                # re-processing, once the previous run is done
+                def retry_extraction() -> None:
+                    self._clear_extraction_status(project_path)
+                    self._extract_texts_background(papers_to_extract, project_path)
 
-                extraction_thread = threading.Thread(
-                    target=self._extract_texts_background,
-                    args=(papers_to_extract, project_path),
-                )
-                extraction_thread.daemon = True
-                extraction_thread.start()
+                if not _submit_extraction(project_id, retry_extraction):
+                    return jsonify({"status": "already_running"})
 
                 flash(
                     "Text extraction retry started successfully! All papers will "
@@ -1471,14 +3158,39 @@ class PapervisorWebServer:
                 project_path = self.data_dir / current_project.project_path
 
                 extracted_dir = project_path / "pdfs" / "extracted_texts"
-                if not extracted_dir.exists():
-                    return "Extracted texts directory not found", 404
-
                 json_file = extracted_dir / filename
-                if not json_file.exists():
+
+                # A single stat on the happy path; the directory is only
+                # checked to report what is missing
+                try:
+                    json_file.stat()
+                except (FileNotFoundError, NotADirectoryError):
+                    if not extracted_dir.exists():
+                        return "Extracted texts directory not found", 404
                     return f"File not found: {filename}", 404
 
-                return send_from_directory(str(extracted_dir.absolute()), filename)
+                x_accel_prefix = self.app.config["X_ACCEL_PREFIX"]
+                if x_accel_prefix:
+                    internal_path = safe_join(
+                        x_accel_prefix,
+                        current_project.project_path,
+                        "pdfs",
+                        "extracted_texts",
+                        filename,
+                    )
+                    if internal_path is None:
+                        return f"File not found: {filename}", 404
+                    response = make_response("")
+                    response.headers["X-Accel-Redirect"] = internal_path
+                    response.content_type = "application/json"
+                    response.headers["Cache-Control"] = "no-cache"
+                    return response
+
+                # Re-extraction rewrites the file under the same name, so
+                # browsers revalidate it (ETag/Last-Modified) on every use
+                return send_from_directory(
+                    str(extracted_dir.absolute()), filename, conditional=True
+                )
 
             except Exception as e:
                 print(f"Error serving extracted text: {e}")
@@ -1488,28 +3200,30 @@ class PapervisorWebServer:
         def save_screening_actions() -> WerkzeugResponse:
             """Save screening action decisions for papers."""
             try:
-                screening_actions = {}
-
                 # Process form data to extract screening decisions
-                for key, value in request.form.items():
-                    if key.startswith("screening_action_"):
-                        paper_id = key.replace("screening_action_", "")
-                        screening_actions[paper_id] = value
+                prefix = "screening_action_"
+                screening_actions = {
+                    key[len(prefix) :]: value
+                    for key, value in request.form.items()
+                    if key.startswith(prefix)
+                }
 
                 if screening_actions:
-                    # Load the extraction status
-                    status = self._load_extraction_status()
-
-                    # Update each paper's screening status
-                    for paper_id, action in screening_actions.items():
-                        if paper_id in status:
-                            status[paper_id]["screening_action"] = action
-                            status[paper_id][
-                                "screening_updated"
-                            ] = pd.Timestamp.now().isoformat()
-
-                    # Save the updated status
-                    self._save_extraction_status(status)
+                    updated_at = pd.Timestamp.now().isoformat()
+                    with _extraction_status_lock:
+                        # Load the extraction status
+                        status = self._load_extraction_status()
+
+                        # Update the screening status of papers with a status
+                        for paper_id in screening_actions.keys() & status.keys():
+                            paper_status = status[paper_id]
+                            paper_status["screening_action"] = screening_actions[
+                                paper_id
+                            ]
+                            paper_status["screening_updated"] = updated_at
+
+                        # Save the updated status
+                        self._save_extraction_status(status)
 
                     flash(
                         f"Saved screening actions for {len(screening_actions)} papers.",
@@ -1579,9 +3293,9 @@ class PapervisorWebServer:
                 if not current_project_id:
                     return jsonify({"error": "No project specified"}), 400
 
-                progress = self.progress.get(current_project_id)
-                if progress:
-                    return jsonify(asdict(progress))
+                job = _get_download_job(current_project_id)
+                if job is not None:
+                    return self._progress_response(job)
                 else:
                     return jsonify(
                         {
@@ -1600,6 +3314,15 @@ class PapervisorWebServer:
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
 
+        @self.app.route("/project/<project_id>/progress")
+        def download_progress_stream(project_id: str) -> FlaskResponse:
+            """Stream download progress as Server-Sent Events."""
+            return FlaskResponse(
+                self._progress_events(project_id),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         @self.app.route("/project/<project_id>/cancel_download", methods=["POST"])
         @self.app.route("/cancel_download", methods=["POST"])
         def cancel_download(project_id: Optional[str] = None) -> WerkzeugResponse:
@@ -1610,8 +3333,9 @@ class PapervisorWebServer:
                     flash("No project specified", "error")
                     return redirect(url_for("landing_page"))
 
-                if current_project_id in self._download_progress:
-                    self._download_progress[current_project_id].is_running = False
+                job = _get_download_job(current_project_id)
+                if job is not None:
+                    job.cancelled.set()
                     flash(
                         f"Download cancelled for project '{current_project_id}'",
                         "warning",
@@ -1685,15 +3409,16 @@ class PapervisorWebServer:
 
                 # Load the paper data to get title/author info for filename
                 consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                papers_df = pd.read_csv(consolidated_path)
+                papers_df = _load_consolidated(consolidated_path)
 
-                if int(float(paper_id)) >= len(papers_df):
+                paper_idx = _paper_index(paper_id)
+                if paper_idx is None or paper_idx >= len(papers_df):
                     flash("Invalid paper ID.", "error")
                     return redirect(
                         url_for("download_management", project_id=project_id)
                     )
 
-                paper = papers_df.iloc[int(float(paper_id))]
+                paper = papers_df.iloc[paper_idx]
 
                 # Generate filename
                 filename = self._generate_pdf_filename(paper, paper_id)
@@ -1703,7 +3428,7 @@ class PapervisorWebServer:
                 manual_dir.mkdir(parents=True, exist_ok=True)
 
                 file_path = manual_dir / filename
-                uploaded_file.save(str(file_path))
+                uploaded_file.save(str(file_path), buffer_size=_UPLOAD_BUFFER_SIZE)
 
                 flash(
                     f"Successfully uploaded PDF for paper {paper_id}: {filename}",
@@ -1711,6 +3436,13 @@ class PapervisorWebServer:
                 )
                 return redirect(url_for("download_management", project_id=project_id))
 
+            except RequestEntityTooLarge:
+                max_upload_mb = self.app.config["MAX_CONTENT_LENGTH"] >> 20
+                flash(
+                    f"PDF is larger than the {max_upload_mb} MB upload limit.",
+                    "error",
+                )
+                return redirect(url_for("download_management", project_id=project_id))
             except Exception as e:
                 flash(f"Error uploading PDF: {str(e)}", "error")
                 return redirect(url_for("download_management", project_id=project_id))
@@ -1734,33 +3466,29 @@ class PapervisorWebServer:
                 )
             project_path = self.data_dir / project.project_path
             # Load consolidated data
-            consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-            if not consolidated_path.exists():
+            papers_df = _load_project_papers(project_path)
+            if papers_df is None:
                 return make_response(
                     render_template(
                         "error.html",
                         error="No consolidated papers found. Please run download first.",
                     )
                 )
-            papers_df = pd.read_csv(consolidated_path)
             # Load extraction & screening statuses
             extraction_status = self._load_extraction_status(project_path)
             screening_results = self._load_screening_results(project_path)
             # Build list of included papers
             papers_to_screen = []
-            for idx, row in papers_df.iterrows():
-                key = str(idx)
-                action = extraction_status.get(key, {}).get("screening_action", "")
-                if action == "include":
-                    result = screening_results.get(key, {})
-                    papers_to_screen.append(
-                        {
-                            "paper_id": idx,
-                            "title": row.get("title", row.get("Title", "")),
-                            "result": result.get("result", "pending"),
-                            "justification": result.get("justification", ""),
-                        }
-                    )
+            for idx, title, _ in _included_papers(papers_df, extraction_status):
+                result = screening_results.get(str(idx), {})
+                papers_to_screen.append(
+                    {
+                        "paper_id": idx,
+                        "title": title,
+                        "result": result.get("result", "pending"),
+                        "justification": result.get("justification", ""),
+                    }
+                )
             total = len(papers_to_screen)
             done = len([p for p in papers_to_screen if p["result"] != "pending"])
             pending = total - done
@@ -1798,24 +3526,16 @@ class PapervisorWebServer:
                 project_path = self.data_dir / project.project_path
                 # Load data and statuses
                 consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
-                papers_df = pd.read_csv(consolidated_path)
+                papers_df = _load_consolidated(consolidated_path)
                 extraction_status = self._load_extraction_status(project_path)
                 screening_results = self._load_screening_results(project_path)
-                to_screen = []
-                for idx, row in papers_df.iterrows():
-                    key = str(idx)
-                    if (
-                        extraction_status.get(key, {}).get("screening_action")
-                        == "include"
-                        and key not in screening_results
-                    ):
-                        to_screen.append(
-                            {
-                                "paper_id": idx,
-                                "title": row.get("title", row.get("Title", "")),
-                                "abstract": row.get("Abstract", ""),
-                            }
-                        )
+                to_screen = [
+                    {"paper_id": idx, "title": title, "abstract": abstract}
+                    for idx, title, abstract in _included_papers(
+                        papers_df, extraction_status
+                    )
+                    if str(idx) not in screening_results
+                ]
                 print(f"Found {len(to_screen)} papers to screen")
                 # Run in background thread
                 thread = threading.Thread(
@@ -1843,85 +3563,73 @@ class PapervisorWebServer:
 
     def stop_download(self, project_id: str) -> None:
         """Stop the download process for a project."""
-        if project_id in self._download_progress:
-            self._download_progress[project_id].is_running = False
-
-    def _get_downloaded_files(self) -> List[str]:
-        """Get list of downloaded PDF files from both automatic and manual
-        directories."""
-        downloaded_files = []
+        job = _get_download_job(project_id)
+        if job is not None:
+            job.cancelled.set()
 
-        # Check automatic directory
-        auto_dir = self.project_path / "pdfs" / "automatic"
-        if auto_dir.exists():
-            downloaded_files.extend([f.name for f in auto_dir.glob("*.pdf")])
+    def _build_project_stats(
+        self, project: Any
+    ) -> Tuple[List[Any], Dict[str, Any], Dict[str, Any]]:
+        """Load the queries and statistics shown for a project on the landing page.
 
-        # Check manual directory
-        manual_dir = self.project_path / "pdfs" / "manual"
-        if manual_dir.exists():
-            downloaded_files.extend([f.name for f in manual_dir.glob("*.pdf")])
-
-        return downloaded_files
-
-    def _get_downloaded_files_with_source(
-        self, project_path: Optional[Path] = None
-    ) -> List[Dict[str, str]]:
-        """Get list of downloaded PDF files with their source directory."""
-        files_info: List[Dict[str, str]] = []
-
-        # Use provided project_path or fallback to instance property
-        if project_path is None:
-            if self.project is None:
-                return files_info
-            project_path = self.project_path
-
-        # Check automatic directory
-        auto_dir = project_path / "pdfs" / "automatic"
-        if auto_dir.exists():
-            for f in auto_dir.glob("*.pdf"):
-                files_info.append(
-                    {"filename": f.name, "source": "automatic", "path": str(f)}
-                )
-
-        # Check manual directory
-        manual_dir = project_path / "pdfs" / "manual"
-        if manual_dir.exists():
-            for f in manual_dir.glob("*.pdf"):
-                files_info.append(
-                    {"filename": f.name, "source": "manual", "path": str(f)}
-                )
-
-        return files_info
-
-    def _get_paper_urls(self, paper: pd.Series) -> Dict[str, str]:
-        """Extract available URLs from paper data."""
-        urls = {}
-
-        # Helper function to safely get string values
-        def safe_get_string(value: Any) -> str:
-            if pd.isna(value):
-                return ""
-            return str(value).strip()
-
-        doi = safe_get_string(paper.get("DOI", ""))
-        if doi and doi.lower() != "nan":
-            urls["DOI"] = f"https://doi.org/{doi}"
-
-        article_url = safe_get_string(
-            paper.get("ArticleURL", "") or paper.get("article_url", "")
-        )
-        if article_url and article_url.lower() != "nan":
-            urls["Article Page"] = article_url
+        Returns:
+            Tuple of (queries, project statistics, paper counts by query ID)
+        """
+        try:
+            # Get queries for this project
+            queries = self.papervisor.list_project_queries(project.project_id)
+        except Exception as e:
+            print(f"Error loading queries for project {project.project_id}: {e}")
+            # Continue with empty queries list
+            queries = []
 
-        fulltext_url = safe_get_string(paper.get("FullTextURL", ""))
-        if fulltext_url and fulltext_url.lower() != "nan":
-            urls["Full Text PDF"] = fulltext_url
+        # Calculate statistics, reused while the project files are unchanged
+        stats = _project_stats(self.data_dir / project.project_path)
 
-        original_url = safe_get_string(paper.get("URL", ""))
-        if original_url and original_url.lower() != "nan":
-            urls["Original URL"] = original_url
+        # Get query statistics
+        query_stats: Dict[str, Any] = {}
+        for query in queries:
+            try:
+                pm = self.papervisor.project_manager
+                results_dir = pm.get_project_results_directory(project.project_id)
+                query_file = results_dir / Path(query.results_file).name
+                if query_file.exists():
+                    query_stats[query.id] = {"paper_count": _count_csv_rows(query_file)}
+                else:
+                    query_stats[query.id] = None
+            except Exception as e:
+                print(f"Error loading query stats for {query.id}: {e}")
+                query_stats[query.id] = None
+
+        return queries, stats, query_stats
+
+    def _landing_page_files(self, projects: List[Any]) -> List[Path]:
+        """List the files whose changes affect the landing page."""
+        paths = [self.data_dir / "projects_index.yaml"]
+        for project in projects:
+            pdfs_dir = self.data_dir / project.project_path / "pdfs"
+            results_dir = self.data_dir / project.results_directory
+            paths.extend(
+                [
+                    self.data_dir / project.search_queries_file,
+                    pdfs_dir / "consolidated_papers.csv",
+                    pdfs_dir / "automatic",
+                    pdfs_dir / "manual",
+                    results_dir,
+                ]
+            )
+            if results_dir.is_dir():
+                paths.extend(sorted(results_dir.glob("*.csv")))
+        return paths
 
-        return urls
+    def _get_downloaded_files(self) -> List[str]:
+        """Get list of downloaded PDF files from both automatic and manual
+        directories."""
+        pdfs_dir = self.project_path / "pdfs"
+        return [
+            *_list_pdfs(pdfs_dir / "automatic"),
+            *_list_pdfs(pdfs_dir / "manual"),
+        ]
 
     def _download_from_url(
         self,
@@ -1965,954 +3673,345 @@ class PapervisorWebServer:
                 error_message=f"Error downloading from submitted URL: {str(e)}",
             )
 
-    def _group_similar_papers(self, papers_data: List[Dict]) -> List[Dict]:
-        """Group papers by similarity to help identify duplicates."""
-        # Calculate similarity scores between all papers
-        groups_list: List[Dict[str, Any]] = []
-        processed_papers = set()
-
-        for i, paper in enumerate(papers_data):
-            if paper["paper_id"] in processed_papers:
-                continue
-
-            # Create a group starting with this paper
-            current_group = [paper]
-            processed_papers.add(paper["paper_id"])
-
-            # Find similar papers
-            for j, other_paper in enumerate(papers_data):
-                if i != j and other_paper["paper_id"] not in processed_papers:
-                    similarity = self._calculate_paper_similarity(paper, other_paper)
-
-                    # If similarity is high enough, add to group
-                    if similarity > 0.6:  # Threshold for potential duplicates
-                        other_paper["similarity_score"] = similarity
-                        other_paper["suggested_duplicate_of"] = paper["paper_id"]
-                        current_group.append(other_paper)
-                        processed_papers.add(other_paper["paper_id"])
-
-            # Sort group by similarity score (highest first)
-            current_group.sort(
-                key=lambda x: x.get("similarity_score", 1.0), reverse=True
-            )
-
-            # Add group info
-            group_info = {
-                "group_id": f"group_{len(groups_list)}",
-                "papers": current_group,
-                "is_potential_duplicate_group": len(current_group) > 1,
-                "group_size": len(current_group),
-            }
-
-            groups_list.append(group_info)
-
-        return groups_list
-
-    def _calculate_paper_similarity(self, paper1: Dict, paper2: Dict) -> float:
-        """Calculate similarity score between two papers."""
-        import difflib
-
-        # Normalize text for comparison
-        def normalize_text(text: Optional[str]) -> str:
-            if not text:
-                return ""
-            return (
-                text.lower().strip().replace(" ", "").replace("-", "").replace("_", "")
-            )
-
-        # Title similarity (most important)
-        title1 = normalize_text(paper1.get("title", ""))
-        title2 = normalize_text(paper2.get("title", ""))
-        title_similarity = difflib.SequenceMatcher(None, title1, title2).ratio()
-
-        # Author similarity
-        authors1 = normalize_text(paper1.get("authors", ""))
-        authors2 = normalize_text(paper2.get("authors", ""))
-        author_similarity = difflib.SequenceMatcher(None, authors1, authors2).ratio()
-
-        # Year similarity (exact match or close)
-        year1 = str(paper1.get("year", ""))
-        year2 = str(paper2.get("year", ""))
-        try:
-            year1_int = int(float(year1)) if year1 and year1 != "Unknown" else 0
-            year2_int = int(float(year2)) if year2 and year2 != "Unknown" else 0
-            year_similarity = (
-                1.0
-                if year1 == year2
-                else (0.8 if abs(year1_int - year2_int) <= 2 else 0.0)
-            )
-        except (ValueError, TypeError):
-            year_similarity = 1.0 if year1 == year2 else 0.0
-
-        # DOI similarity (if available)
-        doi1 = normalize_text(paper1.get("doi", ""))
-        doi2 = normalize_text(paper2.get("doi", ""))
-        doi_similarity = 1.0 if doi1 and doi2 and doi1 == doi2 else 0.0
-
-        # Weighted average (title is most important)
-        if doi_similarity == 1.0:
-            return 1.0  # Same DOI = definitely same paper
-
-        weights = {"title": 0.6, "authors": 0.3, "year": 0.1}
-
-        final_similarity = (
-            title_similarity * weights["title"]
-            + author_similarity * weights["authors"]
-            + year_similarity * weights["year"]
-        )
-
-        return final_similarity
-
-    def _load_extraction_status(
-        self, project_path: Optional[Path] = None
-    ) -> Dict[str, Any]:
-        """Load text extraction status from JSON file."""
-        current_project_path = project_path or self.project_path
-        status_file = current_project_path / "extraction_status.json"
-        if status_file.exists():
-            try:
-                with open(status_file, "r") as f:
-                    loaded_data: Dict[str, Any] = json.load(f)
-                    return loaded_data
-            except Exception as e:
-                print(f"Error loading extraction status: {e}")
-        return {}
-
-    def _save_extraction_status(
-        self, status: Dict[str, Any], project_path: Optional[Path] = None
-    ) -> None:
-        """Save text extraction status to JSON file."""
-        current_project_path = project_path or self.project_path
-        status_file = current_project_path / "extraction_status.json"
-        try:
-            with open(status_file, "w") as f:
-                json.dump(status, f, indent=2)
-        except Exception as e:
-            print(f"Error saving extraction status: {e}")
-
-    def _clear_extraction_status(self, project_path: Optional[Path] = None) -> None:
-        """Clear all extraction status to force re-processing."""
-        current_project_path = project_path or self.project_path
-        status_file = current_project_path / "extraction_status.json"
-        try:
-            # Remove the status file to start fresh
-            if status_file.exists():
-                status_file.unlink()
-                print("Cleared extraction status - all papers will be re-processed")
-        except Exception as e:
-            print(f"Error clearing extraction status: {e}")
-
-    def _extract_texts_background(
-        self, papers_list: List[Dict[str, Any]], project_path: Path
-    ) -> None:
-        """Extract texts from all papers in background thread."""
-        try:
-            print(f"Starting text extraction for {len(papers_list)} papers")
-
-            # Update progress for this project
-            project_id = papers_list[0]["project_id"] if papers_list else ""
-            self._update_progress(project_id, total_papers=len(papers_list))
-
-            for paper in papers_list:
-                try:
-                    result = self._extract_text_from_paper(paper, project_path)
-                    print(f"Processed paper {paper['paper_id']}: {result['status']}")
-
-                    # Update progress after each paper
-                    self._update_progress(
-                        project_id,
-                        completed=self.progress[project_id].completed + 1,
-                        current_paper=paper["title"],
-                    )
-                except Exception as e:
-                    print(f"Error processing paper {paper['paper_id']}: {e}")
-
-                    # Update progress with error
-                    self._update_progress(
-                        project_id,
-                        failed=self.progress[project_id].failed + 1,
-                        current_paper=paper["title"],
-                        error_message=str(e),
-                    )
-
-        except Exception as e:
-            print(f"Error in background text extraction: {e}")
-
-    def _extract_text_from_paper(
-        self, paper: Dict, project_path: Path
-    ) -> Dict[str, Any]:
-        """Extract text from a single paper's PDF."""
-        try:
-            paper_id = str(paper["paper_id"])
-
-            # Update status to processing
-            status = self._load_extraction_status(project_path)
-            status[paper_id] = {"status": "processing", "sections": [], "json_file": ""}
-            self._save_extraction_status(status, project_path)
-
-            # Find the PDF file
-            pdf_file = None
-            download_source = paper.get("download_source", "automatic")
-            downloaded_file = paper.get("downloaded_file", "")
-
-            if downloaded_file:
-                pdf_path = project_path / "pdfs" / download_source / downloaded_file
-                if pdf_path.exists():
-                    pdf_file = pdf_path
-
-            if not pdf_file:
-                # Update status to failed
-                status[paper_id] = {
-                    "status": "failed",
-                    "sections": [],
-                    "json_file": "",
-                    "error": "PDF file not found",
-                }
-                self._save_extraction_status(status, project_path)
-                return {"status": "failed", "error": "PDF file not found"}
-
-            # Extract text using a simple PDF text extraction
-            extracted_data = self._extract_pdf_text(pdf_file, paper)
-
-            # Create extracted_texts directory
-            extracted_dir = project_path / "pdfs" / "extracted_texts"
-            extracted_dir.mkdir(exist_ok=True)
-
-            # Save extracted text as JSON
-            json_filename = f"paper_{paper_id}_extracted.json"
-            json_path = extracted_dir / json_filename
-
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(extracted_data, f, indent=2, ensure_ascii=False)
-
-            # Update status to success
-            sections = list(extracted_data.get("additional_sections", {}).keys())
-            main_sections = [
-                s
-                for s in [
-                    "abstract",
-                    "introduction",
-                    "methods",
-                    "results",
-                    "discussion",
-                    "conclusion",
-                ]
-                if extracted_data.get(s, "")
-            ]
-            all_sections = main_sections + sections
-
-            # Calculate word count safely
-            try:
-                word_count = self._calculate_word_count(extracted_data)
-            except Exception as e:
-                print(f"Error calculating word count for paper {paper_id}: {e}")
-                word_count = 0
-
-            status[paper_id] = {
-                "status": "success" if all_sections else "partial",
-                "sections": all_sections,
-                "json_file": json_filename,
-                "extracted_at": pd.Timestamp.now().isoformat(),
-                "main_sections_found": main_sections,
-                "additional_sections_found": sections,
-                "extraction_metadata": {
-                    "text_length": extracted_data.get("extraction_metadata", {}).get(
-                        "text_length", 0
-                    ),
-                    "total_pages": extracted_data.get("extraction_metadata", {}).get(
-                        "total_pages", 0
-                    ),
-                    "raw_text_chars": extracted_data.get("extraction_metadata", {}).get(
-                        "raw_text_chars", 0
-                    ),
-                    "section_text_chars": extracted_data.get(
-                        "extraction_metadata", {}
-                    ).get("section_text_chars", 0),
-                    "section_extraction_percentage": extracted_data.get(
-                        "extraction_metadata", {}
-                    ).get("section_extraction_percentage", 0),
-                    "word_count": word_count,
-                },
-            }
-            self._save_extraction_status(status, project_path)
-
-            return {
-                "status": "success",
-                "sections": all_sections,
-                "json_file": json_filename,
-            }
-
-        except Exception as e:
-            print(f"Error extracting text from paper {paper_id}: {e}")
-
-            # Update status to failed
-            status = self._load_extraction_status(project_path)
-            status[paper_id] = {
-                "status": "failed",
-                "sections": [],
-                "json_file": "",
-                "error": str(e),
-            }
-            self._save_extraction_status(status, project_path)
-
-            return {"status": "failed", "error": str(e)}
-
-    def _extract_pdf_text(self, pdf_path: Path, paper: Dict) -> Dict[str, Any]:
-        """Extract text from PDF and organize into academic paper sections."""
-        try:
-            import PyPDF2
-
-            # Extract raw text
-            text_content = ""
-            total_pages = 0
-
-            try:
-                with open(pdf_path, "rb") as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    total_pages = len(pdf_reader.pages)
-
-                    for page_num, page in enumerate(pdf_reader.pages):
-                        try:
-                            # Try different extraction methods
-                            page_text = page.extract_text()
-
-                            # If standard extraction gives poor results,
-                            # try alternatives
-                            if not page_text or len(page_text.strip()) < 50:
-                                # Try extracting with different parameters or methods
-                                try:
-                                    # Alternative extraction method if available
-                                    page_text = page.extract_text()
-                                except Exception:
-                                    page_text = ""
-
-                            if page_text:
-                                text_content += page_text + "\n"
-
-                        except Exception as e:
-                            print(
-                                f"Error extracting text from page {page_num + 1} of "
-                                f"{pdf_path}: {e}"
-                            )
-                            continue
-
-            except Exception as e:
-                print(f"Error opening PDF {pdf_path}: {e}")
-                # Return minimal data structure for failed extraction
-
-                return self._create_fallback_extraction_data(paper, pdf_path, str(e))
-
-            if not text_content.strip():
-                print(f"No text content extracted from {pdf_path}")
-                return self._create_fallback_extraction_data(
-                    paper, pdf_path, "No text content extracted"
-                )
-
-            # Clean and preprocess text
-            cleaned_text = self._preprocess_text(text_content)
-
-            # Extract metadata from paper info and text
-            metadata = self._extract_paper_metadata(paper, cleaned_text)
-
-            # Extract academic paper sections
-            sections = self._extract_academic_sections(cleaned_text)
-
-            # Calculate section extraction quality metrics
-            total_raw_chars = len(cleaned_text)
-            total_section_chars = sum(len(content) for content in sections.values())
-            section_extraction_percentage = (
-                (total_section_chars / total_raw_chars * 100)
-                if total_raw_chars > 0
-                else 0
-            )
-
-            # Create structured output following the requirements
-            extracted_data = {
-                # Top-level metadata
-                "title": metadata.get("title", ""),
-                "authors": metadata.get("authors", []),
-                "year": metadata.get("year", None),
-                "doi": metadata.get("doi", ""),
-                "source": metadata.get("source", ""),
-                "url": metadata.get("url", ""),
-                # Document sections
-                "abstract": sections.get("abstract", ""),
-                "introduction": sections.get("introduction", ""),
-                "methods": sections.get("methods", ""),
-                "results": sections.get("results", ""),
-                "discussion": sections.get("discussion", ""),
-                "conclusion": sections.get("conclusion", ""),
-                # Additional sections that might be present
-                "additional_sections": {
-                    k: v
-                    for k, v in sections.items()
-                    if k
-                    not in [
-                        "abstract",
-                        "introduction",
-                        "methods",
-                        "results",
-                        "discussion",
-                        "conclusion",
-                    ]
-                },
-                # Technical metadata
-                "extraction_metadata": {
-                    "paper_id": int(paper["paper_id"]),
-                    "pdf_file": str(pdf_path.name),
-                    "extraction_date": pd.Timestamp.now().isoformat(),
-                    "total_pages": total_pages,
-                    "text_length": len(cleaned_text),
-                    "raw_text_chars": total_raw_chars,
-                    "section_text_chars": total_section_chars,
-                    "section_extraction_percentage": round(
-                        section_extraction_percentage, 1
-                    ),
-                    "sections_found": list(sections.keys()),
-                    "extraction_method": "PyPDF2_academic_parser",
-                },
-            }
-
-            return extracted_data
-
-        except ImportError:
-            print("PyPDF2 not available, using fallback")
-            return self._create_fallback_extraction_data(
-                paper, pdf_path, "PyPDF2 not installed"
-            )
-        except Exception as e:
-            print(f"Unexpected error in PDF extraction for {pdf_path}: {e}")
-            return self._create_fallback_extraction_data(paper, pdf_path, str(e))
-
-    def _preprocess_text(self, text: str) -> str:
-        """Clean and preprocess extracted text."""
-        import re
-
-        # Remove excessive whitespace and normalize line breaks, but preserve structure
-        text = re.sub(
-            r"\n\s*\n\s*\n", "\n\n", text
-        )  # Reduce multiple newlines to double
-        text = re.sub(r"[ \t]+", " ", text)  # Normalize spaces and tabs
-
-        # Remove page numbers and headers/footers (common patterns) - be more careful
-        text = re.sub(r"\n\d+\s*\n", "\n", text)  # Remove isolated page numbers
-        text = re.sub(
-            r"\n[A-Z\s]{10,}\n", "\n", text
-        )  # Remove long all-caps headers (10+ chars)
-
-        # Fix common PDF extraction issues
-        text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)  # Missing spaces between words
-        text = re.sub(
-            r"(\w)-\s*\n\s*(\w)", r"\1\2", text
-        )  # Hyphenated words across lines
-
-        # Preserve important punctuation and structure
-        text = text.strip()
-
-        return text
-
-    def _extract_paper_metadata(self, paper: Dict, text: str) -> Dict[str, Any]:
-        """Extract and enhance paper metadata."""
-        metadata = {}
-
-        # Title - prefer from paper data, fallback to text extraction
-        metadata["title"] = paper.get("title", "") or self._extract_title_from_text(
-            text
-        )
-
-        # Authors - parse from string to list
-        metadata["authors"] = self._parse_authors(paper.get("authors", ""))
-
-        # Year - ensure integer
-        metadata["year"] = self._parse_year(paper.get("year", ""))
-
-        # DOI - clean format
-        doi = paper.get("DOI", "") or self._extract_doi_from_text(text)
-        metadata["doi"] = doi.strip() if doi and not pd.isna(doi) else ""
-
-        # Source (journal/conference) - extract from text if not available
-        metadata["source"] = self._extract_source_from_text(text)
-
-        # URL - get from paper data
-        urls = self._get_paper_urls(pd.Series(paper))
-        metadata["url"] = (
-            urls.get("DOI", "")
-            or urls.get("Article Page", "")
-            or urls.get("Full Text PDF", "")
-        )
-
-        return metadata
-
-    def _parse_authors(self, authors_str: str) -> List[str]:
-        """Parse authors string into a list of individual authors."""
-        if not authors_str or pd.isna(authors_str):
-            return []
-
-        # Common author separators
-        separators = [";", ",", " and ", " & ", "\n"]
-        authors = [authors_str]
-
-        for sep in separators:
-            new_authors = []
-            for author in authors:
-                new_authors.extend([a.strip() for a in author.split(sep) if a.strip()])
-            authors = new_authors
-
-        # Clean up author names
-        cleaned_authors = []
-        for author in authors:
-            # Remove affiliations in parentheses
-            author = re.sub(r"\([^)]*\)", "", author).strip()
-            # Remove extra whitespace
-            author = re.sub(r"\s+", " ", author).strip()
-            if author and len(author) > 1:  # Avoid single characters
-                cleaned_authors.append(author)
-
-        return cleaned_authors
-
-    def _parse_year(self, year_value: Any) -> Optional[int]:
-        """Parse year value to integer."""
-        if not year_value or pd.isna(year_value):
-            return None
-
-        try:
-            year_str = str(year_value).strip()
-            # Extract 4-digit year
-            year_match = re.search(r"\b(19|20)\d{2}\b", year_str)
-            if year_match:
-                return int(year_match.group())
-            return int(float(year_str))
-        except (ValueError, TypeError):
-            return None
-
-    def _extract_title_from_text(self, text: str) -> str:
-        """Extract title from paper text (first meaningful line)."""
-        lines = text.split("\n")
-        for line in lines[:10]:  # Check first 10 lines
-            line = line.strip()
-            if len(line) > 10 and not line.isupper() and not line.isdigit():
-                return line
-        return ""
-
-    def _extract_doi_from_text(self, text: str) -> str:
-        """Extract DOI from paper text."""
-        doi_pattern = r"(?:doi:?\s*)?10\.\d{4,}\/[^\s]+"
-        match = re.search(doi_pattern, text, re.IGNORECASE)
-        return match.group().replace("doi:", "").strip() if match else ""
-
-    def _extract_source_from_text(self, text: str) -> str:
-        """Extract journal or conference name from text."""
-        # Look for common patterns
-        patterns = [
-            r"(?:Published in|Proceedings of|Journal of|Conference on)\s+([^\n]+)",
-            r"([A-Z][a-z]+ (?:Journal|Conference|Proceedings|Review))[^\n]*",
-            r"(IEEE [^,\n]+)",
-            r"(ACM [^,\n]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return ""
-
-    def _extract_academic_sections(self, text: str) -> Dict[str, str]:
-        """Extract academic paper sections with improved detection."""
-        import re
-
-        sections = {}
-
-        # Enhanced section patterns for academic papers
-        section_patterns = {
-            "abstract": [
-                r"\babstract\b",
-                r"\bsummary\b",
-                r"\bexecutive summary\b",
-                r"\b(?:paper\s+)?abstract\b",
-            ],
-            "introduction": [
-                r"\b(?:1\.?\s*)?introduction\b",
-                r"\b(?:1\.?\s*)?background\b",
-                r"\b(?:1\.?\s*)?motivation\b",
-                r"\b(?:I\.?\s*)?introduction\b",
-            ],
-            "methods": [
-                r"\b(?:\d+\.?\s*)?(?:methods?|methodology)\b",
-                r"\b(?:\d+\.?\s*)?(?:approach|framework)\b",
-                r"\b(?:\d+\.?\s*)?(?:materials? and methods?)\b",
-                r"\b(?:\d+\.?\s*)?(?:experimental (?:setup|design))\b",
-                r"\b(?:\d+\.?\s*)?(?:problem statement)\b",
-                r"\b(?:\d+\.?\s*)?(?:mathematical (?:model|formulation))\b",
-                r"\b(?:\d+\.?\s*)?(?:solution approaches?)\b",
-                r"\b(?:\d+\.?\s*)?(?:formulation)\b",
-            ],
-            "results": [
-                r"\b(?:\d+\.?\s*)?results?\b",
-                r"\b(?:\d+\.?\s*)?findings?\b",
-                r"\b(?:\d+\.?\s*)?(?:experimental results?)\b",
-                r"\b(?:\d+\.?\s*)?evaluation\b",
-                r"\b(?:\d+\.?\s*)?(?:results and discussion)\b",
-            ],
-            "discussion": [
-                r"\b(?:\d+\.?\s*)?discussion\b",
-                r"\b(?:\d+\.?\s*)?analysis\b",
-                r"\b(?:\d+\.?\s*)?(?:comparison|comparative analysis)\b",
-            ],
-            "conclusion": [
-                r"\b(?:\d+\.?\s*)?conclusions?\b",
-                r"\b(?:\d+\.?\s*)?(?:concluding remarks?)\b",
-                r"\b(?:\d+\.?\s*)?(?:summary and conclusions?)\b",
-                r"\b(?:\d+\.?\s*)?(?:final remarks?)\b",
-                r"\b(?:\d+\.?\s*)?(?:future (?:work|directions))\b",
-            ],
-            "literature_review": [
-                r"\b(?:\d+\.?\s*)?(?:literature review|related work)\b",
-                r"\b(?:\d+\.?\s*)?(?:state of the art|prior work)\b",
-                r"\b(?:\d+\.?\s*)?(?:previous work|background)\b",
-            ],
-            "acknowledgments": [r"\b(?:acknowledgments?|acknowledgements?)\b"],
-            "references": [r"\b(?:references?|bibliography)\b"],
-        }
-
-        # Additional patterns to catch more general numbered sections with
-        # descriptive titles
-        general_section_patterns = {
-            "forecasting": [r"\b(?:\d+\.?\s*)?forecasting\b"],
-            "scheduling": [r"\b(?:\d+\.?\s*)?scheduling\b"],
-            "optimization": [r"\b(?:\d+\.?\s*)?optimization\b"],
-            "modeling": [r"\b(?:\d+\.?\s*)?(?:modeling|modelling)\b"],
-            "simulation": [r"\b(?:\d+\.?\s*)?simulation\b"],
-            "case_study": [r"\b(?:\d+\.?\s*)?(?:case study|case studies)\b"],
-            "implementation": [r"\b(?:\d+\.?\s*)?implementation\b"],
-            "experiments": [r"\b(?:\d+\.?\s*)?experiments?\b"],
-            "validation": [r"\b(?:\d+\.?\s*)?validation\b"],
-            "limitations": [r"\b(?:\d+\.?\s*)?limitations?\b"],
-            "future_work": [
-                r"\b(?:\d+\.?\s*)?(?:future work|future research|future directions)\b"
-            ],
-            "problem_definition": [
-                r"\b(?:\d+\.?\s*)?(?:problem (?:definition|statement))\b"
-            ],
-            "data_analysis": [r"\b(?:\d+\.?\s*)?(?:data analysis|data processing)\b"],
-        }
-
-        # Split text into chunks - look at both lines and paragraphs
-        lines = text.split("\n")
-        paragraphs = text.split("\n\n")
+    def _review_paper_groups(self, consolidated_path: Path) -> List[Dict[str, Any]]:
+        """Group consolidated papers by similarity for the review page.
 
-        # Combine both pattern sets for comprehensive detection
-        all_patterns = {**section_patterns, **general_section_patterns}
+        Grouping compares every pair of papers, so the groups are kept for each
+        version (path, mtime and size) of consolidated_papers.csv. Cached
+        groups are shared between requests and must not be modified.
+        """
+        stat = consolidated_path.stat()
+        key = (str(consolidated_path), stat.st_mtime_ns, stat.st_size)
+        groups = self._review_groups.get(key)
+        if groups is not None:
+            return groups
+
+        papers_df = _normalize_papers(_load_consolidated(consolidated_path))
+
+        # Prepare papers data for review, column by column
+        papers_view = _paper_view(papers_df)
+        papers_view["abstract"] = _truncate_text(papers_df["Abstract"], 200)
+        papers_view["is_duplicate"] = papers_df["is_duplicate"]
+        # Reference to original paper
+        papers_view["duplicate_of"] = papers_df["duplicate_of"]
+        groups = self._group_similar_papers(papers_view.to_dict(orient="records"))
+
+        with self._review_groups_lock:
+            if len(self._review_groups) >= _REVIEW_GROUPS_CACHE_SIZE:
+                # Drop the oldest entry
+                self._review_groups.pop(next(iter(self._review_groups)))
+            self._review_groups[key] = groups
+        return groups
 
-        # Find section boundaries using a more flexible approach
-        section_starts = {}
+    def _group_similar_papers(self, papers_data: List[Dict]) -> List[Dict]:
+        """Group papers by similarity to help identify duplicates."""
+        # Normalize each paper once rather than once per compared pair
+        match_fields = [_paper_match_fields(paper) for paper in papers_data]
+        candidates = _similarity_candidates(
+            match_fields, _DUPLICATE_SIMILARITY_THRESHOLD
+        )
+        groups_list: List[Dict[str, Any]] = []
+        processed_papers = set()
 
-        # First pass: Look for obvious section headers in lines
-        for i, line in enumerate(lines):
-            line_clean = line.strip().lower()
-            if len(line_clean) < 3 or len(line_clean) > 150:
+        for i, paper in enumerate(papers_data):
+            if paper["paper_id"] in processed_papers:
                 continue
 
-            for section_name, patterns in all_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, line_clean, re.IGNORECASE):
-                        # Verify this looks like a section header
-                        if (
-                            self._is_section_header(line.strip())
-                        ) or self._is_likely_header(line.strip()):
-                            if (
-                                section_name not in section_starts
-                            ):  # Take first occurrence
-                                section_starts[section_name] = i
-                                break
-                if section_name in section_starts:
-                    break
+            # Create a group starting with this paper
+            current_group = [paper]
+            processed_papers.add(paper["paper_id"])
 
-        # Second pass: Enhanced numbered section detection
-        numbered_section_pattern = r"^(\d+)\.?\s+([A-Z][a-zA-Z\s]+)$"
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-            if len(line_clean) < 5 or len(line_clean) > 100:
-                continue
+            # Find similar papers, among the candidates when they are known
+            others: Iterable[int] = (
+                range(len(papers_data)) if candidates is None else sorted(candidates[i])
+            )
+            for j in others:
+                other_paper = papers_data[j]
+                if i != j and other_paper["paper_id"] not in processed_papers:
+                    similarity = _paper_similarity(
+                        match_fields[i],
+                        match_fields[j],
+                        _DUPLICATE_SIMILARITY_THRESHOLD,
+                    )
 
-            match = re.match(numbered_section_pattern, line_clean)
-            if match:
-                section_title = match.group(2).strip().lower()
-
-                # Map common section titles to our standardized names
-                title_mappings = {
-                    "forecasting": "forecasting",
-                    "introduction": "introduction",
-                    "background": "introduction",
-                    "methods": "methods",
-                    "methodology": "methods",
-                    "approach": "methods",
-                    "results": "results",
-                    "findings": "results",
-                    "discussion": "discussion",
-                    "analysis": "discussion",
-                    "conclusion": "conclusion",
-                    "conclusions": "conclusion",
-                    "literature review": "literature_review",
-                    "related work": "literature_review",
-                    "problem statement": "methods",
-                    "problem definition": "methods",
-                    "solution approaches": "methods",
-                    "case study": "case_study",
-                    "experiments": "experiments",
-                    "evaluation": "results",
-                    "implementation": "implementation",
-                    "simulation": "simulation",
-                    "modeling": "modeling",
-                    "modelling": "modeling",
-                    "optimization": "optimization",
-                    "validation": "validation",
-                    "limitations": "limitations",
-                    "future work": "future_work",
-                    "future research": "future_work",
-                    "future directions": "future_work",
-                }
+                    # If similarity is high enough, add to group
+                    if similarity > _DUPLICATE_SIMILARITY_THRESHOLD:
+                        other_paper["similarity_score"] = similarity
+                        other_paper["suggested_duplicate_of"] = paper["paper_id"]
+                        current_group.append(other_paper)
+                        processed_papers.add(other_paper["paper_id"])
 
-                # Find the best match for this section title
-                matched_section = None
-                for key, value in title_mappings.items():
-                    if key in section_title:
-                        matched_section = value
-                        break
-
-                # If we found a match and haven't recorded this section yet
-                if matched_section and matched_section not in section_starts:
-                    # Verify this looks like a section header
-                    if (
-                        self._is_section_header(line_clean)
-                        or len(line_clean.split()) <= 5
-                    ):
-                        section_starts[matched_section] = i
-
-        # Third pass: Look for sections within paragraph boundaries for cases
-        # where headers aren't clearly separated
-        if (
-            len(section_starts) < 3
-        ):  # If we found few sections, try paragraph-based search
-            for section_name, patterns in all_patterns.items():
-                if section_name in section_starts:
-                    continue
+            # Sort group by similarity score (highest first)
+            current_group.sort(
+                key=lambda x: x.get("similarity_score", 1.0), reverse=True
+            )
 
-                for pattern in patterns:
-                    for para in paragraphs:
-                        para_lines = para.split("\n")
-                        if len(para_lines) > 0:
-                            first_line = para_lines[0].strip().lower()
-                            if re.search(pattern, first_line, re.IGNORECASE):
-                                # Find line number in original text
-                                para_start = text.find(para)
-                                if para_start != -1:
-                                    line_num = text[:para_start].count("\n")
-                                    section_starts[section_name] = line_num
-                                    break
-
-        # Extract content for each section
-        sorted_sections = sorted(section_starts.items(), key=lambda x: x[1])
-
-        for i, (section_name, start_line) in enumerate(sorted_sections):
-            # Determine end line
-            if i + 1 < len(sorted_sections):
-                end_line = sorted_sections[i + 1][1]
-            else:
-                # For the last section, use the full remaining text
-                end_line = len(lines)
+            # Add group info
+            group_info = {
+                "group_id": f"group_{len(groups_list)}",
+                "papers": current_group,
+                "is_potential_duplicate_group": len(current_group) > 1,
+                "group_size": len(current_group),
+            }
 
-            # Extract section content
-            section_lines = lines[start_line + 1 : end_line]
-            content = "\n".join(section_lines).strip()
+            groups_list.append(group_info)
 
-            # Clean up content
-            content = self._clean_section_content(content)
+        return groups_list
 
-            # More lenient content filtering - include sections with at least 10 words
-            if content and len(content.split()) >= 10:  # Reduced from 20 to 10 words
-                sections[section_name] = content
-                print(
-                    (
-                        f"DEBUG: Extracted section '{section_name}' with "
-                        f"{len(content.split())} words"
-                    )
-                )
-                # Print first and last 50 characters for debugging
-                if len(content) > 100:
-                    print(
-                        f"DEBUG: Section '{section_name}' starts: '{content[:50]}...'"
-                    )
-                    print(f"DEBUG: Section '{section_name}' ends: '...{content[-50:]}'")
-                else:
-                    print(f"DEBUG: Section '{section_name}' content: '{content}'")
-
-        # Special handling for abstract - often appears early without clear header
-        if "abstract" not in sections:
-            abstract_content = self._extract_abstract_fallback(text)
-            if abstract_content:
-                sections["abstract"] = abstract_content
-
-        # Add a summary of what was extracted
-        total_extracted = sum(len(content) for content in sections.values())
-
-        # If we didn't extract much content, add a fallback strategy
-        if total_extracted < len(text) * 0.5:  # If we extracted less than 50% of text
-            # Split text into chunks as fallback
-            text_chunks = self._split_text_into_chunks(text, chunk_size=2000)
-            for i, chunk in enumerate(text_chunks):
-                if chunk.strip() and len(chunk.split()) >= 20:
-                    sections[f"text_chunk_{i+1}"] = chunk.strip()
-
-            # Also try to get the end of the document which might be conclusions
-            lines = text.split("\n")
-            if len(lines) > 50:
-                last_portion = "\n".join(lines[-50:]).strip()  # Last 50 lines
-                if last_portion and len(last_portion.split()) >= 20:
-                    sections["document_end"] = last_portion
-
-        return sections
-
-    def _is_section_header(self, line: str) -> bool:
-        """Determine if a line is likely a section header."""
-        line = line.strip()
+    def _load_extraction_status(
+        self, project_path: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """Load text extraction status from JSON file."""
+        current_project_path = project_path or self.project_path
+        status_file = current_project_path / "extraction_status.json"
+        if status_file.exists():
+            try:
+                loaded_data: Dict[str, Any] = _read_json_cached(status_file)
+                return loaded_data
+            except Exception as e:
+                print(f"Error loading extraction status: {e}")
+        return {}
 
-        # Headers are typically short to medium length
-        if len(line) > 150 or len(line) < 3:
-            return False
+    def _save_extraction_status(
+        self, status: Dict[str, Any], project_path: Optional[Path] = None
+    ) -> None:
+        """Save text extraction status to JSON file.
 
-        # Check for common header patterns
-        header_patterns = [
-            r"^\d+\.?\s+\w+",  # Numbered sections (1. Introduction, 2 Methods,
-            # 2 Forecasting)
-            r"^\d+\.?\d*\.?\s+\w+",  # Sub-numbered sections (2.1 Methods,
-            # 3.2.1 Analysis)
-            r"^[IVX]+\.?\s+\w+",  # Roman numeral sections
-            r"^[A-Z][A-Z\s]+$",  # All caps headers
-            r"^\w+$",  # Single word headers
-            r"^\w+\s+\w+$",  # Two word headers
-            r"^\w+\s+\w+\s+\w+$",  # Three word headers
-            r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]*)*$",  # Title case headers
-            r"^\d+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]*)*$",  # Numbered title case
-            # (e.g., "2 Forecasting")
-        ]
+        The file is written next to the status file and then renamed over it,
+        so readers never see a partly written file.
+        """
+        current_project_path = project_path or self.project_path
+        status_file = current_project_path / "extraction_status.json"
+        tmp_file = status_file.with_name(status_file.name + ".tmp")
+        try:
+            with _extraction_status_lock:
+                tmp_file.write_bytes(_dump_json_bytes(status))
+                os.replace(tmp_file, status_file)
+        except Exception as e:
+            print(f"Error saving extraction status: {e}")
 
-        # Additional criteria for headers
-        word_count = len(line.split())
+    def _clear_extraction_status(self, project_path: Optional[Path] = None) -> None:
+        """Clear all extraction status to force re-processing."""
+        current_project_path = project_path or self.project_path
+        status_file = current_project_path / "extraction_status.json"
+        try:
+            # Remove the status file to start fresh
+            if status_file.exists():
+                status_file.unlink()
+                print("Cleared extraction status - all papers will be re-processed")
+        except Exception as e:
+            print(f"Error clearing extraction status: {e}")
 
-        # Headers usually have 1-8 words
-        if not (1 <= word_count <= 8):
-            return False
+    def _extract_texts_background(
+        self, papers_list: List[Dict[str, Any]], project_path: Path
+    ) -> None:
+        """Extract texts from all papers in background thread.
 
-        # Check if it matches header patterns
-        pattern_match = any(re.match(pattern, line) for pattern in header_patterns)
+        PDFs are parsed concurrently in the shared worker processes. Results
+        are saved by this thread, with the status file written in batches.
+        """
+        try:
+            print(f"Starting text extraction for {len(papers_list)} papers")
 
-        # Headers often don't end with punctuation (except periods after numbers)
-        ends_properly = not line.endswith((",", ";", "!", "?")) or bool(
-            re.match(r".*\d+\.$", line)
-        )
+            # Update progress for this project
+            project_id = papers_list[0]["project_id"] if papers_list else ""
+            self._update_progress(project_id, total_papers=len(papers_list))
 
-        return pattern_match and ends_properly
+            pool = _get_extraction_process_pool()
+            futures: Dict[Future, Dict[str, Any]] = {}
+            status_updates: Dict[str, Dict[str, Any]] = {}
+            for paper in papers_list:
+                paper_id = str(paper["paper_id"])
+                pdf_file = self._paper_pdf_file(paper, project_path)
+                if pdf_file is None:
+                    status_updates[paper_id] = _failed_extraction_status(
+                        "PDF file not found"
+                    )
+                    print(f"Processed paper {paper_id}: failed")
+                    self._update_progress(
+                        project_id,
+                        completed=self.progress[project_id].completed + 1,
+                        current_paper=paper["title"],
+                    )
+                    continue
+                status_updates[paper_id] = {
+                    "status": "processing",
+                    "sections": [],
+                    "json_file": "",
+                }
+                future = pool.submit(_extract_pdf_text_in_worker, str(pdf_file), paper)
+                futures[future] = paper
+            self._update_extraction_status(status_updates, project_path)
+            status_updates = {}
+
+            for future in as_completed(futures):
+                paper = futures[future]
+                paper_id = str(paper["paper_id"])
+                try:
+                    entry = self._save_extracted_text(
+                        paper_id, future.result(), project_path
+                    )
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        _discard_extraction_process_pool(pool)
+                    print(f"Error extracting text from paper {paper_id}: {e}")
+                    entry = _failed_extraction_status(str(e))
+                status_updates[paper_id] = entry
+                print(f"Processed paper {paper_id}: {entry['status']}")
+
+                # Update progress after each paper
+                self._update_progress(
+                    project_id,
+                    completed=self.progress[project_id].completed + 1,
+                    current_paper=paper["title"],
+                )
+                if len(status_updates) >= _EXTRACTION_STATUS_BATCH:
+                    self._update_extraction_status(status_updates, project_path)
+                    status_updates = {}
+            self._update_extraction_status(status_updates, project_path)
 
-    def _is_likely_header(self, line: str) -> bool:
-        """Additional checks for section headers with more lenient criteria."""
-        line = line.strip()
+        except Exception as e:
+            print(f"Error in background text extraction: {e}")
 
-        # Check for common header characteristics
-        if len(line) > 150:
-            return False
+    def _update_extraction_status(
+        self, updates: Dict[str, Dict[str, Any]], project_path: Path
+    ) -> None:
+        """Replace the status entries of some papers, keeping all others.
 
-        # Headers often end with specific patterns
-        header_end_patterns = [
-            r"\d+$",  # Ends with number (like "3. Methods 3")
-            r"[A-Z\s]+$",  # All caps words
-            r"\w+\s*$",  # Single word or short phrase
-        ]
+        The status file is re-read rather than served from the JSON cache, as
+        several writes may share one file mtime.
+        """
+        if not updates:
+            return
+        status_file = project_path / "extraction_status.json"
+        with _extraction_status_lock:
+            status: Dict[str, Any] = {}
+            if status_file.exists():
+                try:
+                    status = _load_json_file(str(status_file))
+                except Exception as e:
+                    print(f"Error loading extraction status: {e}")
+            status.update(updates)
+            self._save_extraction_status(status, project_path)
 
-        # Headers often start with numbers or letters
-        header_start_patterns = [
-            r"^\d+\.?\s*",  # Starts with number
-            r"^[IVX]+\.?\s*",  # Roman numerals
-            r"^[A-Z][a-z]*\s*",  # Capitalized word
+    def _paper_pdf_file(self, paper: Dict, project_path: Path) -> Optional[Path]:
+        """Find the downloaded PDF of a paper, or None if it is missing."""
+        download_source = paper.get("download_source", "automatic")
+        downloaded_file = paper.get("downloaded_file", "")
+        if downloaded_file:
+            pdf_path: Path = project_path / "pdfs" / download_source / downloaded_file
+            if pdf_path.exists():
+                return pdf_path
+        return None
+
+    def _save_extracted_text(
+        self, paper_id: str, extracted_data: Dict[str, Any], project_path: Path
+    ) -> Dict[str, Any]:
+        """Save the extracted text of a paper and build its status entry."""
+        # Create extracted_texts directory
+        extracted_dir = project_path / "pdfs" / "extracted_texts"
+        extracted_dir.mkdir(exist_ok=True)
+
+        # Save extracted text as JSON
+        json_filename = f"paper_{paper_id}_extracted.json"
+        json_path = extracted_dir / json_filename
+
+        json_path.write_bytes(_dump_json_bytes(extracted_data))
+
+        sections = list(extracted_data.get("additional_sections", {}).keys())
+        main_sections = [
+            s
+            for s in [
+                "abstract",
+                "introduction",
+                "methods",
+                "results",
+                "discussion",
+                "conclusion",
+            ]
+            if extracted_data.get(s, "")
         ]
+        all_sections = main_sections + sections
 
-        return any(
-            re.search(pattern, line) for pattern in header_start_patterns
-        ) or any(re.search(pattern, line) for pattern in header_end_patterns)
+        # Calculate word count safely
+        try:
+            word_count = self._calculate_word_count(extracted_data)
+        except Exception as e:
+            print(f"Error calculating word count for paper {paper_id}: {e}")
+            word_count = 0
 
-    def _extract_abstract_fallback(self, text: str) -> str:
-        """Fallback method to extract abstract when no clear header is found."""
-        lines = text.split("\n")
+        metadata = extracted_data.get("extraction_metadata", {})
+        return {
+            "status": "success" if all_sections else "partial",
+            "sections": all_sections,
+            "readable_sections": [
+                _readable_section_name(section) for section in all_sections
+            ],
+            "json_file": json_filename,
+            "extracted_at": pd.Timestamp.now().isoformat(),
+            "main_sections_found": main_sections,
+            "additional_sections_found": sections,
+            "extraction_metadata": {
+                "text_length": metadata.get("text_length", 0),
+                "total_pages": metadata.get("total_pages", 0),
+                "raw_text_chars": metadata.get("raw_text_chars", 0),
+                "section_text_chars": metadata.get("section_text_chars", 0),
+                "section_extraction_percentage": metadata.get(
+                    "section_extraction_percentage", 0
+                ),
+                "word_count": word_count,
+            },
+        }
 
-        # Look for abstract-like content in the first few pages
-        for i, line in enumerate(lines[:200]):  # First 200 lines
-            line_clean = line.strip()
+    def _extract_text_from_paper(
+        self, paper: Dict, project_path: Path
+    ) -> Dict[str, Any]:
+        """Extract text from a single paper's PDF."""
+        try:
+            paper_id = str(paper["paper_id"])
 
-            # Skip very short lines, headers, and metadata
-            if (
-                len(line_clean) < 30
-                or line_clean.lower().startswith(
-                    (
-                        "keywords",
-                        "doi:",
-                        "published",
-                        "copyright",
-                        "author",
-                        "correspondence",
-                    )
-                )
-                or re.match(r"^\d+\s*$", line_clean)
-            ):
-                continue
+            # Update status to processing
+            self._update_extraction_status(
+                {paper_id: {"status": "processing", "sections": [], "json_file": ""}},
+                project_path,
+            )
 
-            # Look for paragraph that looks like an abstract
-            if (
-                len(line_clean) > 100
-                and not line_clean.lower().startswith(
-                    ("figure", "table", "section", "chapter")
+            # Find the PDF file
+            pdf_file = self._paper_pdf_file(paper, project_path)
+            if not pdf_file:
+                # Update status to failed
+                self._update_extraction_status(
+                    {paper_id: _failed_extraction_status("PDF file not found")},
+                    project_path,
                 )
-                and len(line_clean.split()) > 15
-            ):
-                # Try to get the full paragraph
-                abstract_lines = [line_clean]
-                j = i + 1
-                while j < len(lines) and j < i + 20:  # Look ahead max 20 lines
-                    next_line = lines[j].strip()
-                    if (
-                        len(next_line) < 10
-                    ):  # Empty or very short line - end of paragraph
-                        break
-                    if next_line.lower().startswith(
-                        ("keywords", "introduction", "1.", "doi:")
-                    ):
-                        break
-                    abstract_lines.append(next_line)
-                    j += 1
-
-                abstract_text = " ".join(abstract_lines).strip()
-
-                # Validate it looks like an abstract (50-500 words)
-                word_count = len(abstract_text.split())
-                if 50 <= word_count <= 500:
-                    return abstract_text
+                return {"status": "failed", "error": "PDF file not found"}
 
-        return ""
+            # Extract text using a simple PDF text extraction
+            extracted_data = _extract_pdf_text(pdf_file, paper)
+
+            # Update status to success
+            entry = self._save_extracted_text(paper_id, extracted_data, project_path)
+            self._update_extraction_status({paper_id: entry}, project_path)
+
+            return {
+                "status": "success",
+                "sections": entry["sections"],
+                "json_file": entry["json_file"],
+            }
 
-    def _clean_section_content(self, content: str) -> str:
-        """Clean extracted section content."""
-        # Remove excessive whitespace
-        content = re.sub(r"\n\s*\n\s*\n", "\n\n", content)
-        content = re.sub(r"[ \t]+", " ", content)
+        except Exception as e:
+            print(f"Error extracting text from paper {paper_id}: {e}")
 
-        # Remove page numbers and artifacts
-        content = re.sub(r"\n\d+\s*\n", "\n", content)
-        content = re.sub(r"\n[A-Z\s]{20,}\n", "\n", content)  # Long all-caps lines
+            # Update status to failed
+            self._update_extraction_status(
+                {paper_id: _failed_extraction_status(str(e))}, project_path
+            )
 
-        return content.strip()
+            return {"status": "failed", "error": str(e)}
 
     def _detect_sections(self, text: str) -> Dict[str, str]:
         """Legacy method maintained for compatibility."""
-        return self._extract_academic_sections(text)
+        return _extract_academic_sections(text)
 
     def _calculate_word_count(self, extracted_data: Dict[str, Any]) -> int:
         """Calculate word count from extracted text data.
@@ -2929,33 +4028,6 @@ class PapervisorWebServer:
                 total_words += len(section_text.split())
         return total_words
 
-    def _create_fallback_extraction_data(
-        self, paper: Dict[str, Any], pdf_path: Path, error_msg: str
-    ) -> Dict[str, Any]:
-        """Create fallback extraction data when PDF processing fails.
-
-        Args:
-            paper: Paper information dictionary
-            pdf_path: Path to the PDF file
-            error_msg: Error message from failed extraction
-
-        Returns:
-            Fallback extraction data dictionary
-        """
-        return {
-            "title": paper.get("title", "Unknown Title"),
-            "authors": paper.get("authors", "Unknown Authors"),
-            "year": paper.get("year", "Unknown"),
-            "doi": paper.get("doi", ""),
-            "abstract": paper.get("abstract", ""),
-            "source": paper.get("source_queries", ""),
-            "pdf_path": str(pdf_path),
-            "extraction_status": "failed",
-            "error": error_msg,
-            "extracted_at": pd.Timestamp.now().isoformat(),
-            "word_count": 0,
-        }
-
     def _update_progress(self, project_id: str, **kwargs: Any) -> None:
         """Update the download progress for a project."""
         if project_id not in self.progress:
@@ -2965,186 +4037,230 @@ class PapervisorWebServer:
         for key, value in kwargs.items():
             setattr(self.progress[project_id], key, value)
 
+    def _progress_response(self, job: _DownloadJob) -> FlaskResponse:
+        """Build the JSON response for a download job's progress.
+
+        Pollers share one serialization per snapshot; it is rebuilt only after
+        the job publishes a new one.
+        """
+        progress = job.progress
+        cached = job.serialized
+        if cached is None or cached[0] is not progress:
+            cached = (progress, self.app.json.dumps(asdict(progress)) + "\n")
+            job.serialized = cached
+        return self.app.response_class(cached[1], mimetype="application/json")
+
     def run(
-        self, host: str = "127.0.0.1", port: int = 5000, debug: bool = False
+        self,
+        host: str = "127.0.0.1",
+        port: int = 5000,
+        debug: bool = False,
+        threads: int = 8,
     ) -> None:
-        """Run the Flask development server."""
+        """Run the web server.
+
+        Requests are served concurrently so a slow page does not block other
+        tabs. The waitress WSGI server is used when it is installed and debug
+        mode is off; otherwise Flask's threaded development server is used.
+        """
         if self.project_id:
             print(f"Starting Papervisor Web Server for project '{self.project_id}'")
         else:
             print("Starting Papervisor Web Server in multi-project mode")
         print(f"Access the dashboard at: http://{host}:{port}")
-        self.app.run(host=host, port=port, debug=debug)
+
+        if not debug:
+            try:
+                from waitress import serve
+            except ImportError:
+                pass
+            else:
+                serve(self.app, host=host, port=port, threads=threads)
+                return
+
+        self.app.run(host=host, port=port, debug=debug, threaded=True)
+
+    def _progress_events(
+        self, project_id: str, heartbeat: float = 30.0
+    ) -> Iterator[str]:
+        """Yield Server-Sent Events for a project's download progress.
+
+        An event is sent whenever the worker publishes new progress, and a
+        comment line is sent after ``heartbeat`` idle seconds so proxies keep
+        the connection open. The stream ends once the download stops running.
+        """
+        job = _get_download_job(project_id)
+        if job is None:
+            idle = DownloadProgress(project_id=project_id)
+            yield f"data: {json.dumps(asdict(idle))}\n\n"
+            return
+
+        last_payload = None
+        while True:
+            with job.changed:
+                seen = job.version
+                progress = job.progress
+            payload = json.dumps(asdict(progress))
+            if payload != last_payload:
+                yield f"data: {payload}\n\n"
+                last_payload = payload
+
+            if not progress.is_running:
+                return
+            with job.changed:
+                updated = job.changed.wait_for(
+                    lambda: job.version != seen, timeout=heartbeat
+                )
+            if not updated:
+                yield ": keep-alive\n\n"
 
     def _start_download_process(
         self, project_id: str, retry_failed: bool = False
     ) -> None:
         """Start download process in background thread."""
-        # Initialize lock for this project if it doesn't exist
-        if project_id not in self._download_locks:
-            self._download_locks[project_id] = threading.Lock()
-
-        # Check if download is already running
-        if (
-            project_id in self._download_progress
-            and self._download_progress[project_id].is_running
-        ):
-            print(f"Download already running for project {project_id}")
-            return
+        with _download_jobs_lock:
+            # Check if download is already running
+            job = _download_jobs.get(project_id)
+            if job is not None and job.progress.is_running:
+                print(f"Download already running for project {project_id}")
+                return
+
+            # Register the job as running before the worker starts so progress
+            # streams opened right away do not see a previous, finished run
+            job = _DownloadJob(
+                DownloadProgress(
+                    project_id=project_id, is_running=True, start_time=time.time()
+                )
+            )
+            _download_jobs[project_id] = job
 
         # Start download in background thread
         download_thread = threading.Thread(
-            target=self._download_worker, args=(project_id, retry_failed), daemon=True
+            target=self._download_worker, args=(job, retry_failed), daemon=True
         )
         download_thread.start()
 
-    def _download_worker(self, project_id: str, retry_failed: bool = False) -> None:
+    def _download_worker(self, job: _DownloadJob, retry_failed: bool = False) -> None:
         """Background worker for downloading papers with real-time progress tracking."""
+        project_id = job.progress.project_id
         try:
-            with self._download_locks[project_id]:
-                # Initialize progress tracking
-                self._download_progress[project_id] = DownloadProgress(
-                    project_id=project_id, is_running=True, start_time=time.time()
+            # Get project and validate
+            current_project = self.papervisor.get_project(project_id)
+            if not current_project:
+                job.publish(
+                    error_message=f"Project '{project_id}' not found", is_running=False
                 )
+                return
 
-                # Get project and validate
-                current_project = self.papervisor.get_project(project_id)
-                if not current_project:
-                    self._download_progress[project_id].error_message = (
-                        f"Project '{project_id}' not found"
-                    )
-                    self._download_progress[project_id].is_running = False
-                    return
+            project_path = self.data_dir / current_project.project_path
+            consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
 
-                project_path = self.data_dir / current_project.project_path
-                consolidated_path = project_path / "pdfs" / "consolidated_papers.csv"
+            if not consolidated_path.exists():
+                job.publish(
+                    error_message="No consolidated papers file found", is_running=False
+                )
+                return
 
-                if not consolidated_path.exists():
-                    self._download_progress[project_id].error_message = (
-                        "No consolidated papers file found"
-                    )
-                    self._download_progress[project_id].is_running = False
-                    return
+            papers_df = _load_consolidated(consolidated_path)
+
+            # Determine which papers to download
+            papers_to_download = []
+            if retry_failed:
+                # Only retry papers that don't have downloaded files
+                downloads_by_paper = _download_index(project_path)
 
-                papers_df = pd.read_csv(consolidated_path)
+                for idx, paper in papers_df.iterrows():
+                    if str(idx) not in downloads_by_paper:
+                        papers_to_download.append((idx, paper))
 
-                # Determine which papers to download
-                papers_to_download = []
-                if retry_failed:
-                    # Only retry papers that don't have downloaded files
-                    downloaded_files_info = self._get_downloaded_files_with_source(
-                        project_path
+                print(
+                    (
+                        f"🔄 Retrying download for {len(papers_to_download)} "
+                        f"missing papers..."
                     )
-                    downloaded_files = [
-                        info["filename"] for info in downloaded_files_info
-                    ]
+                )
+            else:
+                papers_to_download = list(papers_df.iterrows())
+                print(f"📥 Starting download for {len(papers_to_download)} papers...")
 
-                    for idx, paper in papers_df.iterrows():
-                        paper_id = str(idx)
-                        filename_pattern = f"{paper_id}_"
-                        is_downloaded = any(
-                            f.startswith(filename_pattern) for f in downloaded_files
-                        )
-                        if not is_downloaded:
-                            papers_to_download.append((idx, paper))
+            # Set total papers count
+            job.publish(total_papers=len(papers_to_download))
 
-                    print(
-                        (
-                            f"🔄 Retrying download for {len(papers_to_download)} "
-                            f"missing papers..."
-                        )
-                    )
-                else:
-                    papers_to_download = list(papers_df.iterrows())
-                    print(
-                        f"📥 Starting download for {len(papers_to_download)} papers..."
-                    )
+            if not papers_to_download:
+                job.publish(error_message="No papers to download", is_running=False)
+                return
+
+            # Initialize PDF downloader
+            downloader = PDFDownloader(project_path)
+            automatic_dir = project_path / "pdfs" / "automatic"
+            automatic_dir.mkdir(parents=True, exist_ok=True)
+
+            # Download papers one by one with real-time progress updates
+            successful_downloads = 0
+            failed_downloads = 0
+
+            for i, (idx, paper) in enumerate(papers_to_download):
+                # Check if download was cancelled
+                if job.cancelled.is_set():
+                    print("❌ Download cancelled by user")
+                    break
 
-                # Set total papers count
-                self._download_progress[project_id].total_papers = len(
-                    papers_to_download
+                paper_id = str(idx)
+                paper_title = paper.get(
+                    "title", paper.get("Title", f"Paper {paper_id}")
                 )
 
-                if not papers_to_download:
-                    self._download_progress[project_id].error_message = (
-                        "No papers to download"
-                    )
-                    self._download_progress[project_id].is_running = False
-                    return
-
-                # Initialize PDF downloader
-                downloader = PDFDownloader(project_path)
-                automatic_dir = project_path / "pdfs" / "automatic"
-                automatic_dir.mkdir(parents=True, exist_ok=True)
-
-                # Download papers one by one with real-time progress updates
-                successful_downloads = 0
-                failed_downloads = 0
-
-                for i, (idx, paper) in enumerate(papers_to_download):
-                    # Check if download was cancelled
-                    if not self._download_progress[project_id].is_running:
-                        print("❌ Download cancelled by user")
-                        break
-
-                    paper_id = str(idx)
-                    paper_title = paper.get(
-                        "title", paper.get("Title", f"Paper {paper_id}")
+                print(
+                    (
+                        f"📄 Downloading {i+1}/{len(papers_to_download)}: "
+                        f"{paper_title[:50]}..."
                     )
+                )
 
-                    print(
-                        (
-                            f"📄 Downloading {i+1}/{len(papers_to_download)}: "
-                            f"{paper_title[:50]}..."
-                        )
+                try:
+                    # Try to download this specific paper
+                    result = downloader._download_paper_pdf(
+                        paper,
+                        automatic_dir,
+                        "retry_automatic" if retry_failed else "automatic",
                     )
 
-                    try:
-                        # Try to download this specific paper
-                        result = downloader._download_paper_pdf(
-                            paper,
-                            automatic_dir,
-                            "retry_automatic" if retry_failed else "automatic",
-                        )
-
-                        if result.status == DownloadStatus.SUCCESS:
-                            successful_downloads += 1
-                            print(f"✅ Downloaded: {result.title[:50]}")
-                        else:
-                            failed_downloads += 1
-                            print(f"❌ Failed: {result.error_message}")
-
-                    except Exception as e:
+                    if result.status == DownloadStatus.SUCCESS:
+                        successful_downloads += 1
+                        print(f"✅ Downloaded: {result.title[:50]}")
+                    else:
                         failed_downloads += 1
-                        print(f"❌ Error downloading {paper_id}: {str(e)[:100]}")
+                        print(f"❌ Failed: {result.error_message}")
 
-                    # Update progress in real-time
-                    self._download_progress[project_id].completed = i + 1
-                    self._download_progress[project_id].success = successful_downloads
-                    self._download_progress[project_id].failed = failed_downloads
+                except Exception as e:
+                    failed_downloads += 1
+                    print(f"❌ Error downloading {paper_id}: {str(e)[:100]}")
+
+                # Update progress in real-time
+                job.publish(
+                    completed=i + 1,
+                    success=successful_downloads,
+                    failed=failed_downloads,
+                )
 
-                    # Brief pause to prevent overwhelming the system
-                    time.sleep(0.2)
+                # Brief pause to prevent overwhelming the system
+                time.sleep(0.2)
 
-                # Mark download as completed
-                self._download_progress[project_id].is_running = False
-                total_papers = len(papers_to_download)
+            # Mark download as completed
+            job.publish(is_running=False)
+            total_papers = len(papers_to_download)
 
-                print("🎯 Download completed!")
-                print(f"   ✅ Successful: {successful_downloads}/{total_papers}")
-                print(f"   ❌ Failed: {failed_downloads}/{total_papers}")
-                print(
-                    f"   📊 Success rate: {(successful_downloads/total_papers*100):.1f}%"
-                )
+            print("🎯 Download completed!")
+            print(f"   ✅ Successful: {successful_downloads}/{total_papers}")
+            print(f"   ❌ Failed: {failed_downloads}/{total_papers}")
+            print(f"   📊 Success rate: {(successful_downloads/total_papers*100):.1f}%")
 
         except Exception as e:
             print(f"💥 Critical error in download worker: {e}")
             import traceback
 
             traceback.print_exc()
-            if project_id in self._download_progress:
-                self._download_progress[project_id].error_message = str(e)
-                self._download_progress[project_id].is_running = False
+            job.publish(error_message=str(e), is_running=False)
 
     def _generate_pdf_filename(self, paper: pd.Series, paper_id: str) -> str:
         """Generate a proper filename for a PDF based on paper metadata."""
@@ -3174,54 +4290,16 @@ class PapervisorWebServer:
 
         return filename
 
-    def _split_text_into_chunks(self, text: str, chunk_size: int = 2000) -> List[str]:
-        """Split text into overlapping chunks as fallback when section extraction fails.
-
-        Args:
-            text: The full text to split
-            chunk_size: Target size for each chunk in characters
-
-        Returns:
-            List of text chunks
-        """
-        chunks = []
-        words = text.split()
-
-        current_chunk: List[str] = []
-        current_length = 0
-
-        for word in words:
-            word_length = len(word) + 1  # +1 for space
-
-            if current_length + word_length > chunk_size and current_chunk:
-                # Save current chunk
-                chunks.append(" ".join(current_chunk))
-
-                # Start new chunk with overlap (last 20% of words)
-                overlap_size = max(1, len(current_chunk) // 5)
-                current_chunk = current_chunk[-overlap_size:]
-                current_length = sum(len(w) + 1 for w in current_chunk)
-
-            current_chunk.append(word)
-            current_length += word_length
-
-        # Add the last chunk
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        return chunks
-
     def _load_screening_results(self, project_path: Path) -> Dict[str, Any]:
         """Load screening results from JSON file."""
         file = project_path / "screening_results.json"
         if file.exists():
             try:
-                with open(file, "r") as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        return data
-                    else:
-                        return {}
+                data = _load_json_file(str(file))
+                if isinstance(data, dict):
+                    return data
+                else:
+                    return {}
             except Exception:
                 return {}
         return {}
@@ -3232,8 +4310,7 @@ class PapervisorWebServer:
         """Save screening results to JSON file."""
         file = project_path / "screening_results.json"
         try:
-            with open(file, "w") as f:
-                json.dump(results, f, indent=2)
+            file.write_bytes(_dump_json_bytes(results))
         except Exception as e:
             print(f"Error saving screening results: {e}")
 
@@ -3342,22 +4419,30 @@ class PapervisorWebServer:
             justification = f"Error during screening: {str(e)}"
 
         # Save results
-        all_results = self._load_screening_results(project_path)
-        all_results[key] = {"result": result, "justification": justification}
-        self._save_screening_results(all_results, project_path)
+        with self._screening_results_lock:
+            all_results = self._load_screening_results(project_path)
+            all_results[key] = {"result": result, "justification": justification}
+            self._save_screening_results(all_results, project_path)
 
         print(f"Screened paper {key}: {result} - {justification[:100]}...")
 
     def _screen_papers_background(
         self, papers_list: List[Dict], project_path: Path
     ) -> None:
-        """Background thread for screening multiple papers."""
-        for paper in papers_list:
+        """Background thread for screening multiple papers.
+
+        Papers are screened concurrently, as each one mostly waits on the API.
+        """
+
+        def screen(paper: Dict) -> None:
             try:
                 self._screen_paper(paper, project_path)
             except Exception as e:
                 print(f"Error screening paper {paper['paper_id']}: {e}")
 
+        with ThreadPoolExecutor(max_workers=_SCREENING_WORKERS) as executor:
+            list(executor.map(screen, papers_list))
+
 
 def create_app(project_id: Optional[str] = None, data_dir: str = "data") -> Flask:
     """Flask app factory for Papervisor web server (for testing and WSGI)."""
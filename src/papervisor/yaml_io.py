@@ -0,0 +1,46 @@
+"""Cached YAML reading and writing for project and query index files."""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper, SafeLoader
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, _mtime_ns: int, _size: int) -> Any:
+    """Parse a YAML file; cached on its path, mtime and size."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)  # nosec B506 - safe loader
+
+
+def load_yaml(path: Path) -> Any:
+    """Load a YAML file, reusing the parsed data while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        A fresh copy of the parsed data, safe for the caller to modify
+    """
+    stat = Path(path).stat()
+    data = _parse_yaml(str(path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(data)
+
+
+def dump_yaml(data: Any, path: Path) -> None:
+    """Write data to a YAML file using the libyaml emitter when available.
+
+    Args:
+        data: Data to serialize
+        path: Destination file path
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
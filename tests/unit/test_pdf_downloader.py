@@ -111,6 +111,112 @@ def test_download_result_serialization() -> None:
     assert "timestamp" in result_dict
 
 
+def test_project_reports_generation() -> None:
+    """Test writing the project-level JSON, summary and guide reports."""
+    import json
+
+    import pandas as pd
+
+    from papervisor.pdf_downloader import PaperDownloadResult
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_path = Path(temp_dir) / "test_project"
+        project_path.mkdir()
+
+        downloader = PDFDownloader(project_path)
+
+        papers_df = pd.DataFrame(
+            {
+                "Authors": ["Smith, John", "Doe, Jane"],
+                "Year": [2023, 2022],
+                "DOI": ["10.1000/test", float("nan")],
+            }
+        )
+        results = [
+            PaperDownloadResult(
+                paper_id="0",
+                title="Downloaded Paper",
+                status=DownloadStatus.SUCCESS,
+                file_path=Path("0_Smith_2023.pdf"),
+                file_size=2048,
+            ),
+            PaperDownloadResult(
+                paper_id="1",
+                title="Manual Paper",
+                status=DownloadStatus.MANUAL_REQUIRED,
+                error_message="No open access PDF",
+            ),
+        ]
+
+        downloader._generate_project_reports(
+            "test_project", {"q1": results}, {"q1": papers_df}
+        )
+
+        reports = downloader.reports_path
+        latest = reports / "project_download_status_test_project_latest.json"
+        report = json.loads(latest.read_text(encoding="utf-8"))
+        assert report["summary"]["total_papers"] == 2
+        assert report["summary"]["successful_downloads"] == 1
+        assert report["by_query"]["q1"]["manual_required"] == 1
+
+        summary = next(reports.glob("project_download_summary_test_project_*.txt"))
+        summary_text = summary.read_text(encoding="utf-8")
+        assert "Total papers: 2" in summary_text
+        assert "q1 (2 papers):" in summary_text
+
+        guide = next(reports.glob("project_manual_download_guide_*.html"))
+        guide_html = guide.read_text(encoding="utf-8")
+        assert "Downloaded Paper" in guide_html
+        assert "2.0 KB" in guide_html
+        assert "Suggested filename:</strong> 1_Doe_" in guide_html
+
+
+def test_project_manual_download_html_cards() -> None:
+    """Test that every processed paper gets a complete card in the guide."""
+    from papervisor.pdf_downloader import PaperDownloadResult
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_path = Path(temp_dir) / "test_project"
+        project_path.mkdir()
+
+        downloader = PDFDownloader(project_path)
+
+        columns = {"Authors": ["Smith", "Doe"], "Year": [2023, 2022]}
+        successful = [
+            PaperDownloadResult(
+                paper_id=str(i),
+                title=f"Paper {i}",
+                status=DownloadStatus.SUCCESS,
+                file_size=1024 * (i + 1),
+            )
+            for i in range(2)
+        ]
+
+        html = downloader._generate_project_manual_download_html(
+            "test_project", {"q1": (columns, successful, [])}
+        )
+
+        assert "📊 Size: 1.0 KB" in html
+        assert "📊 Size: 2.0 KB" in html
+        assert html.count('<div class="paper success">') == 2
+
+        # A guide with no successful downloads must still render
+        manual = [
+            PaperDownloadResult(
+                paper_id="0",
+                title="Manual <Paper>",
+                status=DownloadStatus.MANUAL_REQUIRED,
+            )
+        ]
+        columns = {"Authors": ["Smith"], "Year": [2023], "DOI": [float("nan")]}
+        html = downloader._generate_project_manual_download_html(
+            "test_project", {"q1": (columns, [], manual)}
+        )
+        assert "📊 Size" not in html
+        assert "Manual &lt;Paper&gt;" in html
+        assert "DOI:" not in html
+
+
 if __name__ == "__main__":
     # Run basic tests
     test_pdf_downloader_initialization()
@@ -118,4 +224,6 @@ if __name__ == "__main__":
     test_download_urls_generation()
     test_arxiv_id_extraction()
     test_download_result_serialization()
+    test_project_reports_generation()
+    test_project_manual_download_html_cards()
     print("All PDF downloader tests passed!")
@@ -1,8 +1,12 @@
 """Unit tests for project manager functionality."""
 
+import os
 import tempfile
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
+import pytest
+
 from papervisor.project_manager import ProjectManager, LiteratureReviewProject
 
 
@@ -121,6 +125,72 @@ def test_literature_review_project_dataclass() -> None:
     assert created_dt.month == 8
     assert created_dt.day == 13
 
+    # Projects are read-only once loaded
+    with pytest.raises(FrozenInstanceError):
+        project.status = "completed"  # type: ignore[misc]
+
+
+def test_project_manager_ignores_unknown_index_keys() -> None:
+    """Test that extra keys in the projects index do not break loading."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = Path(temp_dir)
+        (data_dir / "projects_index.yaml").write_text(
+            """projects:
+  - project_id: "extra_keys"
+    title: "Extra Keys"
+    description: "Index entry with fields the dataclass does not know"
+    created_date: "2025-08-01"
+    status: "active"
+    lead_researcher: "Test User"
+    project_path: "literature_reviews/extra_keys"
+    search_queries_file: "literature_reviews/extra_keys/search_queries.yaml"
+    results_directory: "literature_reviews/extra_keys/results"
+    analysis_directory: "literature_reviews/extra_keys/analysis"
+    total_queries: 0
+    tags: []
+    legacy_field: "ignored"
+""",
+            encoding="utf-8",
+        )
+
+        pm = ProjectManager(data_dir)
+
+        project = pm.get_project_by_id("extra_keys")
+        assert project is not None
+        assert not hasattr(project, "legacy_field")
+
+
+def test_project_manager_reloads_changed_index() -> None:
+    """Test that projects added to the index file are found without a restart."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = Path(temp_dir)
+        pm = ProjectManager(data_dir)
+        assert pm.get_project_by_id("added") is None
+
+        index_file = data_dir / "projects_index.yaml"
+        index_file.write_text(
+            """projects:
+  - project_id: "added"
+    title: "Added"
+    description: "Project added while the manager is running"
+    created_date: "2025-08-01"
+    status: "active"
+    lead_researcher: "Test User"
+    project_path: "literature_reviews/added"
+    search_queries_file: "literature_reviews/added/search_queries.yaml"
+    results_directory: "literature_reviews/added/results"
+    analysis_directory: "literature_reviews/added/analysis"
+    total_queries: 0
+    tags: []
+""",
+            encoding="utf-8",
+        )
+        stat = index_file.stat()
+        os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert pm.get_project_by_id("added") is not None
+        assert len(pm.get_projects_by_status("active")) == 1
+
 
 if __name__ == "__main__":
     test_project_manager_initialization()
@@ -129,4 +199,15 @@ if __name__ == "__main__":
     test_project_manager_filtering()
     test_project_manager_directories()
     test_literature_review_project_dataclass()
+    test_project_manager_ignores_unknown_index_keys()
+    test_project_manager_reloads_changed_index()
     print("All project manager unit tests passed!")
+
+
+def test_project_managers_share_parsed_index() -> None:
+    """Test that managers of the same data directory reuse the parsed index."""
+    data_dir = Path(__file__).parent.parent / "data"
+    first_projects = ProjectManager(data_dir).get_all_projects()
+    second_projects = ProjectManager(data_dir).get_all_projects()
+    assert first_projects
+    assert all(a is b for a, b in zip(first_projects, second_projects))
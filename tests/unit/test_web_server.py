@@ -0,0 +1,631 @@
+"""Unit tests for web server helpers."""
+
+import difflib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from papervisor.web_server import (
+    PapervisorWebServer,
+    _CONSOLIDATED_DTYPES,
+    _PYARROW_AVAILABLE,
+    _count_csv_rows,
+    _download_index,
+    _download_stats,
+    _extract_academic_sections,
+    _extract_pdf_text,
+    _extract_pdf_text_in_worker,
+    _extraction_jobs,
+    _downloaded_paper_records,
+    _dump_json_bytes,
+    _group_duplicates,
+    _included_papers,
+    _index_downloads_by_paper,
+    _lcs_ratio,
+    _list_pdfs,
+    _load_json_file,
+    _load_consolidated,
+    _non_duplicates,
+    _normalize_papers,
+    _paper_details,
+    _paper_index,
+    _paper_match_fields,
+    _paper_similarity,
+    _paper_view,
+    _parse_authors,
+    _pdfium_page_texts,
+    _preprocess_text,
+    _project_stats,
+    _pypdf2_page_texts,
+    _read_csv_cached,
+    _readable_section_name,
+    _similarity_candidates,
+    _split_source_queries,
+    _submit_extraction,
+    _text_metrics,
+    _truncate_text,
+)
+
+
+def test_read_csv_cached_picks_up_file_changes(tmp_path: Path) -> None:
+    """Test that cached CSV reads are invalidated when the file is rewritten."""
+    path = tmp_path / "consolidated_papers.csv"
+    path.write_text("title\nFirst\n", encoding="utf-8")
+
+    first = _read_csv_cached(path)
+    first["title"] = "Changed"
+    assert list(_read_csv_cached(path)["title"]) == ["First"]
+
+    path.write_text("title\nFirst\nSecond\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert list(_read_csv_cached(path)["title"]) == ["First", "Second"]
+
+
+def test_load_consolidated_matches_csv(tmp_path: Path) -> None:
+    """Test that consolidated papers load the same with or without a sidecar."""
+    path = tmp_path / "consolidated_papers.csv"
+    path.write_text("title,Year\nFirst,2023\nSecond,2024\n", encoding="utf-8")
+
+    papers_df = _load_consolidated(path)
+
+    assert list(papers_df["title"]) == ["First", "Second"]
+    assert path.with_suffix(".parquet").exists() == _PYARROW_AVAILABLE
+    assert list(_load_consolidated(path)["Year"]) == [2023, 2024]
+
+
+def test_parquet_sidecar_follows_csv_version(tmp_path: Path) -> None:
+    """Test that the sidecar is stamped with the CSV mtime and rebuilt on change."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "consolidated_papers.csv"
+    parquet_path = path.with_suffix(".parquet")
+    path.write_text("title,Year\nFirst,2023\n", encoding="utf-8")
+
+    _load_consolidated(path)
+    assert parquet_path.stat().st_mtime_ns == path.stat().st_mtime_ns
+    assert list(pd.read_parquet(parquet_path)["title"]) == ["First"]
+    assert list(_load_consolidated(path)["title"]) == ["First"]
+
+    # A sidecar newer than the CSV is still stale if it was built from
+    # another version of the CSV
+    path.write_text("title,Year\nSecond,2024\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(parquet_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert list(_load_consolidated(path)["title"]) == ["Second"]
+    assert list(pd.read_parquet(parquet_path)["title"]) == ["Second"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "consolidated_papers.csv",
+        "consolidated_papers.parquet",
+    ]
+
+
+def test_read_csv_cached_with_pyarrow_matches_c_parser(tmp_path: Path) -> None:
+    """Test that the pyarrow parser reads the same frame as the C parser."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "consolidated_papers.csv"
+    path.write_text(
+        'title,Abstract,Year,is_duplicate\nFirst,"Line one\nline two",2023,True\n'
+        "Second,,2024,\n",
+        encoding="utf-8",
+    )
+
+    papers_df = _read_csv_cached(path, _CONSOLIDATED_DTYPES)
+
+    expected = pd.read_csv(path, dtype=dict(_CONSOLIDATED_DTYPES))
+    pd.testing.assert_frame_equal(papers_df, expected)
+
+
+def test_unknown_log_level_does_not_stop_server(
+    demo_project_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an invalid PAPERVISOR_LOG_LEVEL warns and is ignored."""
+    logger = logging.getLogger("papervisor.web_server")
+    level = logger.level
+
+    monkeypatch.setenv("PAPERVISOR_LOG_LEVEL", "verbose")
+    with pytest.warns(UserWarning, match="PAPERVISOR_LOG_LEVEL"):
+        PapervisorWebServer(data_dir=str(demo_project_data_dir))
+    assert logger.level == level
+
+    monkeypatch.setenv("PAPERVISOR_LOG_LEVEL", "debug")
+    try:
+        PapervisorWebServer(data_dir=str(demo_project_data_dir))
+        assert logger.level == logging.DEBUG
+    finally:
+        logger.setLevel(level)
+
+
+def test_paper_view_columns() -> None:
+    """Test building the per-paper fields from aliased and missing columns."""
+    papers_df = pd.DataFrame(
+        {
+            "Title": ["First", "Second"],
+            "DOI": ["10.1000/test", float("nan")],
+            "URL": [float("nan"), " https://example.org/paper "],
+        }
+    )
+
+    papers = _paper_view(_normalize_papers(papers_df)).to_dict(orient="records")
+
+    assert papers[0]["paper_id"] == "0"
+    assert papers[0]["title"] == "First"
+    assert papers[0]["authors"] == "Unknown Authors"
+    assert papers[0]["urls"] == {"DOI": "https://doi.org/10.1000/test"}
+    assert papers[1]["doi"] == ""
+    assert papers[1]["urls"] == {"Original URL": "https://example.org/paper"}
+
+
+def test_paper_details_fill_missing_values(tmp_path: Path) -> None:
+    """Test that paper details use aliases and empty strings for gaps."""
+    path = tmp_path / "consolidated_papers.csv"
+    path.write_text(
+        "Title,year,DOI\nFirst,2023,10.1000/test\n,2024,\n", encoding="utf-8"
+    )
+
+    first, second = _paper_details(path)
+
+    assert first["title"] == "First"
+    assert first["year"] == "2023"
+    assert first["abstract"] == ""
+    assert first["urls"] == {"DOI": "https://doi.org/10.1000/test"}
+    assert second["title"] == second["doi"] == ""
+    assert second["urls"] == {}
+
+
+def test_normalize_papers_fills_missing_fields() -> None:
+    """Test aliasing columns and filling missing duplicate and text fields."""
+    papers_df = pd.DataFrame(
+        {
+            "title": ["First", "Second"],
+            "Title": ["Ignored", "Ignored"],
+            "Year": [2023, 2024],
+            "source_queries": ["q1", float("nan")],
+            "is_duplicate": [float("nan"), True],
+        }
+    )
+
+    papers = _normalize_papers(papers_df)
+
+    assert list(papers["title"]) == ["First", "Second"]
+    assert list(papers["year"]) == [2023, 2024]
+    assert list(papers["authors"]) == ["Unknown Authors"] * 2
+    assert list(papers["source_queries"]) == ["q1", ""]
+    assert list(papers["is_duplicate"]) == [False, True]
+    assert list(papers["Abstract"]) == ["", ""]
+
+
+def test_truncate_text() -> None:
+    """Test that only long string values are shortened."""
+    text = pd.Series(["a" * 201, "short", float("nan")])
+
+    truncated = _truncate_text(text, 200)
+
+    assert truncated[0] == "a" * 200 + "..."
+    assert truncated[1] == "short"
+    assert pd.isna(truncated[2])
+    assert list(_truncate_text(pd.Series([1, 2]), 200)) == [1, 2]
+
+
+def test_group_duplicates_merges_source_queries() -> None:
+    """Test grouping duplicates, including duplicates of the first paper."""
+    papers_df = pd.DataFrame(
+        {
+            "source_queries": ["q1", "q2", "q1,q3", "q4", float("nan")],
+            "is_duplicate": [False, True, False, True, True],
+            "duplicate_of": [float("nan"), 0.0, float("nan"), 2.0, 0.0],
+        }
+    )
+
+    duplicate_info, merged = _group_duplicates(papers_df)
+
+    assert duplicate_info == {0: [1, 4], 2: [3]}
+    assert merged == {0: {"q1", "q2"}, 2: {"q1", "q3", "q4"}}
+    assert _group_duplicates(papers_df.drop(columns="duplicate_of")) == ({}, {})
+
+
+def test_split_source_queries() -> None:
+    """Test splitting source queries with stray whitespace and empty parts."""
+    assert _split_source_queries("q1") == ["q1"]
+    assert _split_source_queries(" q1 , q2,,q3 ") == ["q1", "q2", "q3"]
+    assert _split_source_queries("") == []
+    assert _split_source_queries(float("nan")) == []
+
+
+def test_readable_section_name() -> None:
+    """Test exact, partial and unknown section keys."""
+    assert _readable_section_name("intro") == "Introduction"
+    assert _readable_section_name("Related_Work") == "Related Work"
+    assert _readable_section_name("lit") == "Literature Review"
+    assert _readable_section_name("appendix_a") == "Appendix_A"
+
+
+def test_index_downloads_by_paper() -> None:
+    """Test that downloaded files are found by exact paper ID prefix."""
+    files_info = [
+        {"filename": "1_Smith_2023.pdf", "source": "automatic"},
+        {"filename": "12_Doe_2022.pdf", "source": "automatic"},
+        {"filename": "1_Smith_2023_v2.pdf", "source": "manual"},
+    ]
+
+    by_paper = _index_downloads_by_paper(files_info)
+
+    assert by_paper["1"]["source"] == "automatic"
+    assert by_paper["12"]["filename"] == "12_Doe_2022.pdf"
+    assert "2" not in by_paper
+
+
+def test_downloaded_paper_records() -> None:
+    """Test that only downloaded papers are returned, with their file details."""
+    papers_df = pd.DataFrame({"title": ["First", "Second", "Third"]}, index=[0, 2, 5])
+    downloads_by_paper = {
+        "2": {"filename": "2_Doe_2022.pdf", "source": "manual"},
+        "7": {"filename": "7_Roe_2021.pdf", "source": "automatic"},
+    }
+
+    records = _downloaded_paper_records(papers_df, downloads_by_paper)
+
+    assert records == [
+        {
+            "title": "Second",
+            "paper_id": 2,
+            "downloaded_file": "2_Doe_2022.pdf",
+            "download_source": "manual",
+        }
+    ]
+
+
+def test_project_stats_follow_file_changes(tmp_path: Path) -> None:
+    """Test that cached project statistics refresh when PDFs are added."""
+    assert _project_stats(tmp_path)["has_consolidated"] is False
+
+    pdfs_dir = tmp_path / "pdfs"
+    (pdfs_dir / "automatic").mkdir(parents=True)
+    (pdfs_dir / "consolidated_papers.csv").write_text(
+        "title\nFirst\nSecond\n", encoding="utf-8"
+    )
+    stats = _project_stats(tmp_path)
+    assert stats["has_consolidated"] is True
+    assert stats["total_papers"] == 2
+    assert stats["downloaded_papers"] == 0
+
+    (pdfs_dir / "automatic" / "0_Smith_2023.pdf").write_bytes(b"%PDF")
+    (pdfs_dir / "automatic" / "notes.txt").write_text("", encoding="utf-8")
+    automatic = pdfs_dir / "automatic"
+    stat = automatic.stat()
+    os.utime(automatic, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _project_stats(tmp_path)["downloaded_papers"] == 1
+
+
+def test_count_csv_rows_handles_multiline_fields(tmp_path: Path) -> None:
+    """Test that row counts match read_csv for quoted multi-line fields."""
+    path = tmp_path / "query.csv"
+    path.write_text(
+        'title,Abstract\nFirst,"Line one\nline two"\n\nSecond,Short\n',
+        encoding="utf-8",
+    )
+
+    assert _count_csv_rows(path) == len(pd.read_csv(path)) == 2
+
+
+def test_load_consolidated_keeps_text_columns_as_strings(tmp_path: Path) -> None:
+    """Test that numeric-looking titles and DOIs are not parsed as numbers."""
+    path = tmp_path / "consolidated_papers.csv"
+    path.write_text("title,DOI,year\n1984,12345,2020\n,,2021\n", encoding="utf-8")
+
+    papers = _load_consolidated(path).to_dict(orient="records")
+
+    assert papers[0]["title"] == "1984"
+    assert papers[0]["DOI"] == "12345"
+    assert papers[0]["year"] == 2020
+    assert pd.isna(papers[1]["title"])
+
+
+def test_load_consolidated_reads_duplicate_flags(tmp_path: Path) -> None:
+    """Test that missing duplicate flags load as not duplicate."""
+    path = tmp_path / "consolidated_papers.csv"
+    path.write_text(
+        "title,is_duplicate,duplicate_of\nFirst,False,\nSecond,True,0\nThird,,\n",
+        encoding="utf-8",
+    )
+
+    papers_df = _load_consolidated(path)
+
+    assert str(papers_df["is_duplicate"].dtype) == "boolean"
+    assert list(_non_duplicates(papers_df)["title"]) == ["First", "Third"]
+    assert papers_df.loc[1, "duplicate_of"] == "0"
+
+
+def test_list_pdfs_refreshes_on_directory_change(tmp_path: Path) -> None:
+    """Test that cached PDF listings follow files being added."""
+    assert _list_pdfs(tmp_path / "missing") == ()
+
+    (tmp_path / "0_Smith_2023.pdf").write_bytes(b"%PDF")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    assert _list_pdfs(tmp_path) == ("0_Smith_2023.pdf",)
+
+    (tmp_path / "1_Doe_2022.pdf").write_bytes(b"%PDF")
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert sorted(_list_pdfs(tmp_path)) == ["0_Smith_2023.pdf", "1_Doe_2022.pdf"]
+
+
+def test_download_stats_follow_latest_report(tmp_path: Path) -> None:
+    """Test that cached download statistics refresh when a report is rewritten."""
+    reports_dir = tmp_path / "pdfs" / "automatic" / "reports"
+    reports_dir.mkdir(parents=True)
+    latest = reports_dir / "project_download_status_test_latest.json"
+    latest.write_text('{"summary": {"total_papers": 1}}', encoding="utf-8")
+
+    stats = _download_stats(tmp_path)
+    assert stats["summary"]["total_papers"] == 1
+    stats["summary"]["total_papers"] = 5
+    assert _download_stats(tmp_path)["summary"]["total_papers"] == 1
+
+    latest.write_text('{"summary": {"total_papers": 2}}', encoding="utf-8")
+    stat = latest.stat()
+    os.utime(latest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _download_stats(tmp_path)["summary"]["total_papers"] == 2
+
+
+def test_text_metrics_follow_file_changes(tmp_path: Path) -> None:
+    """Test word counts from extracted sections and refreshing on rewrite."""
+    path = tmp_path / "0_extracted.json"
+    path.write_text(
+        '{"extraction_metadata": {"text_length": 120, "total_pages": 3},'
+        ' "abstract": "one two", "methods": "",'
+        ' "additional_sections": {"appendix": "three four five"}}',
+        encoding="utf-8",
+    )
+
+    metrics = _text_metrics(path)
+    assert metrics["word_count"] == 5
+    assert metrics["pages_count"] == 3
+    assert metrics["character_count"] == 120
+
+    path.write_text('{"abstract": "one"}', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _text_metrics(path)["word_count"] == 1
+
+
+def test_submit_extraction_runs_one_job_per_project() -> None:
+    """Test that a project's extraction is rejected while one is still live."""
+    release = threading.Event()
+    ran = []
+
+    assert _submit_extraction("pool_test", release.wait)
+    assert not _submit_extraction("pool_test", ran.append, "second")
+    release.set()
+
+    _extraction_jobs["pool_test"].result(timeout=5)
+    assert _submit_extraction("pool_test", ran.append, "third")
+    _extraction_jobs["pool_test"].result(timeout=5)
+    assert ran == ["third"]
+
+
+def test_paper_index_accepts_row_numbers_only() -> None:
+    """Test parsing paper IDs, including float IDs written by pandas."""
+    assert _paper_index("3") == 3
+    assert _paper_index("3.0") == 3
+    assert _paper_index(" 12 ") == 12
+    for invalid in ("", "-1", "3.5", "1e2", "abc"):
+        assert _paper_index(invalid) is None
+
+
+def test_paper_similarity_scores_and_threshold() -> None:
+    """Test similarity scores and rejecting pairs below a threshold early."""
+    paper = _paper_match_fields(
+        {"title": "Call Routing", "authors": "Smith", "year": "2020", "doi": ""}
+    )
+    retitled = _paper_match_fields(
+        {"title": "Call-routing", "authors": "Smith", "year": "2021", "doi": ""}
+    )
+    other = _paper_match_fields(
+        {"title": "Workforce planning", "authors": "Doe", "year": "Unknown"}
+    )
+    same_doi = _paper_match_fields(
+        {"title": "Other", "authors": "", "year": "", "doi": "10.1/X"}
+    )
+
+    assert _paper_similarity(paper, retitled) == pytest.approx(0.98)
+    assert 0 < _paper_similarity(paper, other) <= 0.6
+    assert _paper_similarity(paper, other, threshold=0.6) == 0.0
+    doi_paper = _paper_match_fields({"doi": "10.1/x", "title": "Call"})
+    assert _paper_similarity(doi_paper, same_doi, threshold=0.6) == 1.0
+
+
+def test_lcs_ratio_bounds_sequence_matcher() -> None:
+    """Test that the rapidfuzz pre-filter never rejects a difflib match."""
+    pytest.importorskip("rapidfuzz")
+    pairs = [
+        ("", ""),
+        ("abc", ""),
+        ("callrouting", "callroutnig"),
+        ("ab" * 150, "ba" * 150),
+    ]
+    for first, second in pairs:
+        ratio = difflib.SequenceMatcher(None, first, second).ratio()
+        assert _lcs_ratio(first, second) >= ratio
+    assert _lcs_ratio("call", "call") == 1.0
+
+
+def test_similarity_candidates_keep_every_match() -> None:
+    """Test that candidate pairs include every pair above the threshold."""
+    pytest.importorskip("rapidfuzz")
+    papers = [
+        {"title": "Call Routing", "authors": "Smith", "year": "2020", "doi": ""},
+        {"title": "Call-routing", "authors": "Smith", "year": "2021", "doi": ""},
+        {"title": "Workforce planning", "authors": "Doe", "year": "2019"},
+        {"title": "Other", "authors": "", "year": "", "doi": "10.1/x"},
+        {"title": "Unrelated", "authors": "Li", "year": "2018", "doi": "10.1/X"},
+    ]
+    fields = [_paper_match_fields(paper) for paper in papers]
+
+    candidates = _similarity_candidates(fields, 0.6)
+
+    assert candidates is not None
+    for i, first in enumerate(fields):
+        for j, second in enumerate(fields):
+            if _paper_similarity(first, second) > 0.6:
+                assert j in candidates[i]
+    assert 2 not in candidates[0]
+    assert candidates[3] == {3, 4}
+
+
+def test_download_index_follows_directory_changes(tmp_path: Path) -> None:
+    """Test that the download index is rebuilt when a PDF directory changes."""
+    automatic = tmp_path / "pdfs" / "automatic"
+    automatic.mkdir(parents=True)
+    (automatic / "0_Smith_2020.pdf").write_bytes(b"%PDF")
+
+    index = _download_index(tmp_path)
+    assert index["0"]["source"] == "automatic"
+    index.clear()
+
+    manual = tmp_path / "pdfs" / "manual"
+    manual.mkdir()
+    (manual / "1_Doe_2021.pdf").write_bytes(b"%PDF")
+
+    index = _download_index(tmp_path)
+    assert sorted(index) == ["0", "1"]
+    assert index["1"]["filename"] == "1_Doe_2021.pdf"
+
+
+def test_included_papers_reads_only_included_rows() -> None:
+    """Test selecting included papers with their title and abstract."""
+    papers_df = pd.DataFrame(
+        {"Title": ["First", "Second", "Third"], "Abstract": ["a", None, "c"]}
+    )
+    extraction_status = {
+        "2": {"screening_action": "include"},
+        "0": {"screening_action": "exclude"},
+        "1": {"screening_action": "include"},
+    }
+
+    included = _included_papers(papers_df, extraction_status)
+
+    assert [(idx, title) for idx, title, _ in included] == [
+        (1, "Second"),
+        (2, "Third"),
+    ]
+    assert included[1][2] == "c"
+    assert _included_papers(papers_df[["Abstract"]], extraction_status)[0][1] == ""
+
+
+def test_dump_json_bytes_round_trips(tmp_path: Path) -> None:
+    """Test that dumped JSON reads back, including data orjson rejects."""
+    path = tmp_path / "status.json"
+    status = {"0": {"status": "completed", "title": "Café", "sections": ["a"]}}
+    path.write_bytes(_dump_json_bytes(status))
+    assert _load_json_file(str(path)) == status
+    assert path.read_text(encoding="utf-8").startswith('{\n  "0"')
+
+    path.write_bytes(_dump_json_bytes({1: "Café"}))
+    assert _load_json_file(str(path)) == {"1": "Café"}
+    assert "Café" in path.read_text(encoding="utf-8")
+
+
+def test_extract_academic_sections_finds_headers() -> None:
+    """Test that cleaned text is split at its section headers."""
+    body = " ".join(["call center agents handle demand with forecasting models"] * 3)
+    text = "\n\n".join(
+        f"{header}\n{body}"
+        for header in ("Abstract", "1. Introduction", "2. Methods", "4 Conclusion")
+    )
+
+    sections = _extract_academic_sections(_preprocess_text(text))
+
+    assert list(sections) == ["abstract", "introduction", "methods", "conclusion"]
+    assert sections["methods"] == body
+    assert _preprocess_text("Call-\n center\n12\nwordWord  x") == (
+        "Callcenter\nword Word x"
+    )
+
+
+def test_parse_authors_splits_on_every_separator() -> None:
+    """Test that authors are split on all separators and cleaned."""
+    authors = _parse_authors("Smith, J. (MIT); Doe  Jane and Lee & Kim\nA. Anderson, X")
+
+    assert authors == ["Smith", "J.", "Doe Jane", "Lee", "Kim", "A. Anderson"]
+    assert _parse_authors("") == []
+
+
+def test_pdf_readers_extract_the_same_pages(demo_project_data_dir: Path) -> None:
+    """Test that PDFium and PyPDF2 read the same pages and words of a paper."""
+    pytest.importorskip("pypdfium2")
+    pdf_path = (
+        demo_project_data_dir
+        / "literature_reviews"
+        / "demo_contact_center_ai"
+        / "pdfs"
+        / "manual"
+        / "0_Li_2018_Predicting_call_center_performance_with_machine_le.pdf"
+    )
+
+    pdfium_pages = _pdfium_page_texts(pdf_path)
+    pypdf2_pages = _pypdf2_page_texts(pdf_path)
+
+    assert len(pdfium_pages) == len(pypdf2_pages) == 6
+    assert "\r" not in "".join(pdfium_pages)
+    assert "Predicting Call Center Performance" in pdfium_pages[0]
+    assert "Predicting Call Center Performance" in pypdf2_pages[0]
+
+
+def test_extract_pdf_text_in_spawned_worker(demo_project_data_dir: Path) -> None:
+    """Test that PDF extraction runs in a spawned process without a server."""
+    pdf_path = (
+        demo_project_data_dir
+        / "literature_reviews"
+        / "demo_contact_center_ai"
+        / "pdfs"
+        / "manual"
+        / "0_Li_2018_Predicting_call_center_performance_with_machine_le.pdf"
+    )
+    paper = {"paper_id": "0", "title": "Predicting", "authors": "Li, Xin"}
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        extracted = pool.submit(
+            _extract_pdf_text_in_worker, str(pdf_path), paper
+        ).result(timeout=60)
+
+    expected = _extract_pdf_text(pdf_path, paper)
+    assert extracted["authors"] == ["Li", "Xin"]
+    assert extracted["introduction"] == expected["introduction"]
+    metadata = extracted["extraction_metadata"]
+    assert (
+        metadata["sections_found"] == expected["extraction_metadata"]["sections_found"]
+    )
+    assert metadata["total_pages"] == 6
+
+
+def test_pdfium_reads_from_concurrent_threads(demo_project_data_dir: Path) -> None:
+    """Test that request threads can read PDFs with PDFium at the same time."""
+    pytest.importorskip("pypdfium2")
+    pdf_path = (
+        demo_project_data_dir
+        / "literature_reviews"
+        / "demo_contact_center_ai"
+        / "pdfs"
+        / "manual"
+        / "0_Li_2018_Predicting_call_center_performance_with_machine_le.pdf"
+    )
+    expected = _pdfium_page_texts(pdf_path)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_pdfium_page_texts, [pdf_path] * 8))
+
+    assert all(pages == expected for pages in results)
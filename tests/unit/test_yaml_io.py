@@ -0,0 +1,45 @@
+"""Unit tests for cached YAML reading and writing."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from papervisor.yaml_io import dump_yaml, load_yaml
+
+
+def test_load_yaml_returns_independent_copies() -> None:
+    """Test that callers can modify loaded data without affecting the cache."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "queries.yaml"
+        path.write_text("search_queries:\n  - id: q1\n", encoding="utf-8")
+
+        first = load_yaml(path)
+        first["search_queries"][0]["project_id"] = "changed"
+
+        second = load_yaml(path)
+        assert second == {"search_queries": [{"id": "q1"}]}
+
+
+def test_load_yaml_picks_up_file_changes() -> None:
+    """Test that a modified file is parsed again."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "projects_index.yaml"
+        path.write_text("projects: []\n", encoding="utf-8")
+        assert load_yaml(path) == {"projects": []}
+
+        path.write_text("projects:\n  - project_id: p1\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_yaml(path) == {"projects": [{"project_id": "p1"}]}
+
+
+def test_dump_yaml_round_trip() -> None:
+    """Test that dumped data loads back unchanged."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "projects_index.yaml"
+        data = {"projects": [{"project_id": "p1", "tags": ["a", "b"]}]}
+
+        dump_yaml(data, path)
+
+        assert load_yaml(path) == data
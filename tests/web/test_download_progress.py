@@ -0,0 +1,117 @@
+"""Tests for the download progress event stream."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, List
+
+from papervisor.web_server import (
+    DownloadProgress,
+    PapervisorWebServer,
+    _DownloadJob,
+    _download_jobs,
+)
+
+
+def test_progress_stream_reports_finished_download(web_client: Any) -> None:
+    """Test that the stream sends the current state and ends when idle."""
+    _download_jobs["stream_test"] = _DownloadJob(
+        DownloadProgress(
+            project_id="stream_test", total_papers=4, completed=4, success=3
+        )
+    )
+    try:
+        response = web_client.get("/project/stream_test/progress")
+    finally:
+        del _download_jobs["stream_test"]
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in response.get_data(as_text=True).splitlines()
+        if line.startswith("data: ")
+    ]
+    assert len(events) == 1
+    assert events[0]["completed"] == 4
+    assert events[0]["success"] == 3
+    assert events[0]["is_running"] is False
+
+
+def test_progress_stream_without_download(web_client: Any) -> None:
+    """Test that a project with no download gets a single idle event."""
+    response = web_client.get("/project/no_download/progress")
+
+    body = response.get_data(as_text=True)
+    assert body.count("data: ") == 1
+    assert '"is_running": false' in body
+
+
+def test_download_job_publishes_snapshots() -> None:
+    """Test that published progress replaces, rather than mutates, snapshots."""
+    job = _DownloadJob(DownloadProgress(project_id="job_test", is_running=True))
+    first = job.progress
+
+    job.publish(completed=1, success=1)
+
+    assert first.completed == 0
+    assert job.progress.completed == 1
+    assert job.version == 1
+
+
+def test_progress_streams_all_wake_on_updates(demo_project_data_dir: Path) -> None:
+    """Test that every open stream gets each update and the final snapshot."""
+    web_server = PapervisorWebServer(data_dir=str(demo_project_data_dir))
+    job = _DownloadJob(DownloadProgress(project_id="fanout_test", is_running=True))
+    _download_jobs["fanout_test"] = job
+    received: List[List[str]] = [[], []]
+
+    def listen(events: List[str]) -> None:
+        # A long heartbeat makes a missed wake-up hang the stream
+        for event in web_server._progress_events("fanout_test", heartbeat=30.0):
+            events.append(event)
+
+    listeners = [threading.Thread(target=listen, args=(e,)) for e in received]
+    try:
+        for listener in listeners:
+            listener.start()
+        while any(not events for events in received):
+            time.sleep(0.01)
+        job.publish(completed=1)
+        job.publish(completed=2, is_running=False)
+        for listener in listeners:
+            listener.join(timeout=5)
+    finally:
+        del _download_jobs["fanout_test"]
+
+    assert not any(listener.is_alive() for listener in listeners)
+    for events in received:
+        final = json.loads(events[-1][len("data: ") :])
+        assert final["completed"] == 2
+        assert final["is_running"] is False
+
+
+def test_progress_api_follows_progress_updates(web_client: Any) -> None:
+    """Test that polled download progress is reused until the next update."""
+    job = _DownloadJob(
+        DownloadProgress(project_id="poll_test", total_papers=3, is_running=True)
+    )
+    _download_jobs["poll_test"] = job
+    url = "/project/poll_test/api/download_progress"
+    try:
+        first = web_client.get(url).get_json()
+        assert first["total_papers"] == 3
+        cached = job.serialized
+        assert web_client.get(url).get_json() == first
+        assert job.serialized is cached
+
+        job.publish(completed=1)
+        second = web_client.get(url).get_json()
+    finally:
+        del _download_jobs["poll_test"]
+
+    assert second["completed"] == 1
+    assert second["total_papers"] == 3
+    assert web_client.get(url).get_json()["is_running"] is False
@@ -0,0 +1,80 @@
+"""Tests for marking duplicates on the review page."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from papervisor.web_server import PapervisorWebServer, _load_consolidated
+
+
+def test_mark_duplicates_updates_consolidated_file(
+    demo_project_data_dir: Path, tmp_path: Path
+) -> None:
+    """Test that duplicate marks are saved and later mappings take precedence."""
+    data_dir = tmp_path / "data"
+    shutil.copytree(
+        demo_project_data_dir, data_dir, ignore=shutil.ignore_patterns("*.pdf")
+    )
+    consolidated_path = (
+        data_dir
+        / "literature_reviews"
+        / "demo_contact_center_ai"
+        / "pdfs"
+        / "consolidated_papers.csv"
+    )
+    before = pd.read_csv(consolidated_path, dtype={"duplicate_of": "str"})
+
+    web_server = PapervisorWebServer(data_dir=str(data_dir))
+    web_server.app.config["TESTING"] = True
+    response = web_server.app.test_client().post(
+        "/project/demo_contact_center_ai/mark_duplicates",
+        data={"duplicate_of_3": "4", "duplicate_of_4": "7"},
+    )
+    assert response.status_code == 302
+
+    after = pd.read_csv(consolidated_path, dtype={"duplicate_of": "str"})
+    assert after.loc[3, "is_duplicate"]
+    assert after.loc[3, "duplicate_of"] == "4"
+    # Paper 4 was a reference first, then marked as a duplicate itself
+    assert after.loc[4, "is_duplicate"]
+    assert after.loc[4, "duplicate_of"] == "7"
+    assert not after.loc[7, "is_duplicate"]
+
+    unchanged = ~after.index.isin([3, 4, 7])
+    assert after[unchanged].equals(before[unchanged])
+
+
+def test_failed_duplicate_save_leaves_cached_papers_unchanged(
+    demo_project_data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that marks written with .loc never reach the cached frame."""
+    data_dir = tmp_path / "data"
+    shutil.copytree(
+        demo_project_data_dir, data_dir, ignore=shutil.ignore_patterns("*.pdf")
+    )
+    consolidated_path = (
+        data_dir
+        / "literature_reviews"
+        / "demo_contact_center_ai"
+        / "pdfs"
+        / "consolidated_papers.csv"
+    )
+    before = _load_consolidated(consolidated_path)
+
+    def failing_to_csv(*args: object, **kwargs: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", failing_to_csv)
+    web_server = PapervisorWebServer(data_dir=str(data_dir))
+    web_server.app.config["TESTING"] = True
+    response = web_server.app.test_client().post(
+        "/project/demo_contact_center_ai/mark_duplicates",
+        data={"duplicate_of_3": "4"},
+    )
+    assert response.status_code == 302
+
+    after = _load_consolidated(consolidated_path)
+    pd.testing.assert_frame_equal(after, before)
+    assert not after.loc[3, "is_duplicate"]
@@ -0,0 +1,121 @@
+"""Tests for conditional GET support on the read-only pages."""
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from papervisor.web_server import PapervisorWebServer
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/projects",
+        "/project/demo_contact_center_ai/review",
+        "/project/demo_contact_center_ai/downloads",
+    ],
+)
+def test_page_revalidates_with_etag(web_client: Any, url: str) -> None:
+    """Test that a page is served with an ETag and answers 304 when unchanged."""
+    response = web_client.get(url)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    etag = response.headers["ETag"]
+
+    cached = web_client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    stale = web_client.get(url, headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
+def test_page_with_flash_message_is_not_cached(web_client: Any) -> None:
+    """Test that pages showing flashed messages are always rendered."""
+    etag = web_client.get("/projects").headers["ETag"]
+
+    with web_client.session_transaction() as session:
+        session["_flashes"] = [("info", "Project consolidated")]
+
+    response = web_client.get("/projects", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert b"Project consolidated" in response.data
+    assert "ETag" not in response.headers
+
+
+def test_pdf_supports_conditional_and_range_requests(web_client: Any) -> None:
+    """Test that PDFs can be revalidated and fetched in ranges."""
+    url = "/project/demo_contact_center_ai/pdfs/automatic/0_li_2018_predicting_call_center.pdf"
+    response = web_client.get(url)
+    assert response.status_code == 200
+    assert "max-age=3600" in response.headers["Cache-Control"]
+
+    cached = web_client.get(
+        url, headers={"If-Modified-Since": response.headers["Last-Modified"]}
+    )
+    assert cached.status_code == 304
+
+    partial = web_client.get(url, headers={"Range": "bytes=0-3"})
+    assert partial.status_code == 206
+    assert partial.data == response.data[:4]
+    response.close()
+    partial.close()
+
+
+def test_extracted_text_revalidates(web_client: Any) -> None:
+    """Test that extracted texts are revalidated and answer 304 when unchanged."""
+    url = (
+        "/project/demo_contact_center_ai/extracted_texts/"
+        "0_li_2018_predicting_call_center.json"
+    )
+    response = web_client.get(url)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    cached = web_client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    response.close()
+
+    missing = web_client.get("/project/demo_contact_center_ai/extracted_texts/x.json")
+    assert missing.status_code == 404
+
+
+def test_extracted_text_x_accel_redirect(demo_project_data_dir: Path) -> None:
+    """Test that nginx is asked to send extracted texts when configured."""
+    server = PapervisorWebServer(data_dir=str(demo_project_data_dir))
+    server.app.config["X_ACCEL_PREFIX"] = "/_papervisor"
+    client = server.app.test_client()
+
+    filename = "1_ali_2011_intelligent_call_routing.json"
+    response = client.get(f"/project/demo_contact_center_ai/extracted_texts/{filename}")
+    assert response.status_code == 200
+    assert response.data == b""
+    assert response.headers["X-Accel-Redirect"] == (
+        "/_papervisor/literature_reviews/demo_contact_center_ai"
+        f"/pdfs/extracted_texts/{filename}"
+    )
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    missing = client.get("/project/demo_contact_center_ai/extracted_texts/x.json")
+    assert missing.status_code == 404
+
+
+def test_review_groups_are_reused(demo_project_data_dir: Path) -> None:
+    """Test that similarity groups are computed once per consolidated file."""
+    server = PapervisorWebServer(data_dir=str(demo_project_data_dir))
+    consolidated_path = (
+        demo_project_data_dir
+        / "literature_reviews"
+        / "demo_contact_center_ai"
+        / "pdfs"
+        / "consolidated_papers.csv"
+    )
+
+    groups = server._review_paper_groups(consolidated_path)
+
+    assert server._review_paper_groups(consolidated_path) is groups
+    assert sum(group["group_size"] for group in groups) == len(
+        pd.read_csv(consolidated_path)
+    )
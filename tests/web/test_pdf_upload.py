@@ -0,0 +1,64 @@
+"""Tests for uploading manually downloaded PDFs."""
+
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+
+from papervisor.web_server import PapervisorWebServer, _max_upload_size
+
+
+def test_upload_pdf_saves_to_manual_directory(
+    demo_project_data_dir: Path, tmp_path: Path
+) -> None:
+    """Test that an uploaded PDF is written whole and oversize uploads refused."""
+    data_dir = tmp_path / "data"
+    shutil.copytree(
+        demo_project_data_dir, data_dir, ignore=shutil.ignore_patterns("*.pdf")
+    )
+    manual_dir = (
+        data_dir / "literature_reviews" / "demo_contact_center_ai" / "pdfs" / "manual"
+    )
+
+    web_server = PapervisorWebServer(data_dir=str(data_dir))
+    web_server.app.config["TESTING"] = True
+    client = web_server.app.test_client()
+    content = b"%PDF-1.4\n" + bytes(range(256)) * 12_000
+
+    response = client.post(
+        "/project/demo_contact_center_ai/upload_pdf",
+        data={"paper_id": "2", "pdf_file": (io.BytesIO(content), "paper.pdf")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 302
+    (saved,) = manual_dir.glob("2_*.pdf")
+    assert saved.read_bytes() == content
+
+    web_server.app.config["MAX_CONTENT_LENGTH"] = 1 << 20
+    response = client.post(
+        "/project/demo_contact_center_ai/upload_pdf",
+        data={"paper_id": "3", "pdf_file": (io.BytesIO(content), "paper.pdf")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 302
+    assert response.location.endswith("/project/demo_contact_center_ai/downloads")
+    with client.session_transaction() as session:
+        assert session["_flashes"][-1] == (
+            "error",
+            "PDF is larger than the 1 MB upload limit.",
+        )
+    assert not list(manual_dir.glob("3_*.pdf"))
+
+
+def test_max_upload_size_falls_back_on_invalid_setting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a bad upload limit setting warns instead of failing."""
+    monkeypatch.setenv("PAPERVISOR_MAX_UPLOAD_MB", "8")
+    assert _max_upload_size() == 8 << 20
+
+    for value in ("lots", "0"):
+        monkeypatch.setenv("PAPERVISOR_MAX_UPLOAD_MB", value)
+        with pytest.warns(UserWarning, match="PAPERVISOR_MAX_UPLOAD_MB"):
+            assert _max_upload_size() == 100 << 20
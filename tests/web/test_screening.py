@@ -0,0 +1,25 @@
+"""Tests for GPT-based screening of included papers."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from papervisor.web_server import PapervisorWebServer
+
+
+def test_background_screening_saves_every_result(
+    demo_project_data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that concurrently screened papers all end up in the results file."""
+    monkeypatch.setenv("PAPERVISOR_TEST_MODE", "true")
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    server = PapervisorWebServer(data_dir=str(demo_project_data_dir))
+    papers = [{"paper_id": i, "title": f"Paper {i}", "abstract": ""} for i in range(20)]
+
+    server._screen_papers_background(papers, tmp_path)
+
+    results = json.loads((tmp_path / "screening_results.json").read_text())
+    assert sorted(results, key=int) == [str(i) for i in range(20)]
+    assert {result["result"] for result in results.values()} == {"No"}
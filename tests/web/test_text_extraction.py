@@ -0,0 +1,139 @@
+"""Tests for the text extraction page."""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from papervisor.web_server import PapervisorWebServer
+
+
+def test_text_extraction_page_shows_flashed_messages_once(web_client: Any) -> None:
+    """Test that the streamed page consumes flashed messages."""
+    url = "/text_extraction?project_id=demo_contact_center_ai"
+    with web_client.session_transaction() as session:
+        session["_flashes"] = [("success", "Text extraction started")]
+
+    response = web_client.get(url)
+    assert response.status_code == 200
+    assert b"Text extraction started" in response.data
+    assert b"No papers found" not in response.data
+
+    assert b"Text extraction started" not in web_client.get(url).data
+
+
+def test_text_extraction_page_redirects_on_load_errors(
+    demo_project_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that errors while loading the page data redirect before streaming."""
+    web_server = PapervisorWebServer(data_dir=str(demo_project_data_dir))
+    web_server.app.config["TESTING"] = True
+
+    def broken_status(project_path: Path) -> Dict[str, Any]:
+        raise OSError("status unreadable")
+
+    monkeypatch.setattr(web_server, "_load_extraction_status", broken_status)
+    client = web_server.app.test_client()
+
+    response = client.get("/text_extraction?project_id=demo_contact_center_ai")
+
+    assert response.status_code == 302
+    with client.session_transaction() as session:
+        assert session["_flashes"] == [
+            ("error", "Error loading text extraction page: status unreadable")
+        ]
+
+
+def test_extract_single_paper_rejects_unknown_ids(web_client: Any) -> None:
+    """Test that IDs that are not row numbers of the project are not found."""
+    for paper_id in ("999", "-1", "abc"):
+        response = web_client.post(
+            f"/extract_single_paper?paper_id={paper_id}"
+            "&project_id=demo_contact_center_ai"
+        )
+        assert response.status_code == 404
+
+
+def test_save_screening_actions_updates_status_file(
+    demo_project_data_dir: Path, tmp_path: Path
+) -> None:
+    """Test that screening actions are written to the extraction status."""
+    data_dir = tmp_path / "data"
+    shutil.copytree(
+        demo_project_data_dir, data_dir, ignore=shutil.ignore_patterns("*.pdf")
+    )
+    server = PapervisorWebServer(
+        project_id="demo_contact_center_ai", data_dir=str(data_dir)
+    )
+    response = server.app.test_client().post(
+        "/save_screening_actions",
+        data={
+            "screening_action_0": "include",
+            "screening_action_1": "exclude",
+            "screening_action_999": "include",
+        },
+    )
+    assert response.status_code == 302
+
+    project_path = data_dir / "literature_reviews" / "demo_contact_center_ai"
+    status = json.loads((project_path / "extraction_status.json").read_text())
+    assert status["0"]["screening_action"] == "include"
+    assert status["1"]["screening_action"] == "exclude"
+    assert status["0"]["screening_updated"] == status["1"]["screening_updated"]
+    assert "999" not in status
+    assert not (project_path / "extraction_status.json.tmp").exists()
+
+
+def test_background_extraction_records_every_paper(
+    demo_project_data_dir: Path, tmp_path: Path
+) -> None:
+    """Test that PDFs parsed in worker processes all get a saved status."""
+    data_dir = tmp_path / "data"
+    shutil.copytree(demo_project_data_dir, data_dir)
+    project_path = data_dir / "literature_reviews" / "demo_contact_center_ai"
+    (project_path / "extraction_status.json").unlink()
+    server = PapervisorWebServer(data_dir=str(data_dir))
+    papers = [
+        {
+            "paper_id": paper_id,
+            "project_id": "demo_contact_center_ai",
+            "title": f"Paper {paper_id}",
+            "downloaded_file": downloaded_file,
+            "download_source": "automatic",
+        }
+        for paper_id, downloaded_file in [
+            (0, "0_li_2018_predicting_call_center.pdf"),
+            (1, "1_ali_2011_intelligent_call_routing.pdf"),
+            (2, "missing.pdf"),
+        ]
+    ]
+
+    server._extract_texts_background(papers, project_path)
+
+    status = json.loads((project_path / "extraction_status.json").read_text())
+    assert status["0"]["json_file"] == "paper_0_extracted.json"
+    assert status["1"]["status"] in ("success", "partial")
+    assert status["2"]["error"] == "PDF file not found"
+    assert server.progress["demo_contact_center_ai"].completed == 3
+    assert (
+        project_path / "pdfs" / "extracted_texts" / "paper_1_extracted.json"
+    ).exists()
+
+
+def test_start_extraction_reports_missing_papers(
+    isolated_web_client: Any, test_data_dir: Path
+) -> None:
+    """Test that a missing project and a missing papers file are told apart."""
+    response = isolated_web_client.post("/start_text_extraction?project_id=nope")
+    assert response.status_code == 404
+    assert response.get_json()["message"] == "Project not found"
+
+    project_dir = test_data_dir / "literature_reviews" / "test_project"
+    assert not (project_dir / "pdfs" / "consolidated_papers.csv").exists()
+    response = isolated_web_client.post(
+        "/start_text_extraction?project_id=test_project"
+    )
+    assert response.status_code == 404
+    assert response.get_json()["message"] == "No consolidated papers file found"
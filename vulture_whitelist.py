@@ -162,6 +162,13 @@ def api_download_progress():
     pass  # Flask endpoint, used in templates and redirects
 
 
+def download_progress_stream():
+    pass  # Flask endpoint, used in templates and redirects
+
+
+download_progress_stream
+
+
 def cancel_download():
     pass  # Flask endpoint, used in templates and redirects
 